@@ -1,3 +1,15 @@
 from django.contrib import admin
+from django.utils import timezone
 
-# Register your models here.
\ No newline at end of file
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ('name', 'status', 'attempts', 'max_attempts', 'run_at', 'locked_by', 'created_at')
+    list_filter = ('status', 'name')
+    actions = ['requeue']
+
+    @admin.action(description='Requeue (run again now, with fresh attempts)')
+    def requeue(self, request, queryset):
+        queryset.update(status=Job.Status.PENDING, attempts=0, run_at=timezone.now(), locked_at=None, locked_by='')
@@ -1,5 +1,10 @@
 from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
 
 
 class CoreConfig(AppConfig):
     name = 'apps.core'
+
+    def ready(self):
+        # Register the @job handlers every app declares in its jobs.py
+        autodiscover_modules('jobs')
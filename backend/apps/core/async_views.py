@@ -0,0 +1,57 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+
+
+async def aiterate(iterable):
+    """
+    Async iterator over a sync one, each item fetched in the thread the sync
+    ORM code runs in (its database connection with it). For streaming
+    responses under ASGI, which would otherwise read a sync iterator whole.
+    """
+    iterator = iter(iterable)
+    done = object()
+    while (item := await sync_to_async(next)(iterator, done)) is not done:
+        yield item
+
+
+class AsyncAPIViewMixin:
+    """
+    Lets a DRF view or viewset define `async def` handlers (DRF itself only
+    dispatches synchronously). Put it first in the bases.
+
+    Authentication, permission and throttle checks may hit the cache or the
+    database, so they run through sync_to_async; sync handlers (e.g. actions
+    that need a transaction) run there too. Async handlers must only use the
+    async ORM and permissions that don't lazily load relations.
+    """
+
+    @classmethod
+    def as_view(cls, *args, **initkwargs):
+        # DRF's wrapper is a plain function that now returns a coroutine:
+        # mark it so Django awaits it (and runs it on the event loop under ASGI)
+        return markcoroutinefunction(super().as_view(*args, **initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        # Mirrors APIView.dispatch()
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await sync_to_async(handler)(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
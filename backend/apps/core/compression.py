@@ -0,0 +1,128 @@
+import zlib
+
+import brotli
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.http import parse_etags
+
+from .conditional import encoded_etag
+
+# Text-like types worth compressing; MessagePack still shrinks a lot on
+# repetitive task lists. Server-sent events are left alone: each event must
+# reach the client as soon as it is written.
+COMPRESSIBLE_TYPES = (
+    'application/json', 'application/msgpack', 'application/x-ndjson',
+    'application/javascript', 'application/xml', 'text/html', 'text/plain',
+    'text/css', 'text/csv',
+)
+
+
+def accepted_encodings(header):
+    """
+    Content codings from an Accept-Encoding header, without the ones the
+    client refused with q=0.
+    """
+    encodings = set()
+    for item in header.split(','):
+        coding, _, params = item.strip().partition(';')
+        quality = params.strip().removeprefix('q=') if params else '1'
+        try:
+            if float(quality) > 0:
+                encodings.add(coding.strip().lower())
+        except ValueError:
+            continue
+    return encodings
+
+
+class Compressor:
+    """
+    Incremental gzip or brotli compressor with the same interface for both.
+    """
+
+    def __init__(self, encoding):
+        if encoding == 'br':
+            self.compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+            self.compress, self.finish = self.compressor.process, self.compressor.finish
+        else:
+            # wbits=31: gzip header and trailer
+            self.compressor = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+            self.compress, self.finish = self.compressor.compress, self.compressor.flush
+
+    def compress_all(self, data):
+        return self.compress(data) + self.finish()
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Brotli (preferred) or gzip response compression.
+
+    Bodies under COMPRESSION_MIN_BYTES are sent as is: a few hundred bytes
+    gain nothing and cost CPU. Streaming responses (e.g. the NDJSON export)
+    are compressed incrementally, so they are never buffered in memory.
+
+    Compressed responses get their strong ETag suffixed with the coding
+    (`"<etag>-br"`), since their bytes differ from the identity response;
+    etag_matches() accepts the suffixed form in If-Match and If-None-Match.
+    A 304 repeats the form the client sent.
+    """
+
+    def process_response(self, request, response):
+        if response.status_code == 304:
+            return self.match_not_modified(request, response)
+        if response.has_header('Content-Encoding') or response.status_code == 204:
+            return response
+        content_type = response.get('Content-Type', '').partition(';')[0].strip().lower()
+        if content_type not in COMPRESSIBLE_TYPES:
+            return response
+        if not response.streaming and len(response.content) < settings.COMPRESSION_MIN_BYTES:
+            return response
+
+        patch_vary_headers(response, ['Accept-Encoding'])
+        encodings = accepted_encodings(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        encoding = 'br' if 'br' in encodings else 'gzip' if 'gzip' in encodings else None
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            response.streaming_content = self.compress_stream(response, Compressor(encoding))
+            # Unknown until the whole stream has been compressed
+            del response.headers['Content-Length']
+        else:
+            compressed = Compressor(encoding).compress_all(response.content)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers['Content-Length'] = str(len(compressed))
+
+        response.headers['Content-Encoding'] = encoding
+        if response.has_header('ETag'):
+            response['ETag'] = encoded_etag(response['ETag'], encoding)
+        return response
+
+    def match_not_modified(self, request, response):
+        etag = response.get('ETag')
+        if etag:
+            sent = parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))
+            for encoding in ('br', 'gzip'):
+                if encoded_etag(etag, encoding) in sent:
+                    response['ETag'] = encoded_etag(etag, encoding)
+                    break
+        return response
+
+    def compress_stream(self, response, compressor):
+        # The compressor buffers internally and only emits full blocks
+        content = response.streaming_content
+        if response.is_async:
+            async def compressed():
+                async for chunk in content:
+                    if data := compressor.compress(chunk):
+                        yield data
+                yield compressor.finish()
+        else:
+            def compressed():
+                for chunk in content:
+                    if data := compressor.compress(chunk):
+                        yield data
+                yield compressor.finish()
+        return compressed()
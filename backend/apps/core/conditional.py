@@ -0,0 +1,70 @@
+import hashlib
+
+from django.http import HttpResponseNotModified
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import parse_etags, quote_etag
+
+
+def make_etag(*parts, weak=False):
+    """
+    Build an ETag from cheap validators (ids, timestamps, counts, ...)
+    instead of hashing the serialized body.
+    """
+    digest = hashlib.sha256('|'.join(str(part) for part in parts).encode()).hexdigest()[:32]
+    etag = quote_etag(digest)
+    return f'W/{etag}' if weak else etag
+
+
+def encoded_etag(etag, encoding):
+    """
+    The strong ETag of a representation compressed with `encoding` ("br",
+    "gzip"): its bytes differ, so it needs its own validator. Weak ETags stay
+    as they are.
+    """
+    if etag.startswith('W/'):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def strip_encoding(etag):
+    """
+    The ETag before encoded_etag(); clients send back either form.
+    """
+    for encoding in ('br', 'gzip'):
+        if etag.endswith(f'-{encoding}"'):
+            return etag[:-len(encoding) - 2] + '"'
+    return etag
+
+
+def etag_matches(header, etag, weak=True):
+    """
+    Compare an If-None-Match (weak comparison) or If-Match (strong comparison)
+    header against the current ETag, accepting its compressed forms.
+    """
+    if not header:
+        return False
+    candidates = [strip_encoding(candidate) for candidate in parse_etags(header)]
+    if '*' in candidates:
+        return True
+    if not weak:
+        return not etag.startswith('W/') and etag in candidates
+    bare = etag.removeprefix('W/')
+    return any(candidate.removeprefix('W/') == bare for candidate in candidates)
+
+
+def not_modified(etag):
+    response = HttpResponseNotModified()
+    set_validators(response, etag)
+    return response
+
+
+def set_validators(response, etag):
+    """
+    Attach the ETag and make (private) caches revalidate on every use, so a
+    browser sends If-None-Match instead of trusting a stale copy. The ETag is
+    the same for the JSON and MessagePack renderings, hence Vary: Accept.
+    """
+    response['ETag'] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ['Authorization', 'Accept'])
+    return response
@@ -0,0 +1,112 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.deprecation import MiddlewareMixin
+from rest_framework.permissions import SAFE_METHODS
+
+# Set for the handler of a request whose reads may use the replica
+_replica_reads = ContextVar('replica_reads', default=False)
+
+
+class ReplicaRouter:
+    """
+    Sends reads to the READ_REPLICA database, but only while a view allowed
+    it (ReplicaReadsMixin: the handler of a safe request). Everything else,
+    writes and migrations included, uses `default`.
+    """
+
+    def db_for_read(self, model, **hints):
+        if settings.READ_REPLICA and _replica_reads.get():
+            return settings.READ_REPLICA
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Same rows on both sides
+        if settings.READ_REPLICA and {obj1._state.db, obj2._state.db} <= {DEFAULT_DB_ALIAS, settings.READ_REPLICA}:
+            return True
+        return None
+
+
+@contextmanager
+def primary_reads():
+    """
+    Read from the primary within the block, e.g. to fill a shared cache: a
+    lagging replica's rows would be stored under the new version.
+    """
+    token = _replica_reads.set(False)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+def pin_key(user_pk):
+    return f'replica:pinned:{user_pk}'
+
+
+def pin_to_primary(user):
+    """
+    Read the user's requests from the primary for REPLICA_STICKY_SECONDS,
+    so they see their own write even while the replica lags behind.
+    """
+    timeout = settings.REPLICA_STICKY_SECONDS
+    if timeout > 0:
+        cache.set(pin_key(user.pk), time.time() + timeout, timeout)
+
+
+def is_pinned(user):
+    return cache.get(pin_key(user.pk), 0) > time.time()
+
+
+class ReplicaReadsMixin:
+    """
+    Runs the handler of safe requests (GET/HEAD/OPTIONS) with reads on the
+    replica, for the actions in `replica_actions` (None: all of them).
+    Authentication and permission checks still read the primary, and users
+    who just wrote something stay on it (see ReplicaStickinessMiddleware).
+    Put it before the DRF view in the bases.
+
+    Streaming responses are iterated after the handler returns, so they read
+    the primary.
+    """
+    replica_actions = None
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        _replica_reads.set(self.reads_from_replica(request))
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        _replica_reads.set(False)
+        return super().finalize_response(request, response, *args, **kwargs)
+
+    def reads_from_replica(self, request):
+        if not settings.READ_REPLICA or request.method not in SAFE_METHODS:
+            return False
+        if self.replica_actions is not None and getattr(self, 'action', None) not in self.replica_actions:
+            return False
+        return not (request.user.is_authenticated and is_pinned(request.user))
+
+
+class ReplicaStickinessMiddleware(MiddlewareMixin):
+    """
+    Pins the user of every successful write request to the primary (see
+    pin_to_primary). DRF sets request.user once it authenticates the token.
+    The pin lives in the cache, so it only holds across processes with a
+    shared one (REDIS_URL); prod.py leaves READ_REPLICA unset without it.
+    """
+
+    def process_response(self, request, response):
+        user = getattr(request, 'user', None)
+        if (
+            settings.READ_REPLICA
+            and request.method not in SAFE_METHODS
+            and response.status_code < 400
+            and user is not None
+            and user.is_authenticated
+        ):
+            pin_to_primary(user)
+        return response
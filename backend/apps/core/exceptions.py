@@ -1,3 +1,5 @@
+from rest_framework import status
+from rest_framework.exceptions import APIException
 from rest_framework.views import exception_handler
 
 def custom_api_exception_handler(exc, context):
@@ -23,4 +25,22 @@ def custom_api_exception_handler(exc, context):
         # Overwrite the original response data
         response.data = custom_response_data
 
-    return response
\ No newline at end of file
+    return response
+
+
+class PreconditionFailed(APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = 'The resource was modified since you last fetched it.'
+    default_code = 'precondition_failed'
+
+
+class Gone(APIException):
+    status_code = status.HTTP_410_GONE
+    default_detail = 'The requested state is no longer available.'
+    default_code = 'gone'
+
+
+class ASGIRequired(APIException):
+    status_code = status.HTTP_501_NOT_IMPLEMENTED
+    default_detail = 'This endpoint is only served through ASGI (config/asgi.py).'
+    default_code = 'asgi_required'
@@ -0,0 +1,262 @@
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from rest_framework import serializers
+
+request_logger = logging.getLogger('apps.core.requests')
+slow_query_logger = logging.getLogger('apps.core.slow_queries')
+
+# Stats of the request being handled; visible from sync_to_async threads too
+current_request = ContextVar('current_request', default=None)
+
+
+class RequestStats:
+    def __init__(self, request):
+        self.request = request
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_time = 0.0
+        self.serialize_time = 0.0
+
+    @property
+    def view(self):
+        match = getattr(self.request, 'resolver_match', None)
+        return match.view_name if match else None
+
+    @property
+    def route(self):
+        # URL name, e.g. 'task-list' or 'user-list'
+        match = getattr(self.request, 'resolver_match', None)
+        return (match.url_name or match.view_name) if match else 'unmatched'
+
+
+@contextmanager
+def timed(attribute):
+    """
+    Add the time spent in the block to the current request's `attribute`.
+    """
+    stats = current_request.get()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if stats is not None:
+            setattr(stats, attribute, getattr(stats, attribute) + time.perf_counter() - started)
+
+
+class TimedSerializerMixin:
+    """
+    Counts the time spent building `.data` as the request's serializer time.
+    For many=True, set the Meta's list_serializer_class to TimedListSerializer.
+    """
+
+    @property
+    def data(self):
+        with timed('serialize_time'):
+            return super().data
+
+
+class TimedListSerializer(TimedSerializerMixin, serializers.ListSerializer):
+    pass
+
+
+FINGERPRINT_PATTERNS = [
+    # Quoted literals and numbers (placeholders are already %s)
+    (re.compile(r"'(?:[^']|'')*'"), '?'),
+    (re.compile(r'\b\d+(?:\.\d+)?\b'), '?'),
+    (re.compile(r'%s'), '?'),
+    # IN (?, ?, ?) of any length is the same query
+    (re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)'), '(...)'),
+    (re.compile(r'\s+'), ' '),
+]
+
+
+def fingerprint(sql):
+    """
+    Normalize SQL so every execution of the same query shape groups together.
+    Returns (fingerprint, short id).
+    """
+    for pattern, replacement in FINGERPRINT_PATTERNS:
+        sql = pattern.sub(replacement, sql)
+    sql = sql.strip()
+    return sql, hashlib.sha1(sql.encode()).hexdigest()[:12]
+
+
+def record_query(execute, sql, params, many, context):
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - started
+        stats = current_request.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.db_time += elapsed
+        if elapsed * 1000 >= settings.SLOW_QUERY_MS:
+            shape, fingerprint_id = fingerprint(sql)
+            slow_query_logger.warning(json.dumps({
+                'event': 'slow_query',
+                'ms': round(elapsed * 1000, 1),
+                'fingerprint': fingerprint_id,
+                'sql': shape,
+                'view': stats.view if stats else None,
+                'db': context['connection'].alias,
+            }))
+
+
+def install_query_timer(connection, **kwargs):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+class RouteMetrics:
+    """
+    Per-process request metrics by route name, rendered in the Prometheus
+    text format by the /metrics view. Nothing is shared between worker
+    processes, so a scrape only sees the process that answered it: scrape
+    a deployment that runs one worker process (threads are fine).
+    """
+    buckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.series = {}
+        self.statuses = {}
+
+    def observe(self, route, method, status, duration, stats, size):
+        with self.lock:
+            series = self.series.setdefault((route, method), {
+                'buckets': [0] * len(self.buckets), 'count': 0, 'sum': 0.0,
+                'queries': 0, 'db': 0.0, 'serialize': 0.0, 'bytes': 0,
+            })
+            for index, bound in enumerate(self.buckets):
+                if duration <= bound:
+                    series['buckets'][index] += 1
+            series['count'] += 1
+            series['sum'] += duration
+            series['queries'] += stats.queries
+            series['db'] += stats.db_time
+            series['serialize'] += stats.serialize_time
+            series['bytes'] += size or 0
+            key = (route, method, status)
+            self.statuses[key] = self.statuses.get(key, 0) + 1
+
+    def render(self):
+        with self.lock:
+            series = {key: {**value, 'buckets': list(value['buckets'])} for key, value in self.series.items()}
+            statuses = dict(self.statuses)
+
+        lines = [
+            '# HELP http_request_duration_seconds Request wall time by route.',
+            '# TYPE http_request_duration_seconds histogram',
+        ]
+        for (route, method), value in sorted(series.items()):
+            labels = f'route="{route}",method="{method}"'
+            for bound, count in zip(self.buckets, value['buckets']):
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {value["count"]}')
+            lines.append(f'http_request_duration_seconds_sum{{{labels}}} {value["sum"]:.6f}')
+            lines.append(f'http_request_duration_seconds_count{{{labels}}} {value["count"]}')
+
+        counters = [
+            ('http_request_db_queries_total', 'Database queries run by requests.', 'queries', '{}'),
+            ('http_request_db_seconds_total', 'Time spent in database queries.', 'db', '{:.6f}'),
+            ('http_request_serialize_seconds_total', 'Time spent in serializers.', 'serialize', '{:.6f}'),
+            ('http_response_bytes_total', 'Response body bytes (streams excluded).', 'bytes', '{}'),
+        ]
+        for name, help_text, field, number in counters:
+            lines += [f'# HELP {name} {help_text}', f'# TYPE {name} counter']
+            for (route, method), value in sorted(series.items()):
+                lines.append(f'{name}{{route="{route}",method="{method}"}} {number.format(value[field])}')
+
+        lines += ['# HELP http_requests_total Requests by route and status.', '# TYPE http_requests_total counter']
+        for (route, method, status), count in sorted(statuses.items()):
+            lines.append(f'http_requests_total{{route="{route}",method="{method}",status="{status}"}} {count}')
+        return '\n'.join(lines) + '\n'
+
+
+route_metrics = RouteMetrics()
+
+
+class RequestMetricsMiddleware:
+    """
+    Measures every request: wall time, number and total time of database
+    queries, serializer time and response size. Reported three ways:
+    a Server-Timing header (visible in the browser's network panel), one
+    JSON log line on `apps.core.requests`, and the /metrics histograms.
+
+    Queries slower than SLOW_QUERY_MS are logged on `apps.core.slow_queries`
+    with their fingerprint and view. Works for sync and async views; queries
+    run by a streaming response after it is returned are not counted.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+        # Every connection, in every thread, reports to the current request
+        connection_created.connect(install_query_timer)
+        for connection in connections.all(initialized_only=True):
+            install_query_timer(connection)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        stats = RequestStats(request)
+        token = current_request.set(stats)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_request.reset(token)
+        return self.finish(request, response, stats)
+
+    async def __acall__(self, request):
+        stats = RequestStats(request)
+        token = current_request.set(stats)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_request.reset(token)
+        return self.finish(request, response, stats)
+
+    def finish(self, request, response, stats):
+        duration = time.perf_counter() - stats.started
+        size = None if response.streaming else len(response.content)
+
+        response['Server-Timing'] = ', '.join([
+            f'total;dur={duration * 1000:.1f}',
+            f'db;dur={stats.db_time * 1000:.1f};desc="{stats.queries} queries"',
+            f'serialize;dur={stats.serialize_time * 1000:.1f}',
+        ])
+
+        route = stats.route
+        if route != 'metrics':
+            route_metrics.observe(route, request.method, response.status_code, duration, stats, size)
+        request_logger.info(json.dumps({
+            'event': 'request',
+            'method': request.method,
+            'path': request.path,
+            'route': route,
+            'view': stats.view,
+            'status': response.status_code,
+            'ms': round(duration * 1000, 1),
+            'queries': stats.queries,
+            'db_ms': round(stats.db_time * 1000, 1),
+            'serialize_ms': round(stats.serialize_time * 1000, 1),
+            'bytes': size,
+        }))
+        return response
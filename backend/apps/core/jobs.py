@@ -0,0 +1,206 @@
+import logging
+import os
+import random
+import socket
+import threading
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+# name -> (handler, max_attempts), filled by @job in each app's jobs.py
+# (see CoreConfig.ready)
+registry = {}
+
+
+def job(name, max_attempts=None):
+    """
+    Register a function as a job handler. It is called with the payload as
+    keyword arguments and may raise to be retried later.
+    """
+    def register(func):
+        registry[name] = (func, max_attempts)
+        return func
+    return register
+
+
+def enqueue(name, **payload):
+    """
+    Queue a job once the surrounding transaction commits (immediately in
+    autocommit), so workers never see jobs of rolled back writes and the
+    request doesn't wait for the work itself.
+    """
+    enqueue_many(name, [payload])
+
+
+def enqueue_many(name, payloads, delay=0):
+    payloads = list(payloads)
+    if not payloads:
+        return
+    if name not in registry:
+        raise KeyError(f'No job registered as {name!r}')
+    max_attempts = registry[name][1] or settings.JOB_MAX_ATTEMPTS
+
+    def insert():
+        run_at = timezone.now() + timedelta(seconds=delay)
+        Job.objects.bulk_create(
+            [Job(name=name, payload=payload, run_at=run_at, max_attempts=max_attempts) for payload in payloads],
+            batch_size=1000,
+        )
+
+    transaction.on_commit(insert)
+
+
+def retry_delay(attempts):
+    """
+    Exponential backoff with jitter: ~base, 2*base, 4*base, ... capped.
+    """
+    delay = min(settings.JOB_RETRY_DELAY * 2 ** (attempts - 1), settings.JOB_RETRY_MAX_DELAY)
+    return delay * random.uniform(0.8, 1.2)
+
+
+def claimable(now):
+    stale = now - timedelta(seconds=settings.JOB_LOCK_TIMEOUT)
+    return Job.objects.filter(
+        Q(status=Job.Status.PENDING, run_at__lte=now) | Q(status=Job.Status.RUNNING, locked_at__lt=stale)
+    )
+
+
+def claim(worker_id, limit=1):
+    """
+    Lock up to `limit` due jobs for this worker and return them.
+
+    On PostgreSQL, SELECT ... FOR UPDATE SKIP LOCKED: concurrent workers
+    each take different rows without waiting on each other. Elsewhere each
+    row is taken with a conditional UPDATE, so two workers can't both win it.
+    """
+    now = timezone.now()
+    take = {
+        'status': Job.Status.RUNNING, 'locked_at': now, 'locked_by': worker_id,
+        'attempts': F('attempts') + 1,
+    }
+    with transaction.atomic():
+        due = claimable(now).order_by('run_at')
+        if connection.features.has_select_for_update_skip_locked:
+            ids = list(due.select_for_update(skip_locked=True).values_list('pk', flat=True)[:limit])
+            Job.objects.filter(pk__in=ids).update(**take)
+        else:
+            ids = [
+                pk for pk, attempts in due.values_list('pk', 'attempts')[:limit]
+                if claimable(now).filter(pk=pk, attempts=attempts).update(**take)
+            ]
+    return list(Job.objects.filter(pk__in=ids)) if ids else []
+
+
+def run(claimed):
+    """
+    Run one claimed job: delete it on success, schedule a retry on failure,
+    or mark it DEAD once it has used up its attempts.
+
+    Every write is conditional on still holding the claim (`locked_by` and
+    `attempts`, which each claim increments): a job held past JOB_LOCK_TIMEOUT
+    may have been claimed again by another worker, and that run owns it now.
+    Returns None, without running the handler, if the claim is already lost.
+    """
+    held = Job.objects.filter(pk=claimed.pk, locked_by=claimed.locked_by, attempts=claimed.attempts)
+    # Renew the lock: later jobs of a batch may have waited a while
+    if not held.update(locked_at=timezone.now()):
+        logger.warning('Job %s %s was claimed again by another worker, skipping', claimed.name, claimed.pk)
+        return None
+    try:
+        if claimed.name not in registry:
+            raise LookupError(f'No job registered as {claimed.name!r}')
+        handler, _ = registry[claimed.name]
+        handler(**claimed.payload)
+    except Exception:
+        error = traceback.format_exc()
+        if claimed.attempts >= claimed.max_attempts:
+            logger.error('Job %s %s is dead after %s attempts:\n%s', claimed.name, claimed.pk, claimed.attempts, error)
+            changes = {'status': Job.Status.DEAD}
+        else:
+            logger.warning('Job %s %s failed (attempt %s), retrying', claimed.name, claimed.pk, claimed.attempts)
+            changes = {
+                'status': Job.Status.PENDING,
+                'run_at': timezone.now() + timedelta(seconds=retry_delay(claimed.attempts)),
+            }
+        held.update(**changes, locked_at=None, locked_by='', last_error=error)
+        return False
+    held.delete()
+    return True
+
+
+class Worker:
+    """
+    Claims and runs jobs on `threads` threads until stopped, polling every
+    `poll` seconds while the queue is empty. With `burst`, returns as soon
+    as nothing is due, or after `max_claim_errors` failed claims in a row
+    (`gave_up`). Used by `manage.py runworker`.
+    """
+    max_claim_errors = 3
+
+    def __init__(self, threads=1, batch_size=1, poll=1.0, burst=False):
+        self.threads = threads
+        self.batch_size = batch_size
+        self.poll = poll
+        self.burst = burst
+        self.stopping = threading.Event()
+        self.name = f'{socket.gethostname()}:{os.getpid()}'
+        self.lock = threading.Lock()
+        self.succeeded = self.failed = 0
+        self.gave_up = False
+
+    def start(self):
+        workers = [
+            threading.Thread(target=self.loop, args=(f'{self.name}:{index}',), name=f'jobs-{index}')
+            for index in range(self.threads)
+        ]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+
+    def stop(self, *args):
+        self.stopping.set()
+
+    def loop(self, worker_id):
+        errors = 0
+        try:
+            while not self.stopping.is_set():
+                close_old_connections()
+                try:
+                    claimed = claim(worker_id, self.batch_size)
+                except DatabaseError:
+                    # Database restarting, lock timeout, ...: retry after a poll
+                    logger.exception('Worker %s could not claim jobs', worker_id)
+                    errors += 1
+                    if self.burst and errors >= self.max_claim_errors:
+                        logger.error('Worker %s gave up after %s failed claims', worker_id, errors)
+                        self.gave_up = True
+                        return
+                    connection.close()
+                    self.stopping.wait(self.poll)
+                    continue
+                errors = 0
+                if not claimed:
+                    if self.burst:
+                        return
+                    self.stopping.wait(self.poll)
+                    continue
+                for item in claimed:
+                    succeeded = run(item)
+                    if succeeded is None:
+                        continue
+                    with self.lock:
+                        if succeeded:
+                            self.succeeded += 1
+                        else:
+                            self.failed += 1
+        finally:
+            connection.close()
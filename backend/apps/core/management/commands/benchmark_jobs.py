@@ -0,0 +1,43 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.core.jobs import Worker, enqueue_many, job, registry
+from apps.core.models import Job
+
+
+class Command(BaseCommand):
+    help = (
+        "Queue --jobs jobs and drain them with a burst Worker at each --threads "
+        "count: a no-op job (queue overhead) and one sleeping --latency ms like an "
+        "SMTP or HTTP call. Reports jobs/s. Benchmark jobs are deleted afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--jobs', type=int, default=500)
+        parser.add_argument('--threads', type=int, nargs='+', default=[1, 4, 16])
+        parser.add_argument('--batch-size', type=int, default=10)
+        parser.add_argument('--latency', type=float, default=20, help='Milliseconds slept by the I/O job.')
+
+    def handle(self, *args, **options):
+        latency = options['latency'] / 1000
+        job('benchmark.noop')(lambda index: None)
+        job('benchmark.io')(lambda index: time.sleep(latency))
+
+        try:
+            self.stdout.write(f"{'job':<8} {'threads':>7} {'jobs/s':>10} {'failed':>7}")
+            for name in ('benchmark.noop', 'benchmark.io'):
+                for threads in options['threads']:
+                    # Autocommit: inserted right away, visible to the worker threads
+                    enqueue_many(name, ({'index': index} for index in range(options['jobs'])))
+                    worker = Worker(threads=threads, batch_size=options['batch_size'], burst=True)
+                    started = time.perf_counter()
+                    worker.start()
+                    elapsed = time.perf_counter() - started
+                    self.stdout.write(
+                        f'{name.split(".")[1]:<8} {threads:>7} {worker.succeeded / elapsed:>10.0f} {worker.failed:>7}'
+                    )
+        finally:
+            Job.objects.filter(name__startswith='benchmark.').delete()
+            registry.pop('benchmark.noop')
+            registry.pop('benchmark.io')
@@ -0,0 +1,71 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, connection, transaction
+
+from apps.core.ids import uuid7
+
+
+class Command(BaseCommand):
+    help = (
+        "Insert --rows rows keyed by uuid4 and by uuid7 into scratch tables (a "
+        "UUID primary key plus a payload column, like the app's tables) and "
+        "report insert throughput and primary key index size. The tables are "
+        "dropped afterwards. Use millions of rows so the index outgrows the "
+        "buffer cache, which is where random keys hurt."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1_000_000)
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rows per INSERT (one transaction each).')
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{'key':<6} {'rows/s':>10} {'index MB':>10}")
+        for label, generate in (('uuid4', uuid.uuid4), ('uuid7', uuid7)):
+            table = f'benchmark_{label}_keys'
+            self.create(table)
+            try:
+                elapsed = self.insert(table, generate, options['rows'], options['batch_size'])
+                size = self.index_size(table)
+                self.stdout.write(
+                    f"{label:<6} {options['rows'] / elapsed:>10.0f} "
+                    f"{'n/a' if size is None else f'{size / 2 ** 20:.1f}':>10}"
+                )
+            finally:
+                with connection.cursor() as cursor:
+                    cursor.execute(f'DROP TABLE {table}')
+
+    def create(self, table):
+        # Same column types Django uses for UUIDField on each backend
+        key_type = 'uuid' if connection.vendor == 'postgresql' else 'char(32)'
+        with connection.cursor() as cursor:
+            cursor.execute(f'CREATE TABLE {table} (id {key_type} PRIMARY KEY, title varchar(200) NOT NULL)')
+
+    def insert(self, table, generate, rows, batch_size):
+        convert = str if connection.vendor == 'postgresql' else (lambda value: value.hex)
+        elapsed = 0.0
+        for start in range(0, rows, batch_size):
+            size = min(batch_size, rows - start)
+            values = [(convert(generate()), f'Task {start + i}') for i in range(size)]
+            started = time.perf_counter()
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.executemany(f'INSERT INTO {table} (id, title) VALUES (%s, %s)', values)
+            elapsed += time.perf_counter() - started
+        return elapsed
+
+    def index_size(self, table):
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute('SELECT pg_relation_size(%s)', [f'{table}_pkey'])
+                return cursor.fetchone()[0]
+            if connection.vendor == 'sqlite':
+                try:
+                    # Needs SQLite built with the dbstat virtual table
+                    cursor.execute(
+                        'SELECT SUM(pgsize) FROM dbstat WHERE name = %s', [f'sqlite_autoindex_{table}_1']
+                    )
+                except DatabaseError:
+                    return None
+                return cursor.fetchone()[0]
+        return None
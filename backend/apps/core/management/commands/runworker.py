@@ -0,0 +1,63 @@
+import multiprocessing
+import signal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from apps.core.jobs import Worker
+
+
+def run_worker(options):
+    worker = Worker(
+        threads=options['threads'], batch_size=options['batch_size'],
+        poll=options['poll'], burst=options['burst'],
+    )
+    # Finish the jobs in hand, then exit
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+    worker.start()
+    return worker
+
+
+class Command(BaseCommand):
+    help = (
+        "Run background jobs (apps.core.jobs) from the jobs table: --processes "
+        "processes of --threads threads each. Threads suit I/O-bound jobs (email, "
+        "HTTP); add processes for CPU-bound ones. SIGTERM/SIGINT stop after the "
+        "running jobs finish."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, default=1)
+        parser.add_argument('--threads', type=int, default=4, help='Threads per process.')
+        parser.add_argument('--batch-size', type=int, default=1, help='Jobs claimed per round-trip.')
+        parser.add_argument('--poll', type=float, default=1.0, help='Seconds between polls of an empty queue.')
+        parser.add_argument('--burst', action='store_true', help='Exit once no job is due.')
+
+    def handle(self, *args, **options):
+        if options['processes'] <= 1:
+            worker = run_worker(options)
+            self.stdout.write(f'{worker.succeeded} job(s) succeeded, {worker.failed} failed.')
+            if worker.gave_up:
+                raise CommandError('Could not claim jobs, see the log.')
+            return
+
+        # Children must not share the parent's database connections
+        connections.close_all()
+        context = multiprocessing.get_context('fork')
+        children = [
+            context.Process(target=run_worker, args=(options,), name=f'runworker-{index}')
+            for index in range(options['processes'])
+        ]
+        for child in children:
+            child.start()
+
+        def forward(signum, frame):
+            for child in children:
+                if child.is_alive():
+                    child.terminate()
+
+        signal.signal(signal.SIGTERM, forward)
+        signal.signal(signal.SIGINT, forward)
+        for child in children:
+            child.join()
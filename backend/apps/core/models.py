@@ -1,18 +1,19 @@
-import uuid
 from django.db import models
 
+from .ids import uuid7
+
 
 class BaseModel(models.Model):
     """
     Abstract base model providing:
-    - UUID primary key
+    - UUID primary key (time-ordered v7; rows created earlier keep their v4 ids)
     - created_at timestamp
     - updated_at timestamp
     """
 
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False
     )
     created_at = models.DateTimeField(auto_now_add=True)
@@ -20,3 +21,47 @@ class BaseModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+class Job(BaseModel):
+    """
+    A unit of background work (see apps/core/jobs.py), run by
+    `manage.py runworker`. Succeeded jobs are deleted; jobs that failed
+    `max_attempts` times stay behind as DEAD for inspection and requeueing.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "PENDING", "Pending"
+        RUNNING = "RUNNING", "Running"
+        DEAD = "DEAD", "Dead"
+
+    name = models.CharField(max_length=200)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    # Not before this time (retries are pushed back with exponential backoff)
+    run_at = models.DateTimeField()
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField()
+    # Set while RUNNING; a job locked for longer than JOB_LOCK_TIMEOUT belongs
+    # to a worker that died and is claimed again
+    locked_at = models.DateTimeField(blank=True, null=True)
+    locked_by = models.CharField(max_length=100, blank=True)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        indexes = [
+            # The claim query: due pending jobs, oldest first
+            models.Index(
+                fields=['run_at'],
+                condition=models.Q(status='PENDING'),
+                name='job_pending_run_at_idx',
+            ),
+            models.Index(
+                fields=['locked_at'],
+                condition=models.Q(status='RUNNING'),
+                name='job_running_locked_at_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.status}, attempt {self.attempts}/{self.max_attempts})"
@@ -1,3 +1,434 @@
-from django.test import TestCase
+import datetime
+import gzip
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock, skipUnless
 
-# Create your tests here.
+import brotli
+import msgpack
+from django.conf import settings
+from django.core import mail
+from django.core.cache import cache
+from django.db import DatabaseError, connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from apps.users.models import User
+from apps.tasks.models import Task
+from config.settings.base import database_pool
+from .db import is_pinned
+from .ids import uuid7, uuid7_time
+from .instrumentation import fingerprint
+from .jobs import Worker, claim, enqueue, job, registry, run
+from .models import Job
+from .renderers import ORJSONRenderer
+
+
+class DatabasePoolSettingsTests(TestCase):
+
+    def test_pool_params_are_split_from_libpq_options(self):
+        options = {'sslmode': 'require', 'pool_max_size': '20', 'pool_timeout': '2.5'}
+
+        pool = database_pool(options)
+
+        self.assertEqual(options, {'sslmode': 'require'})
+        self.assertEqual(pool, {'min_size': 2, 'max_size': 20, 'timeout': 2.5})
+
+    def test_pool_can_be_disabled(self):
+        options = {'pool': 'off', 'pool_max_size': '20'}
+        self.assertIs(database_pool(options), False)
+        self.assertEqual(options, {})
+
+
+class UUID7Tests(TestCase):
+
+    def test_ids_are_version_7_and_strictly_increasing(self):
+        ids = [uuid7() for _ in range(10000)]
+        self.assertTrue(all(value.version == 7 and value.variant == uuid.RFC_4122 for value in ids))
+        self.assertEqual(sorted(set(ids)), ids)
+
+    @mock.patch.multiple('apps.core.ids', _last_ms=0, _counter=0)
+    def test_increasing_when_the_clock_steps_back(self):
+        with mock.patch('apps.core.ids.time.time_ns', return_value=2_000_000_000_000_000_000):
+            later = uuid7()
+        with mock.patch('apps.core.ids.time.time_ns', return_value=1_000_000_000_000_000_000):
+            self.assertGreater(uuid7(), later)
+
+    def test_time_is_embedded(self):
+        before = timezone.now()
+        self.assertAlmostEqual(uuid7_time(uuid7()), before, delta=timedelta(seconds=1))
+        self.assertIsNone(uuid7_time(uuid.uuid4()))
+
+
+class DatabasePoolStatsTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email='admin@example.com', password='password123', role=User.Role.ADMIN
+        )
+        cls.user = User.objects.create_user(email='user@example.com', password='password123')
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_admins_only(self):
+        self.client.force_authenticate(self.user)
+        self.assertEqual(self.client.get('/api/v1/internal/db-pool/').status_code, 403)
+
+    def test_unpooled_connection(self):
+        self.client.force_authenticate(self.admin)
+        response = self.client.get('/api/v1/internal/db-pool/')
+        self.assertEqual(response.data['databases']['default']['pooled'], False)
+
+    def test_pool_counters(self):
+        pool = mock.Mock(min_size=2, max_size=10)
+        pool.get_stats.return_value = {
+            'pool_size': 4, 'pool_available': 1, 'requests_num': 120,
+            'requests_queued': 7, 'requests_wait_ms': 340, 'requests_errors': 1,
+        }
+        self.client.force_authenticate(self.admin)
+
+        with mock.patch.object(connection, 'pool', pool, create=True):
+            stats = self.client.get('/api/v1/internal/db-pool/').data['databases']['default']
+
+        self.assertEqual(
+            {key: stats[key] for key in ('pooled', 'size', 'checkouts', 'waits', 'timeouts')},
+            {'pooled': True, 'size': 4, 'checkouts': 120, 'waits': 7, 'timeouts': 1},
+        )
+
+
+@skipUnless('replica' in settings.DATABASES, 'Needs a second database as the replica (DATABASE_REPLICA_NAME).')
+@override_settings(READ_REPLICA='replica', REPLICA_STICKY_SECONDS=5)
+class ReplicaRoutingTests(TestCase):
+    """
+    The replica is a separate database nothing replicates into, so which
+    one a response came from shows in its content.
+    """
+    # The runner collects these even from skipped classes
+    databases = {'default', 'replica'} if 'replica' in settings.DATABASES else {'default'}
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_user(email='admin@example.com', password='password123', role=User.Role.ADMIN)
+        self.alice = User.objects.create_user(email='alice@example.com', password='password123')
+        User.objects.using('replica').bulk_create([
+            User(pk=self.admin.pk, email=self.admin.email, role=User.Role.ADMIN),
+            User(pk=self.alice.pk, email=self.alice.email),
+            User(email='replica-only@example.com'),
+        ])
+        self.primary_task = Task.objects.create(
+            title='On the primary', description='d', assigned_to=self.alice, assigned_by=self.admin,
+        )
+        self.replica_task = Task(title='On the replica', description='d', assigned_to=self.alice, assigned_by=self.admin)
+        Task.objects.using('replica').bulk_create([self.replica_task])
+        self.client = APIClient()
+        self.client.force_authenticate(self.alice)
+
+    def titles(self, client=None):
+        response = (client or self.client).get('/api/v1/tasks/')
+        self.assertEqual(response.status_code, 200)
+        return [task['title'] for task in response.data['results']]
+
+    def test_list_retrieve_and_user_list_read_the_replica(self):
+        self.assertEqual(self.titles(), ['On the replica'])
+        self.assertEqual(self.client.get(f'/api/v1/tasks/{self.replica_task.pk}/').status_code, 200)
+        self.assertEqual(self.client.get(f'/api/v1/tasks/{self.primary_task.pk}/').status_code, 404)
+
+        emails = [user['email'] for user in self.client.get('/api/v1/users/', {'search': 'replica'}).data]
+        self.assertEqual(emails, ['replica-only@example.com'])
+        # The cached directory is always built from the primary
+        emails = [user['email'] for user in self.client.get('/api/v1/users/').data]
+        self.assertNotIn('replica-only@example.com', emails)
+
+    def test_cached_lists_are_not_stuck_on_a_lagging_replica(self):
+        self.assertEqual(self.titles(), ['On the replica'])
+        # Replication catches up without any write through this process
+        Task.objects.using('replica').bulk_create([Task(
+            pk=self.primary_task.pk, title=self.primary_task.title, description='d',
+            assigned_to=self.alice, assigned_by=self.admin,
+        )])
+        self.assertEqual(sorted(self.titles()), ['On the primary', 'On the replica'])
+
+    def test_own_writes_pin_the_user_to_the_primary_for_a_while(self):
+        response = self.client.patch(f'/api/v1/tasks/{self.primary_task.pk}/', {'status': 'ACCEPTED'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(is_pinned(self.alice))
+        self.assertEqual(self.titles(), ['On the primary'])
+
+        # Others still read the replica
+        admin_client = APIClient()
+        admin_client.force_authenticate(self.admin)
+        self.assertEqual(self.titles(admin_client), ['On the replica'])
+
+        later = timezone.now().timestamp() + 6
+        with mock.patch('apps.core.db.time.time', return_value=later):
+            self.assertEqual(self.titles(), ['On the replica'])
+
+    def test_failed_writes_do_not_pin(self):
+        self.client.patch(f'/api/v1/tasks/{self.primary_task.pk}/', {'status': 'NOPE'}, format='json')
+        self.assertFalse(is_pinned(self.alice))
+
+    @override_settings(READ_REPLICA=None)
+    def test_everything_reads_the_primary_without_a_replica(self):
+        self.assertEqual(self.titles(), ['On the primary'])
+
+
+class RequestMetricsMiddlewareTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email='admin@example.com', password='password123', role=User.Role.ADMIN
+        )
+        Task.objects.create(title='T', description='d', assigned_to=cls.admin, assigned_by=cls.admin)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_server_timing_header(self):
+        response = self.client.get('/api/v1/tasks/')
+
+        timing = response['Server-Timing']
+        self.assertIn('total;dur=', timing)
+        self.assertRegex(timing, r'db;dur=[\d.]+;desc="[1-9]\d* queries"')
+        self.assertIn('serialize;dur=', timing)
+
+    def test_metrics_histogram_per_route(self):
+        self.client.get('/api/v1/users/')
+
+        body = self.client.get('/metrics').content.decode()
+
+        self.assertIn('http_request_duration_seconds_bucket{route="user-list",method="GET",le="+Inf"}', body)
+        self.assertIn('http_requests_total{route="user-list",method="GET",status="200"}', body)
+
+    @override_settings(METRICS_TOKEN='secret')
+    def test_metrics_token(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 401)
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer wrong')
+        self.assertEqual(response.status_code, 401)
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer secret')
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(METRICS_TOKEN=None, METRICS_REQUIRE_TOKEN=True)
+    def test_metrics_are_off_without_a_required_token(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 404)
+
+    @override_settings(SLOW_QUERY_MS=0)
+    def test_slow_queries_are_logged_with_view(self):
+        with self.assertLogs('apps.core.slow_queries', 'WARNING') as logs:
+            self.client.get('/api/v1/tasks/')
+
+        self.assertIn('"view": "tasks:task-list"', logs.output[0])
+
+    def test_fingerprint_groups_query_shapes(self):
+        one, one_id = fingerprint('SELECT * FROM t WHERE id IN (%s, %s) AND n = 3')
+        other, other_id = fingerprint("SELECT *  FROM t WHERE id IN (%s) AND n = 42")
+
+        self.assertEqual(one, 'SELECT * FROM t WHERE id IN (...) AND n = ?')
+        self.assertEqual((one, one_id), (other, other_id))
+
+
+
+class RenderingAndCompressionTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email='admin@example.com', password='password123', role=User.Role.ADMIN
+        )
+        Task.objects.bulk_create([
+            Task(title=f'Task {i}', description='Long description ' * 20,
+                 assigned_to=cls.admin, assigned_by=cls.admin)
+            for i in range(30)
+        ])
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_orjson_renders_like_drf(self):
+        data = {
+            'id': uuid.uuid4(), 'when': timezone.now(), 'day': datetime.date(2026, 1, 2),
+            'amount': Decimal('1.50'), 'items': [{'name': 'caf\u00e9 \u2028'}],
+        }
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_messagepack_content_negotiation(self):
+        as_json = self.client.get('/api/v1/tasks/').json()
+        response = self.client.get('/api/v1/tasks/', HTTP_ACCEPT='application/msgpack')
+
+        self.assertEqual(response['Content-Type'], 'application/msgpack')
+        self.assertEqual(msgpack.unpackb(response.content), as_json)
+        self.assertIn('Accept', response['Vary'])
+
+        body = msgpack.packb({'title': 'Packed', 'description': 'd', 'assigned_to': str(self.admin.pk)})
+        created = self.client.post('/api/v1/tasks/', body, content_type='application/msgpack')
+        self.assertEqual(created.status_code, 201)
+        self.assertTrue(Task.objects.filter(title='Packed').exists())
+
+    def test_compression(self):
+        plain = self.client.get('/api/v1/tasks/')
+
+        for encoding, decompress in [('br', brotli.decompress), ('gzip', gzip.decompress)]:
+            response = self.client.get('/api/v1/tasks/', HTTP_ACCEPT_ENCODING=f'{encoding}, deflate')
+            self.assertEqual(response['Content-Encoding'], encoding)
+            # The list's ETag is weak: same data, whatever the coding
+            self.assertEqual(response['ETag'], plain['ETag'])
+            self.assertEqual(decompress(response.content), plain.content)
+
+        refused = self.client.get('/api/v1/tasks/', HTTP_ACCEPT_ENCODING='br;q=0, gzip')
+        self.assertEqual(refused['Content-Encoding'], 'gzip')
+
+    def test_compressed_etags_validate_requests(self):
+        task = Task.objects.first()
+        url = f'/api/v1/tasks/{task.pk}/'
+        with override_settings(COMPRESSION_MIN_BYTES=0):
+            etag = self.client.get(url, HTTP_ACCEPT_ENCODING='br')['ETag']
+            self.assertTrue(etag.endswith('-br"'))
+
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag, HTTP_ACCEPT_ENCODING='br')
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response['ETag'], etag)
+
+            response = self.client.patch(url, {'priority': 'HIGH'}, HTTP_IF_MATCH=etag, HTTP_ACCEPT_ENCODING='br')
+            self.assertEqual(response.status_code, 200)
+
+            response = self.client.patch(url, {'priority': 'LOW'}, HTTP_IF_MATCH=etag)
+            self.assertEqual(response.status_code, 412)
+
+    def test_small_responses_are_not_compressed(self):
+        with override_settings(COMPRESSION_MIN_BYTES=100_000):
+            response = self.client.get('/api/v1/tasks/', HTTP_ACCEPT_ENCODING='br')
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_streams_are_compressed_incrementally(self):
+        response = self.client.get('/api/v1/tasks/', {'stream': '1'}, HTTP_ACCEPT_ENCODING='gzip')
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        lines = gzip.decompress(b''.join(response.streaming_content)).splitlines()
+        self.assertEqual(len(lines), 30)
+
+
+@override_settings(JOB_MAX_ATTEMPTS=2, JOB_RETRY_DELAY=0)
+class JobQueueTests(TestCase):
+
+    def setUp(self):
+        self.calls = []
+        self.failures = 0
+        job('test.record')(self.record)
+        self.addCleanup(registry.pop, 'test.record')
+
+    def record(self, value):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError('boom')
+        self.calls.append(value)
+
+    def enqueue(self, **payload):
+        with self.captureOnCommitCallbacks(execute=True):
+            enqueue('test.record', **payload)
+
+    def run_due_jobs(self):
+        # What Worker.loop does, without the connection handling that would
+        # close the test transaction's connection
+        while claimed := claim('test', 10):
+            for item in claimed:
+                run(item)
+
+    def test_jobs_are_queued_on_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            enqueue('test.record', value=1)
+            self.assertFalse(Job.objects.exists())
+        callbacks[0]()
+        self.assertEqual(Job.objects.get().payload, {'value': 1})
+
+    def test_worker_runs_and_deletes_jobs(self):
+        self.enqueue(value=1)
+        self.enqueue(value=2)
+
+        self.run_due_jobs()
+
+        self.assertEqual(sorted(self.calls), [1, 2])
+        self.assertFalse(Job.objects.exists())
+
+    @mock.patch('apps.core.jobs.connection')
+    @mock.patch('apps.core.jobs.close_old_connections')
+    @mock.patch('apps.core.jobs.claim', side_effect=DatabaseError('gone'))
+    def test_burst_worker_gives_up_after_repeated_claim_errors(self, claim_jobs, *mocks):
+        worker = Worker(burst=True, poll=0)
+        with self.assertLogs('apps.core.jobs', 'ERROR'):
+            worker.loop('test')
+
+        self.assertTrue(worker.gave_up)
+        self.assertEqual(claim_jobs.call_count, Worker.max_claim_errors)
+
+    def test_retries_with_backoff_then_dead_letters(self):
+        self.enqueue(value=1)
+        self.failures = 5
+
+        with self.settings(JOB_RETRY_DELAY=60):
+            self.assertFalse(run(claim('test')[0]))
+        retried = Job.objects.get()
+        self.assertEqual((retried.status, retried.attempts), (Job.Status.PENDING, 1))
+        self.assertGreater(retried.run_at, timezone.now())
+        # Not due yet
+        self.assertEqual(claim('test'), [])
+
+        Job.objects.update(run_at=timezone.now())
+        self.assertFalse(run(claim('test')[0]))
+        dead = Job.objects.get()
+        self.assertEqual((dead.status, dead.attempts), (Job.Status.DEAD, 2))
+        self.assertIn('RuntimeError: boom', dead.last_error)
+        self.assertEqual(claim('test'), [])
+
+    def test_a_job_is_claimed_once(self):
+        self.enqueue(value=1)
+        self.assertEqual(len(claim('first')), 1)
+        self.assertEqual(claim('second'), [])
+
+        # Unless its worker vanished while holding it
+        Job.objects.update(locked_at=timezone.now() - timedelta(hours=1))
+        self.assertEqual(claim('second')[0].locked_by, 'second')
+
+    def test_a_reclaimed_job_is_left_to_its_new_worker(self):
+        self.enqueue(value=1)
+        [first] = claim('first')
+        Job.objects.update(locked_at=timezone.now() - timedelta(hours=1))
+        [second] = claim('second')
+
+        self.assertIsNone(run(first))
+        self.assertEqual(self.calls, [])
+        self.assertEqual(Job.objects.get().locked_by, 'second')
+
+        self.assertTrue(run(second))
+        self.assertEqual(self.calls, [1])
+        self.assertFalse(Job.objects.exists())
+
+    def test_task_writes_enqueue_notifications(self):
+        admin = User.objects.create_user(email='admin@example.com', password='password123', role=User.Role.ADMIN)
+        alice = User.objects.create_user(email='alice@example.com', password='password123')
+        client = APIClient()
+        client.force_authenticate(admin)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = client.post('/api/v1/tasks/', {
+                'title': 'Write docs', 'description': 'd', 'assigned_to': str(alice.pk),
+            })
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(mail.outbox), 0)
+        with self.captureOnCommitCallbacks(execute=True):
+            client.patch(f"/api/v1/tasks/{response.data['id']}/", {'status': 'COMPLETED'})
+        self.assertEqual(
+            sorted(Job.objects.values_list('name', flat=True)), ['tasks.notify_assigned', 'tasks.notify_completed']
+        )
+
+        self.run_due_jobs()
+        self.assertEqual(
+            sorted((message.subject, message.to[0]) for message in mail.outbox),
+            [('New task: Write docs', 'alice@example.com'), ('Task completed: Write docs', 'admin@example.com')],
+        )
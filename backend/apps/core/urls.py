@@ -0,0 +1,8 @@
+from django.urls import path
+from .views import DatabasePoolStatsView
+
+app_name = 'core'
+
+urlpatterns = [
+    path('db-pool/', DatabasePoolStatsView.as_view(), name='db-pool-stats'),
+]
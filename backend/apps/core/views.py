@@ -1,3 +1,72 @@
-from django.shortcuts import render
+import hmac
+import os
 
-# Create your views here.
+from django.conf import settings
+from django.db import connections
+from django.http import Http404, HttpResponse
+from django.views.decorators.http import require_GET
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.users.permissions import IsAdminUser
+from .instrumentation import route_metrics
+
+
+class DatabasePoolStatsView(APIView):
+    """
+    Connection pool statistics for sizing workers against the pool, admins
+    only. Pools live per process, so this is the answering worker's view
+    (its `pid` is included).
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response({
+            'pid': os.getpid(),
+            'databases': {alias: self.get_stats(connections[alias]) for alias in connections},
+        })
+
+    def get_stats(self, connection):
+        pool = getattr(connection, 'pool', None)
+        if pool is None:
+            return {'pooled': False, 'conn_max_age': connection.settings_dict['CONN_MAX_AGE']}
+
+        # psycopg_pool's counters since the pool was opened
+        stats = pool.get_stats()
+        return {
+            'pooled': True,
+            'size': stats.get('pool_size', 0),
+            'available': stats.get('pool_available', 0),
+            'min_size': stats.get('pool_min', pool.min_size),
+            'max_size': stats.get('pool_max', pool.max_size),
+            'checkouts': stats.get('requests_num', 0),
+            'waits': stats.get('requests_queued', 0),
+            'waiting_now': stats.get('requests_waiting', 0),
+            'wait_ms': stats.get('requests_wait_ms', 0),
+            'timeouts': stats.get('requests_errors', 0),
+            'connections_opened': stats.get('connections_num', 0),
+            'connections_lost': stats.get('connections_lost', 0),
+        }
+
+
+@require_GET
+def metrics(request):
+    """
+    Request metrics of this process in the Prometheus text format, behind
+    `Authorization: Bearer <METRICS_TOKEN>`. Without a token it is open to
+    the scraper, or not found with METRICS_REQUIRE_TOKEN (production).
+
+    The counters live in the answering process only (see RouteMetrics), so
+    the numbers are only meaningful with a single worker process: with
+    several, each scrape lands on a random one and the counters jump back
+    and forth, which Prometheus reads as resets.
+    """
+    token = settings.METRICS_TOKEN
+    if not token:
+        if settings.METRICS_REQUIRE_TOKEN:
+            raise Http404
+    elif not hmac.compare_digest(
+        request.headers.get('Authorization', '').encode(), f'Bearer {token}'.encode()
+    ):
+        return HttpResponse(status=401)
+    return HttpResponse(route_metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -0,0 +1,54 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .cache import task_list_cache
+from .models import ArchivedTask, Task
+
+# Columns copied as they are, archived_at is set by the database
+ARCHIVED_COLUMNS = [field.column for field in ArchivedTask._meta.concrete_fields if field.name != 'archived_at']
+
+
+def archivable(cutoff=None):
+    """
+    Completed tasks not written to since `cutoff` (default
+    TASK_ARCHIVE_AFTER_DAYS ago). updated_at stands in for the completion
+    time: completing a task is its last write.
+    """
+    if cutoff is None:
+        cutoff = timezone.now() - timedelta(days=settings.TASK_ARCHIVE_AFTER_DAYS)
+    return Task.objects.filter(status=Task.Status.COMPLETED, updated_at__lt=cutoff)
+
+
+def archive_batch(queryset, batch_size):
+    """
+    Move up to `batch_size` tasks of `queryset` to the archive table in one
+    short transaction: INSERT ... SELECT, then DELETE, both by primary key.
+    Returns the number moved (0 once there is nothing left).
+
+    The rows are not changed, so no signals: stats counters keep counting
+    them (see counters.count_tasks), synced clients keep their copy, and no
+    notification or live event is sent. Only task list caches are dropped.
+    """
+    with transaction.atomic():
+        # Locked so nobody reopens a task between the copy and the delete;
+        # SKIP LOCKED leaves rows being edited to the next pass
+        ids = list(
+            queryset.order_by().select_for_update(skip_locked=True).values_list('pk', flat=True)[:batch_size]
+        )
+        if not ids:
+            return 0
+
+        quote = connection.ops.quote_name
+        columns = ', '.join(quote(column) for column in ARCHIVED_COLUMNS)
+        select, params = Task.objects.filter(pk__in=ids).values_list(*ARCHIVED_COLUMNS).query.sql_with_params()
+        pks = [Task._meta.pk.get_db_prep_value(pk, connection) for pk in ids]
+        placeholders = ', '.join(['%s'] * len(pks))
+        with connection.cursor() as cursor:
+            cursor.execute(f'INSERT INTO {quote(ArchivedTask._meta.db_table)} ({columns}) {select}', params)
+            # Raw: QuerySet.delete() would send post_delete for every task
+            cursor.execute(f'DELETE FROM {quote(Task._meta.db_table)} WHERE id IN ({placeholders})', pks)
+        transaction.on_commit(task_list_cache.invalidate_all)
+    return len(ids)
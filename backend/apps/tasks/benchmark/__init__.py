@@ -0,0 +1,6 @@
+"""
+Reproducible API benchmarks: seeded data (scenarios.py), a runner that
+drives the real URLconf through the test client and reports latency
+percentiles and query counts (runner.py). See the `benchmark_api` and
+`seed_benchmark_data` management commands.
+"""
@@ -0,0 +1,64 @@
+import statistics
+import time
+from collections import Counter
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def percentile(sorted_values, fraction):
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    return statistics.quantiles(sorted_values, n=100, method='inclusive')[round(fraction * 100) - 1]
+
+
+def run_scenario(func, data, iterations, warmup=5):
+    """
+    Call a scenario `warmup` times untimed, then `iterations` times, and
+    summarize latency, throughput and queries per request.
+    """
+    for i in range(warmup):
+        func(data, i)
+
+    timings, queries, statuses = [], [], Counter()
+    started = time.perf_counter()
+    for i in range(warmup, warmup + iterations):
+        with CaptureQueriesContext(connection) as captured:
+            request_started = time.perf_counter()
+            response = func(data, i)
+            timings.append(time.perf_counter() - request_started)
+        queries.append(len(captured))
+        statuses[str(response.status_code)] += 1
+    elapsed = time.perf_counter() - started
+
+    timings.sort()
+    return {
+        'requests': iterations,
+        'throughput_rps': round(iterations / elapsed, 1),
+        'mean_ms': round(statistics.fmean(timings) * 1000, 2),
+        'p50_ms': round(percentile(timings, 0.50) * 1000, 2),
+        'p95_ms': round(percentile(timings, 0.95) * 1000, 2),
+        'p99_ms': round(percentile(timings, 0.99) * 1000, 2),
+        'queries_mean': round(statistics.fmean(queries), 2),
+        'queries_max': max(queries),
+        'statuses': dict(statuses),
+    }
+
+
+def find_regressions(results, baseline, tolerance, min_ms=1.0):
+    """
+    Scenarios whose p95 grew by more than `tolerance` (a fraction, and at
+    least `min_ms` to ignore noise on very fast ones), or that run more
+    queries than in the baseline.
+    """
+    regressions = []
+    for name, current in results['scenarios'].items():
+        before = baseline['scenarios'].get(name)
+        if before is None:
+            continue
+        slower = current['p95_ms'] - before['p95_ms']
+        if current['p95_ms'] > before['p95_ms'] * (1 + tolerance) and slower > min_ms:
+            regressions.append(f"{name}: p95 {before['p95_ms']} -> {current['p95_ms']} ms")
+        if current['queries_max'] > before['queries_max']:
+            regressions.append(f"{name}: queries {before['queries_max']} -> {current['queries_max']}")
+    return regressions
@@ -0,0 +1,139 @@
+import random
+from functools import cached_property
+
+from rest_framework.test import APIClient
+
+from apps.tasks.counters import count_tasks, replace_all
+from apps.tasks.management.seed import seed_tasks
+from apps.tasks.models import Task
+
+# Password of the seeded admin and assignees that log in
+PASSWORD = 'benchmark-password'
+
+
+class BenchmarkData:
+    """
+    Seeded users/tasks plus authenticated clients for the scenarios. The
+    clients send requests as the test client's 'testserver' host.
+    """
+
+    def __init__(self, users, tasks, skew=1.0, seed=42, prefix='bench'):
+        # Same seed, same data (apart from generated ids and timestamps)
+        random.seed(seed)
+        self.admin, self.assignees = seed_tasks(tasks, users, prefix=prefix, skew=skew)
+        # bulk_create skipped the counter signals
+        replace_all(count_tasks())
+
+        # The first assignee holds the most tasks (see seed_tasks)
+        self.user = self.assignees[0]
+        for user in (self.admin, self.user):
+            user.set_password(PASSWORD)
+            user.save(update_fields=['password'])
+
+        self.task_ids = [
+            str(pk) for pk in Task.objects.filter(assigned_to=self.user).values_list('pk', flat=True)[:100]
+        ]
+
+    @cached_property
+    def admin_client(self):
+        return self.login(self.admin)
+
+    @cached_property
+    def user_client(self):
+        return self.login(self.user)
+
+    def login(self, user):
+        client = APIClient()
+        response = client.post('/api/v1/users/login/', {'email': user.email, 'password': PASSWORD})
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+        return client
+
+    def task_id(self, i):
+        return self.task_ids[i % len(self.task_ids)]
+
+
+SCENARIOS = {}
+
+
+def scenario(name):
+    def register(func):
+        SCENARIOS[name] = func
+        return func
+    return register
+
+
+@scenario('login')
+def login(data, i):
+    return APIClient().post(
+        '/api/v1/users/login/', {'email': data.user.email, 'password': PASSWORD}
+    )
+
+
+@scenario('tasks-list-admin')
+def tasks_list_admin(data, i):
+    return data.admin_client.get('/api/v1/tasks/')
+
+
+@scenario('tasks-list-user')
+def tasks_list_user(data, i):
+    return data.user_client.get('/api/v1/tasks/')
+
+
+@scenario('tasks-filter-status')
+def tasks_filter_status(data, i):
+    return data.admin_client.get('/api/v1/tasks/', {'status': 'IN_PROGRESS'})
+
+
+@scenario('tasks-filter-priority-due')
+def tasks_filter_priority_due(data, i):
+    return data.user_client.get('/api/v1/tasks/', {'priority': 'HIGH', 'ordering': 'due_date'})
+
+
+@scenario('tasks-search')
+def tasks_search(data, i):
+    return data.admin_client.get('/api/v1/tasks/', {'search': 'invoice review'})
+
+
+@scenario('tasks-search-ordered')
+def tasks_search_ordered(data, i):
+    return data.user_client.get('/api/v1/tasks/', {'search': 'meeting', 'ordering': '-created_at'})
+
+
+@scenario('tasks-large-page')
+def tasks_large_page(data, i):
+    return data.admin_client.get('/api/v1/tasks/', {'page_size': 200})
+
+
+@scenario('tasks-large-page-sparse')
+def tasks_large_page_sparse(data, i):
+    return data.admin_client.get('/api/v1/tasks/', {
+        'page_size': 200, 'fields': 'id,title,status,priority,due_date,assignee_name',
+    })
+
+
+@scenario('task-detail')
+def task_detail(data, i):
+    return data.user_client.get(f'/api/v1/tasks/{data.task_id(i)}/')
+
+
+@scenario('task-patch-status')
+def task_patch_status(data, i):
+    status = Task.Status.values[i % len(Task.Status.values)]
+    return data.user_client.patch(f'/api/v1/tasks/{data.task_id(i)}/', {'status': status}, format='json')
+
+
+@scenario('tasks-stats')
+def tasks_stats(data, i):
+    return data.admin_client.get('/api/v1/tasks/stats/')
+
+
+@scenario('users-list')
+def users_list(data, i):
+    return data.admin_client.get('/api/v1/users/')
+
+
+@scenario('users-typeahead')
+def users_typeahead(data, i):
+    # Someone typing an email (seeded ones look like bench-user12@...)
+    term = data.admin.email.split('-')[0]
+    return data.admin_client.get('/api/v1/users/', {'search': term[:1 + i % len(term)]})
@@ -0,0 +1,127 @@
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db.models import Max
+from django.utils import timezone
+
+
+class TaskListCache:
+    """
+    Response cache for `TaskViewSet.list`.
+
+    Entries are keyed by user id, role, the normalized query string and a set
+    of generation counters. Writes never delete entries; they bump a counter
+    instead, which makes every key built from the old value unreachable:
+
+    - `admin`: bumped on any task change (admins see every task)
+    - `user:<id>`: bumped when a task assigned to that user changes
+    - `all`: bumped when a user changes (names are embedded in every list)
+    """
+    prefix = 'tasks'
+
+    def __init__(self, alias='default'):
+        self.alias = alias
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    @property
+    def timeout(self):
+        return getattr(settings, 'TASK_LIST_CACHE_TIMEOUT', 60)
+
+    @property
+    def enabled(self):
+        return bool(self.timeout)
+
+    def generation_keys(self, user):
+        scope = 'admin' if user.role == 'ADMIN' else f'user:{user.pk}'
+        return [f'{self.prefix}:gen:all', f'{self.prefix}:gen:{scope}']
+
+    def key_for(self, request, state=''):
+        """
+        `state` describes the rows the entry is read from (the list ETag): a
+        lagging read replica's entry is never served once it has caught up.
+        """
+        user = request.user
+        generations = self.cache.get_many(self.generation_keys(user))
+        versions = '.'.join(
+            str(generations.get(key, 0)) for key in self.generation_keys(user)
+        )
+        # Same filters in a different order must hit the same entry
+        params = sorted(
+            (name, sorted(values)) for name, values in request.query_params.lists()
+        )
+        # Lists carry is_overdue, which changes with the date alone
+        digest = hashlib.sha256(
+            repr((request.get_host(), request.path, params, timezone.localdate(), state)).encode()
+        ).hexdigest()
+        return f'{self.prefix}:list:{user.pk}:{user.role}:{versions}:{digest}'
+
+    def get(self, key):
+        data = self.cache.get(key)
+        self.count('hits' if data is not None else 'misses')
+        return data
+
+    def set(self, key, data):
+        self.cache.set(key, data, self.timeout)
+
+    def count(self, name):
+        key = f'{self.prefix}:stats:{name}'
+        self.cache.add(key, 0, None)
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            # Evicted between add() and incr(); losing one sample is fine
+            pass
+
+    def bump(self, *scopes):
+        for scope in scopes:
+            key = f'{self.prefix}:gen:{scope}'
+            self.cache.add(key, 0, None)
+            try:
+                self.cache.incr(key)
+            except ValueError:
+                self.cache.set(key, 1, None)
+
+    def invalidate_assignees(self, *user_ids):
+        """
+        A task assigned to these users was created, changed or deleted.
+        """
+        self.bump('admin', *{f'user:{pk}' for pk in user_ids if pk})
+
+    def invalidate_all(self):
+        self.bump('all')
+
+    def global_generation(self):
+        # Changes whenever user names embedded in task payloads change
+        return self.cache.get(f'{self.prefix}:gen:all', 0)
+
+    def users_version(self):
+        """
+        For ETags of task payloads, which embed user names. The generation
+        counter when the cache is shared; a per-process one would differ
+        between workers, so otherwise the users' latest change is read (one
+        step down the user_updated_at_idx index).
+        """
+        if settings.SHARED_CACHE:
+            return self.global_generation()
+        latest = get_user_model().objects.aggregate(latest=Max('updated_at'))['latest']
+        return latest.isoformat() if latest else None
+
+    def stats(self):
+        counters = self.cache.get_many([f'{self.prefix}:stats:hits', f'{self.prefix}:stats:misses'])
+        hits = counters.get(f'{self.prefix}:stats:hits', 0)
+        misses = counters.get(f'{self.prefix}:stats:misses', 0)
+        total = hits + misses
+        return {
+            'enabled': self.enabled,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / total, 4) if total else None,
+        }
+
+
+task_list_cache = TaskListCache()
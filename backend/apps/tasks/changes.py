@@ -0,0 +1,136 @@
+import base64
+import binascii
+import json
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Max
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from apps.core.exceptions import Gone
+from .models import Task, TaskTombstone
+
+# Shared with the rows' change_seq columns, see migration 0009
+SEQUENCE = 'tasks_task_change_seq'
+
+
+def next_change_seq():
+    """
+    The next position in the change feed. On PostgreSQL a sequence, so
+    concurrent writers never share one; elsewhere MAX + 1 (SQLite runs one
+    writer at a time anyway).
+    """
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT nextval(%s)', [SEQUENCE])
+            return cursor.fetchone()[0]
+    latest = [
+        model.objects.aggregate(latest=Max('change_seq'))['latest'] or 0
+        for model in (Task, TaskTombstone)
+    ]
+    return max(latest) + 1
+
+
+def record_removals(removals, seq=None):
+    """
+    Write tombstones for (task, assignee, deleted) triples: a task deleted,
+    or reassigned away from `assignee` (its change_seq is the reassignment's).
+    """
+    TaskTombstone.objects.bulk_create([
+        TaskTombstone(
+            task_id=task.pk, assignee=assignee, deleted=deleted,
+            change_seq=seq if seq is not None else task.change_seq,
+        )
+        for task, assignee, deleted in removals
+    ])
+
+
+def visible_tombstones(user):
+    # Mirrors TaskViewSet.get_queryset(): admins see every task, so only
+    # deletes matter to them; a task reassigned away from a user is gone for them
+    if user.role == 'ADMIN':
+        return TaskTombstone.objects.filter(deleted=True)
+    return TaskTombstone.objects.filter(assignee=user.pk)
+
+
+def safe_seq():
+    """
+    The highest position no transaction can still be writing below.
+
+    Sequence values are taken before commit, so a slow transaction can make
+    a lower value visible after a higher one was already sent. Every write
+    older than TASK_CHANGES_LOOKBACK seconds is assumed committed: the final
+    cursor of a sync stops at the last of them, and newer changes are sent
+    again next time (clients apply them by id, so that is harmless).
+    """
+    horizon = timezone.now() - timedelta(seconds=settings.TASK_CHANGES_LOOKBACK)
+    older = [
+        Task.objects.filter(updated_at__lt=horizon),
+        TaskTombstone.objects.filter(created_at__lt=horizon),
+    ]
+    seqs = [
+        seq for queryset in older
+        for seq in queryset.order_by('-change_seq').values_list('change_seq', flat=True)[:1]
+    ]
+    return max(seqs, default=-1)
+
+
+def encode_cursor(seq):
+    data = json.dumps({'s': seq, 't': int(time.time())})
+    return base64.urlsafe_b64encode(data.encode('ascii')).decode('ascii')
+
+
+def decode_cursor(encoded):
+    """
+    The position in a cursor, or 410 Gone if tombstones it would need may
+    already be pruned.
+    """
+    try:
+        data = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')))
+        seq, issued = int(data['s']), int(data['t'])
+    except (TypeError, ValueError, KeyError, UnicodeEncodeError, binascii.Error):
+        raise ValidationError({'since': ['Invalid cursor.']})
+    retention = timedelta(days=settings.TASK_TOMBSTONE_RETENTION_DAYS).total_seconds()
+    if issued < time.time() - retention + settings.TASK_CHANGES_LOOKBACK:
+        raise Gone('Cursor is too old, deleted tasks may be missing. Resync without one.')
+    return seq
+
+
+def read_changes(tasks, tombstones, after, limit):
+    """
+    One page of the change feed after position `after` (None: from the
+    start, without tombstones). `tasks` is a values() queryset including
+    `id`. Returns (tasks, deleted task ids, next position, has_more).
+
+    The page ends after the `limit`th change, plus any sharing its position
+    (one bulk write stamps all of its tasks alike), so pages never split a
+    write.
+    """
+    # Before reading: everything up to here is committed, so visible below
+    safe = safe_seq()
+    if after is None:
+        tombstones = tombstones.none()
+    else:
+        tasks = tasks.filter(change_seq__gt=after)
+        tombstones = tombstones.filter(change_seq__gt=after)
+
+    seqs = sorted([
+        seq for queryset in (tasks, tombstones)
+        for seq in queryset.order_by('change_seq').values_list('change_seq', flat=True)[:limit + 1]
+    ])
+    has_more = len(seqs) > limit
+    if has_more:
+        tasks = tasks.filter(change_seq__lte=seqs[limit - 1])
+        tombstones = tombstones.filter(change_seq__lte=seqs[limit - 1])
+
+    tasks = list(tasks.order_by('change_seq', 'id'))
+    # A task deleted for someone and then back in their view is just updated
+    present = {task['id'] for task in tasks}
+    deleted = list(dict.fromkeys(
+        pk for pk in tombstones.order_by('change_seq').values_list('task_id', flat=True) if pk not in present
+    ))
+    # The last page never moves the cursor past writes that may still commit
+    return tasks, deleted, seqs[limit - 1] if has_more else safe, has_more
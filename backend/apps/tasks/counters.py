@@ -0,0 +1,134 @@
+from collections import Counter
+from itertools import islice
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+
+from .models import ArchivedTask, Task, TaskCounter, overdue_filter
+
+# A task is counted under this key
+COUNTED_FIELDS = ('assigned_to_id', 'status', 'priority', 'due_date')
+
+
+def counter_key(task):
+    # Read __dict__ so a deferred column is never fetched just for this
+    return tuple(task.__dict__.get(field) for field in COUNTED_FIELDS)
+
+
+def record_changes(before=(), after=()):
+    """
+    Move tasks between counter keys: -1 for every key in `before`,
+    +1 for every key in `after`.
+    """
+    deltas = Counter()
+    for key in before:
+        deltas[key] -= 1
+    for key in after:
+        deltas[key] += 1
+    apply_deltas(deltas)
+
+
+def apply_deltas(deltas):
+    for key, delta in deltas.items():
+        if not delta:
+            continue
+        lookup = dict(zip(COUNTED_FIELDS, key))
+        if TaskCounter.objects.filter(**lookup).update(count=F('count') + delta):
+            continue
+        try:
+            with transaction.atomic():
+                TaskCounter.objects.create(**lookup, count=delta)
+        except IntegrityError:
+            # Someone else created the row first
+            TaskCounter.objects.filter(**lookup).update(count=F('count') + delta)
+
+
+def empty_summary():
+    return {
+        'total': 0,
+        'by_status': dict.fromkeys(Task.Status.values, 0),
+        'by_priority': dict.fromkeys(Task.Priority.values, 0),
+        'overdue': 0,
+    }
+
+
+def summarize(counters, by_assignee=False):
+    """
+    Totals by status, priority and overdue from TaskCounter rows, globally and
+    (optionally) per assignee. Two small GROUP BY queries on the counter table.
+    """
+    counters = counters.exclude(count=0)
+    overall, per_assignee = empty_summary(), {}
+
+    rows = counters.values('assigned_to', 'status', 'priority').annotate(n=Sum('count'))
+    for row in rows:
+        buckets = [overall]
+        if by_assignee:
+            buckets.append(per_assignee.setdefault(row['assigned_to'], empty_summary()))
+        for bucket in buckets:
+            bucket['total'] += row['n']
+            bucket['by_status'][row['status']] += row['n']
+            bucket['by_priority'][row['priority']] += row['n']
+
+    overdue = counters.filter(overdue_filter()).values('assigned_to').annotate(n=Sum('count'))
+    for row in overdue:
+        overall['overdue'] += row['n']
+        if by_assignee:
+            per_assignee.setdefault(row['assigned_to'], empty_summary())['overdue'] += row['n']
+
+    if by_assignee:
+        overall['by_assignee'] = [
+            {'assigned_to': assignee, **totals} for assignee, totals in per_assignee.items()
+        ]
+    return overall
+
+
+def group_counts(queryset, chunk_size=5000):
+    # (key, count) pairs of a GROUP BY over `queryset`, streamed
+    rows = queryset.order_by().values(*COUNTED_FIELDS).annotate(n=Count('pk'))
+    for row in rows.iterator(chunk_size=chunk_size):
+        yield tuple(row[field] for field in COUNTED_FIELDS), row['n']
+
+
+def count_tasks():
+    """
+    {key: count} straight from the task tables (one GROUP BY over every
+    task). Archived tasks still count: archiving doesn't change a task.
+    """
+    counts = Counter()
+    for model in (Task, ArchivedTask):
+        counts.update(dict(group_counts(model.objects.all())))
+    return dict(counts)
+
+
+def stored_counts():
+    rows = TaskCounter.objects.exclude(count=0).values(*COUNTED_FIELDS, 'count')
+    return {tuple(row[field] for field in COUNTED_FIELDS): row['count'] for row in rows}
+
+
+def replace_all(counts):
+    TaskCounter.objects.all().delete()
+    create_counters(counts.items())
+
+
+def create_counters(counts, batch_size=5000):
+    # (key, count) pairs, inserted a batch at a time
+    counts = iter(counts)
+    while batch := list(islice(counts, batch_size)):
+        TaskCounter.objects.bulk_create([TaskCounter(**dict(zip(COUNTED_FIELDS, key)), count=n) for key, n in batch])
+
+
+def recount_assignees(assignee_ids):
+    """
+    Rebuild the counters of some assignees from their tasks, streaming the
+    GROUP BY. For writes that touch more keys than are worth moving one by
+    one (imports).
+    """
+    TaskCounter.objects.filter(assigned_to__in=assignee_ids).delete()
+    counts = Counter()
+    for key, n in group_counts(ArchivedTask.objects.filter(assigned_to__in=assignee_ids)):
+        counts[key] += n
+    # Live keys streamed; archived ones (all COMPLETED) are added in or left over
+    live = group_counts(Task.objects.filter(assigned_to__in=assignee_ids))
+    create_counters((key, n + counts.pop(key, 0)) for key, n in live)
+    create_counters(counts.items())
@@ -0,0 +1,276 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import close_old_connections, connection, connections, transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+# Control messages yielded by TaskEventBroker.subscribe()
+HEARTBEAT = object()
+RESET = object()
+
+# Changes collected by TaskEventBroker.batch(), None outside of one
+_batch = ContextVar('task_event_batch', default=None)
+
+
+class TaskEventBroker:
+    """
+    In-process pub/sub for task create/update/delete events.
+
+    Every event gets a monotonically increasing id and is kept in a bounded
+    buffer, so a client reconnecting with `Last-Event-ID` is sent what it
+    missed (or a RESET telling it to refetch once, if that fell out of the
+    buffer). Publishing happens from sync code (views, signals, any thread);
+    subscribers are async generators running on the ASGI event loop.
+
+    Only reaches subscribers in the same process: use PostgresNotifyBroker
+    when running several workers.
+    """
+    buffer_size = 1000
+    queue_size = 1000
+    heartbeat_seconds = 15
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # Microsecond clock as the first id keeps ids increasing across restarts
+        self.last_id = time.time_ns() // 1000
+        self.buffer = deque(maxlen=self.buffer_size)
+        self.subscribers = set()
+
+    def publish_change(self, event_type, task, previous_assignee=None):
+        """
+        Announce a task change once the surrounding transaction commits.
+        """
+        self.publish_changes([(event_type, task, previous_assignee)])
+
+    def publish_changes(self, changes):
+        """
+        publish_change() for a list of (event_type, task, previous_assignee).
+        """
+        pending = _batch.get()
+        if pending is not None:
+            pending.extend(changes)
+        elif changes:
+            self.send(changes)
+
+    @contextmanager
+    def batch(self):
+        """
+        Collect the changes published within the block (e.g. by the post_delete
+        signal of a bulk delete) and send them together when it ends.
+        """
+        pending = []
+        token = _batch.set(pending)
+        try:
+            yield
+        finally:
+            _batch.reset(token)
+        self.publish_changes(pending)
+
+    def send(self, changes):
+        events = [
+            (describe(event_type, task, previous_assignee), task)
+            for event_type, task, previous_assignee in changes
+        ]
+
+        def publish_all():
+            for event, task in events:
+                self.publish({**event, 'task': serialize(event, task)})
+
+        transaction.on_commit(publish_all)
+
+    def publish(self, event):
+        with self.lock:
+            self.last_id += 1
+            event = {**event, 'id': self.last_id}
+        self.dispatch(event)
+
+    def dispatch(self, event):
+        with self.lock:
+            self.last_id = max(self.last_id, event['id'])
+            self.buffer.append(event)
+            subscribers = list(self.subscribers)
+        for loop, queue in subscribers:
+            loop.call_soon_threadsafe(self.offer, queue, event)
+
+    @staticmethod
+    def offer(queue, event):
+        if queue.full():
+            # Too slow to keep up: drop the backlog, the client refetches
+            while not queue.empty():
+                queue.get_nowait()
+            event = RESET
+        queue.put_nowait(event)
+
+    def replay(self, last_id):
+        """
+        Buffered events after `last_id`, or None if some of them are gone.
+        """
+        with self.lock:
+            events, newest = list(self.buffer), self.last_id
+        if last_id == newest:
+            return []
+        if events and events[0]['id'] - 1 <= last_id < newest:
+            return [event for event in events if event['id'] > last_id]
+        return None
+
+    async def subscribe(self, last_id=None):
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(self.queue_size)
+        subscriber = (loop, queue)
+        with self.lock:
+            self.subscribers.add(subscriber)
+
+        seen = 0
+        try:
+            if last_id is not None:
+                missed = self.replay(last_id)
+                if missed is None:
+                    yield RESET
+                for event in missed or ():
+                    seen = event['id']
+                    yield event
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), self.heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    yield HEARTBEAT
+                    continue
+                if event is not RESET:
+                    # Already sent while replaying
+                    if event['id'] <= seen:
+                        continue
+                    seen = event['id']
+                yield event
+        finally:
+            with self.lock:
+                self.subscribers.discard(subscriber)
+
+
+class PostgresNotifyBroker(TaskEventBroker):
+    """
+    Cross-process broker on PostgreSQL LISTEN/NOTIFY.
+
+    Publishing sends a NOTIFY inside the writing transaction (so it is only
+    delivered on commit), with an id from a database sequence shared by all
+    workers; a batch of changes takes a single statement. Each process runs one listener thread that reloads the task
+    once and fans the event out to its local subscribers. Payloads only carry
+    ids because NOTIFY is limited to 8000 bytes.
+    """
+    channel = 'task_events'
+    sequence = 'tasks_task_event_seq'
+
+    def __init__(self):
+        super().__init__()
+        self.listener = None
+
+    def send(self, changes):
+        # One statement however many tasks a bulk write touched
+        payloads = [json.dumps(describe(*change)) for change in changes]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_notify(%s, nextval(%s)::text || ' ' || payload) FROM unnest(%s::text[]) AS payload",
+                [self.channel, self.sequence, payloads],
+            )
+
+    async def subscribe(self, last_id=None):
+        self.start_listener()
+        async for event in super().subscribe(last_id):
+            yield event
+
+    def start_listener(self):
+        with self.lock:
+            if self.listener is None:
+                self.listener = threading.Thread(target=self.listen, name='task-events', daemon=True)
+                self.listener.start()
+
+    def listen(self):
+        while True:
+            try:
+                self.listen_until_error()
+            except Exception:
+                logger.exception('Task event listener failed, reconnecting')
+                close_old_connections()
+                # Events may have been missed meanwhile
+                with self.lock:
+                    self.buffer.clear()
+                    subscribers = list(self.subscribers)
+                for loop, queue in subscribers:
+                    loop.call_soon_threadsafe(self.offer, queue, RESET)
+                time.sleep(5)
+
+    def listen_until_error(self):
+        import psycopg
+
+        # A dedicated connection: it is held forever, so not one from the pool
+        params = connections['default'].get_connection_params()
+        with psycopg.connect(**params, autocommit=True) as conn:
+            conn.execute(f'LISTEN {self.channel}')
+            for notify in conn.notifies():
+                event_id, payload = notify.payload.split(' ', 1)
+                event = {**json.loads(payload), 'id': int(event_id)}
+                event['task'] = self.load(event)
+                self.dispatch(event)
+
+    def load(self, event):
+        from .models import Task
+
+        task = None
+        if event['type'] != 'deleted':
+            task = Task.objects.with_people().filter(pk=event['task_id']).first()
+        return serialize(event if task else {**event, 'type': 'deleted'}, task)
+
+
+def describe(event_type, task, previous_assignee=None):
+    """
+    The part of an event needed to route it: what happened to which task, and
+    whose task list it was in before and after.
+    """
+    return {
+        'type': event_type,
+        'task_id': str(task.pk),
+        'assigned_to': str(task.assigned_to_id) if task.assigned_to_id else None,
+        'previous_assigned_to': str(previous_assignee) if previous_assignee else None,
+    }
+
+
+def serialize(event, task):
+    if event['type'] == 'deleted':
+        return {'id': event['task_id']}
+    from .serializers import TaskSerializer
+    return TaskSerializer(task).data
+
+
+def scope_event(event, user):
+    """
+    What `user` may see of an event, mirroring TaskViewSet.get_queryset():
+    admins see everything, users see their own tasks. A task reassigned away
+    from a user looks like a delete to them.
+    """
+    data = {'type': event['type'], 'task': event['task']}
+    if user.role == 'ADMIN' or event['assigned_to'] == str(user.pk):
+        return data
+    if event['previous_assigned_to'] == str(user.pk):
+        return {'type': 'deleted', 'task': {'id': event['task_id']}}
+    return None
+
+
+_broker = None
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        _broker = import_string(
+            getattr(settings, 'TASK_EVENTS_BROKER', 'apps.tasks.events.TaskEventBroker')
+        )()
+    return _broker
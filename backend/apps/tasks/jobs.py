@@ -0,0 +1,58 @@
+from django.core.mail import send_mail
+
+from apps.core.jobs import enqueue_many, job
+from .models import Task
+
+
+def load(task_id):
+    return Task.objects.select_related('assigned_to', 'assigned_by').filter(pk=task_id).first()
+
+
+@job('tasks.notify_assigned')
+def notify_assigned(task_id):
+    """
+    Email the assignee of a new or reassigned task.
+    """
+    task = load(task_id)
+    if task is None:
+        # Deleted meanwhile: nothing to tell
+        return
+    send_mail(
+        f'New task: {task.title}',
+        f'{task.assigned_by.display_name} assigned you "{task.title}"'
+        + (f', due {task.due_date:%d %b %Y}.' if task.due_date else '.'),
+        None,
+        [task.assigned_to.email],
+    )
+
+
+@job('tasks.notify_completed')
+def notify_completed(task_id):
+    """
+    Email the creator of a task that was just completed.
+    """
+    task = load(task_id)
+    if task is None or task.status != Task.Status.COMPLETED:
+        return
+    send_mail(
+        f'Task completed: {task.title}',
+        f'{task.assigned_to.display_name} completed "{task.title}".',
+        None,
+        [task.assigned_by.email],
+    )
+
+
+def enqueue_notifications(tasks, previous_keys=None):
+    """
+    Queue the emails for tasks just created (no previous keys) or updated
+    (their counter keys before the write, see counters.counter_key).
+    """
+    assigned, completed = [], []
+    for index, task in enumerate(tasks):
+        before = previous_keys[index] if previous_keys else None
+        if before is None or before[0] != task.assigned_to_id:
+            assigned.append({'task_id': str(task.pk)})
+        if before is not None and before[1] != Task.Status.COMPLETED and task.status == Task.Status.COMPLETED:
+            completed.append({'task_id': str(task.pk)})
+    enqueue_many('tasks.notify_assigned', assigned)
+    enqueue_many('tasks.notify_completed', completed)
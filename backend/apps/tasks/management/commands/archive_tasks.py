@@ -0,0 +1,45 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.tasks.archive import archivable, archive_batch
+
+
+class Command(BaseCommand):
+    help = (
+        "Move completed tasks untouched for TASK_ARCHIVE_AFTER_DAYS (or --days) to "
+        "the archive table, in batches of short transactions, so the task table "
+        "and its indexes stay small. Meant to run nightly (cron); archived tasks "
+        "are listed with ?include_archived=1."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, help='Archive after this many days instead.')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument(
+            '--pause', type=float, default=0,
+            help='Seconds to wait between batches, to leave room for other writes.',
+        )
+        parser.add_argument('--dry-run', action='store_true', help='Only count, do not move.')
+
+    def handle(self, *args, **options):
+        days = options['days'] if options['days'] is not None else settings.TASK_ARCHIVE_AFTER_DAYS
+        cutoff = timezone.now() - timedelta(days=days)
+        tasks = archivable(cutoff)
+        if options['dry_run']:
+            self.stdout.write(
+                f'{tasks.count()} completed task(s) untouched since {cutoff:%Y-%m-%d} would be archived.'
+            )
+            return
+
+        archived = 0
+        while moved := archive_batch(tasks, options['batch_size']):
+            archived += moved
+            if options['pause']:
+                time.sleep(options['pause'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Archived {archived} completed task(s) untouched since {cutoff:%Y-%m-%d}.'
+        ))
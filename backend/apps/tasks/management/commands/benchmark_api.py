@@ -0,0 +1,87 @@
+import json
+import platform
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from apps.tasks.benchmark.runner import find_regressions, run_scenario
+from apps.tasks.benchmark.scenarios import SCENARIOS, BenchmarkData
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed users and tasks, drive the real URLconf (JWT login, filtered/searched/"
+        "ordered task lists, detail, PATCH, stats, user list) through the test client "
+        "and report throughput, p50/p95/p99 and queries per request. Seeded rows are "
+        "rolled back. With --baseline, fail when a scenario regressed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=50)
+        parser.add_argument('--tasks', type=int, default=10_000)
+        parser.add_argument('--skew', type=float, default=1.0, help='Tasks per assignee ~ 1/rank**skew.')
+        parser.add_argument('--seed', type=int, default=42, help='Random seed for the generated data.')
+        parser.add_argument('--iterations', type=int, default=50, help='Timed requests per scenario.')
+        parser.add_argument('--warmup', type=int, default=5)
+        parser.add_argument(
+            '--scenarios', nargs='+', choices=sorted(SCENARIOS), default=list(SCENARIOS),
+            help='Scenarios to run (default: all).',
+        )
+        parser.add_argument(
+            '--no-cache', action='store_true', help='Disable the task list cache (measure the database path).',
+        )
+        parser.add_argument('--output', help='Write the results as JSON to this file.')
+        parser.add_argument('--baseline', help='Results JSON of an earlier run to compare against.')
+        parser.add_argument(
+            '--tolerance', type=float, default=0.2,
+            help='Allowed p95 slowdown versus the baseline, as a fraction (default 0.2).',
+        )
+
+    def handle(self, *args, **options):
+        baseline = None
+        if options['baseline']:
+            baseline = json.loads(Path(options['baseline']).read_text())
+
+        test_settings = {'ALLOWED_HOSTS': [*settings.ALLOWED_HOSTS, 'testserver']}
+        if options['no_cache']:
+            test_settings['TASK_LIST_CACHE_TIMEOUT'] = 0
+        with transaction.atomic(), override_settings(**test_settings):
+            data = BenchmarkData(options['users'], options['tasks'], options['skew'], options['seed'])
+            scenarios = {}
+            for name in options['scenarios']:
+                scenarios[name] = result = run_scenario(
+                    SCENARIOS[name], data, options['iterations'], options['warmup']
+                )
+                self.stdout.write(
+                    f"{name:<26} {result['throughput_rps']:8.1f} req/s   p50 {result['p50_ms']:7.2f}   "
+                    f"p95 {result['p95_ms']:7.2f}   p99 {result['p99_ms']:7.2f} ms   "
+                    f"{result['queries_mean']:5.1f} queries"
+                )
+            transaction.set_rollback(True)
+
+        results = {
+            'meta': {
+                'timestamp': timezone.now().isoformat(),
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'database': connection.vendor,
+                **{key: options[key] for key in ('users', 'tasks', 'skew', 'seed', 'iterations', 'no_cache')},
+            },
+            'scenarios': scenarios,
+        }
+        if options['output']:
+            Path(options['output']).write_text(json.dumps(results, indent=2) + '\n')
+            self.stdout.write(f"Results written to {options['output']}")
+
+        if baseline is not None:
+            regressions = find_regressions(results, baseline, options['tolerance'])
+            if regressions:
+                raise CommandError('Regressions against the baseline:\n  ' + '\n  '.join(regressions))
+            self.stdout.write(self.style.SUCCESS(
+                f"No regressions against {options['baseline']} (tolerance {options['tolerance']:.0%})."
+            ))
@@ -0,0 +1,132 @@
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from asgiref.sync import ThreadSensitiveContext, sync_to_async
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+from django.db.backends.signals import connection_created
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.tasks.management.seed import seed_tasks
+from apps.tasks.models import Task, TaskCounter
+from apps.tasks.views import AsyncTaskViewSet, TaskViewSet
+from apps.users.models import User
+from apps.users.views import AsyncUserListAPIView, UserListAPIView
+
+PREFIX = 'asyncbench'
+
+
+@contextmanager
+def injected_latency(seconds):
+    """
+    Sleep before every query on every connection opened meanwhile, like the
+    network round-trip to a remote database.
+    """
+    def delay(execute, sql, params, many, context):
+        time.sleep(seconds)
+        return execute(sql, params, many, context)
+
+    def install(sender, connection, **kwargs):
+        if delay not in connection.execute_wrappers:
+            connection.execute_wrappers.append(delay)
+
+    connection_created.connect(install)
+    try:
+        yield
+    finally:
+        connection_created.disconnect(install)
+
+
+class Command(BaseCommand):
+    help = (
+        "Load-test the sync views (a fixed number of worker threads, like gunicorn "
+        "sync workers) against their async counterparts (one event loop, as under "
+        "config/asgi.py) with an artificial per-query database latency. Reports "
+        "requests/s and p50/p99 latency. The seeded rows are committed (other "
+        "connections must see them) and deleted afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tasks', type=int, default=2000)
+        parser.add_argument('--requests', type=int, default=400, help='Requests per endpoint and mode.')
+        parser.add_argument('--latency-ms', type=float, default=20, help='Delay added to every query.')
+        parser.add_argument('--workers', type=int, default=4, help='Threads serving the sync views.')
+        parser.add_argument('--concurrency', type=int, default=32, help='In-flight async requests.')
+
+    def handle(self, *args, **options):
+        # Leftovers of an interrupted run
+        self.remove_seeded()
+        admin, assignees = seed_tasks(options['tasks'], 10, prefix=PREFIX)
+        try:
+            task = Task.objects.filter(assigned_by=admin).first()
+            factory = APIRequestFactory(SERVER_NAME='localhost')
+            auth = {'HTTP_AUTHORIZATION': f'Bearer {AccessToken.for_user(admin)}'}
+            endpoints = [
+                ('task list', lambda: factory.get('/api/v1/tasks/', {'page_size': 50}, **auth), {},
+                 TaskViewSet.as_view({'get': 'list'}), AsyncTaskViewSet.as_view({'get': 'list'})),
+                ('task detail', lambda: factory.get(f'/api/v1/tasks/{task.pk}/', **auth), {'pk': str(task.pk)},
+                 TaskViewSet.as_view({'get': 'retrieve'}), AsyncTaskViewSet.as_view({'get': 'retrieve'})),
+                ('user list', lambda: factory.get('/api/v1/users/', **auth), {},
+                 UserListAPIView.as_view(), AsyncUserListAPIView.as_view()),
+            ]
+
+            self.stdout.write(
+                f"{options['latency_ms']:.0f} ms per query, {options['workers']} sync workers, "
+                f"{options['concurrency']} concurrent async requests"
+            )
+            with injected_latency(options['latency_ms'] / 1000):
+                for label, make_request, kwargs, sync_view, async_view in endpoints:
+                    total = options['requests']
+                    self.report(f'{label} sync', *self.run_sync(
+                        sync_view, make_request, kwargs, total, options['workers']))
+                    self.report(f'{label} async', *asyncio.run(self.run_async(
+                        async_view, make_request, kwargs, total, options['concurrency'])))
+        finally:
+            self.remove_seeded()
+
+    def remove_seeded(self):
+        users = User.objects.filter(email__startswith=f'{PREFIX}-')
+        Task.objects.filter(assigned_by__in=users).delete()
+        # Seeded with bulk_create, so the deletes left negative counters
+        TaskCounter.objects.filter(assigned_to__in=users).delete()
+        users.delete()
+
+    def run_sync(self, view, make_request, kwargs, total, workers):
+        def call(_):
+            started = time.perf_counter()
+            view(make_request(), **kwargs).render()
+            # What Django's handler does at the end of each request
+            close_old_connections()
+            return time.perf_counter() - started
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(workers) as pool:
+            timings = list(pool.map(call, range(total)))
+        return timings, time.perf_counter() - started
+
+    async def run_async(self, view, make_request, kwargs, total, concurrency):
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call():
+            async with semaphore, ThreadSensitiveContext():
+                # Like the ASGI handler: sync_to_async calls of one request
+                # share a thread (and so a connection), closed afterwards
+                started = time.perf_counter()
+                (await view(make_request(), **kwargs)).render()
+                await sync_to_async(lambda: connection.close())()
+                return time.perf_counter() - started
+
+        started = time.perf_counter()
+        timings = await asyncio.gather(*(call() for _ in range(total)))
+        return timings, time.perf_counter() - started
+
+    def report(self, label, timings, elapsed):
+        percentiles = statistics.quantiles(timings, n=100)
+        self.stdout.write(
+            f'{label:<18} {len(timings) / elapsed:8.1f} req/s   '
+            f'p50 {percentiles[49] * 1000:7.1f} ms   p99 {percentiles[98] * 1000:7.1f} ms'
+        )
@@ -0,0 +1,58 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.compression import Compressor
+from apps.core.renderers import MessagePackRenderer, ORJSONRenderer
+from apps.tasks.management.seed import seed_tasks
+from apps.tasks.models import Task
+from apps.tasks.serializers import TaskValuesSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Render task list payloads (a 200-task page and the whole list) with DRF's "
+        "JSONRenderer, orjson and MessagePack, then compress each with gzip and "
+        "brotli at the configured levels. Reports encode/compress time and bytes on "
+        "the wire. Seeded rows are rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=5000)
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per measurement (median reported).')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            seed_tasks(options['rows'], 20, prefix='renderbench')
+            values = TaskValuesSerializer()
+            tasks = values.render(values.select(Task.objects.order_by('-created_at', '-id')))
+            payloads = [('page of 200', {'next': None, 'results': tasks[:200]}),
+                        (f'{len(tasks)} tasks', {'next': None, 'results': tasks})]
+            transaction.set_rollback(True)
+
+        renderers = [('drf json', JSONRenderer()), ('orjson', ORJSONRenderer()), ('msgpack', MessagePackRenderer())]
+        for label, payload in payloads:
+            self.stdout.write(f'\n{label}')
+            self.stdout.write(f"{'format':<10} {'encoding':<9} {'ms':>8} {'bytes':>11}")
+            for name, renderer in renderers:
+                body, elapsed = self.timed(lambda: renderer.render(payload), options['repeat'])
+                self.report(name, 'identity', elapsed, body)
+                for encoding in ('gzip', 'br'):
+                    compressed, compress_time = self.timed(
+                        lambda: Compressor(encoding).compress_all(body), options['repeat']
+                    )
+                    self.report(name, encoding, elapsed + compress_time, compressed)
+
+    def timed(self, call, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = call()
+            timings.append(time.perf_counter() - started)
+        return result, statistics.median(timings)
+
+    def report(self, name, encoding, elapsed, body):
+        self.stdout.write(f'{name:<10} {encoding:<9} {elapsed * 1000:8.2f} {len(body):11,}')
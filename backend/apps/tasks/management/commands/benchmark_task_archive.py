@@ -0,0 +1,99 @@
+import random
+import statistics
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.tasks.archive import archivable, archive_batch
+from apps.tasks.management.seed import seed_tasks
+from apps.tasks.models import ArchivedTask, Task
+from apps.tasks.views import TaskViewSet
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a task table where --history of the rows are long-completed tasks, "
+        "time the task list of a heavy and a typical assignee (ETag aggregate + first "
+        "page, as the list endpoint runs them), archive the history and time it again. "
+        "Seeded rows are rolled back."
+    )
+
+    # Query strings replayed per user
+    lists = {
+        'default': {},
+        'status': {'status': 'IN_PROGRESS'},
+        'due date': {'ordering': 'due_date'},
+        'archived': {'include_archived': '1'},
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=500_000)
+        parser.add_argument('--users', type=int, default=200)
+        parser.add_argument('--history', type=float, default=0.8, help='Share of old completed tasks.')
+        parser.add_argument('--repeat', type=int, default=20, help='Timed runs per list.')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Tasks moved per archive pass.')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            admin, assignees = seed_tasks(options['rows'], options['users'], prefix='archivebench')
+            self.make_history(admin, options['history'])
+            users = {'heavy': assignees[0], 'typical': assignees[len(assignees) // 2]}
+
+            before = self.measure_all(users, options['repeat'])
+
+            started = time.perf_counter()
+            moved, batches = 0, 0
+            while count := archive_batch(archivable(), options['batch_size']):
+                moved, batches = moved + count, batches + 1
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f'archived {moved} tasks in {batches} passes, {elapsed:.1f}s ({moved / elapsed:.0f} tasks/s); '
+                f'{Task.objects.count()} live, {ArchivedTask.objects.count()} archived'
+            )
+
+            after = self.measure_all(users, options['repeat'])
+            for name, timings in before.items():
+                self.stdout.write(
+                    f'  {name:<26} p50 {timings:8.2f} ms -> {after[name]:8.2f} ms ({timings / after[name]:.1f}x)'
+                )
+            transaction.set_rollback(True)
+
+    def make_history(self, admin, share, batch_size=5000):
+        # Completed and untouched for a year; the rest keep their random state
+        ids = list(Task.objects.filter(assigned_by=admin).values_list('pk', flat=True))
+        history = random.sample(ids, int(len(ids) * share))
+        old = timezone.now() - timedelta(days=365)
+        for start in range(0, len(history), batch_size):
+            Task.objects.filter(pk__in=history[start:start + batch_size]).update(status='COMPLETED', updated_at=old)
+        self.stdout.write(f'{len(ids)} tasks, {len(history)} of them old and completed')
+
+    def measure_all(self, users, repeat):
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                for model in (Task, ArchivedTask):
+                    cursor.execute(f'ANALYZE {model._meta.db_table}')
+        return {
+            f'{who} {name}': self.measure(user, params, repeat)
+            for who, user in users.items()
+            for name, params in self.lists.items()
+        }
+
+    def measure(self, user, params, repeat):
+        """
+        p50 of the uncached list path: the ETag aggregate, then one page.
+        """
+        timings = []
+        for _ in range(repeat):
+            request = Request(APIRequestFactory(SERVER_NAME='localhost').get('/api/v1/tasks/', params))
+            request.user = user
+            view = TaskViewSet(request=request, action='list', args=(), kwargs={}, format_kwarg=None)
+            started = time.perf_counter()
+            view.get_list_etag(request)
+            view.list_page(request)
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings)
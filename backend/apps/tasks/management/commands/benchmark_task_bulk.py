@@ -0,0 +1,60 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.tasks.management.seed import seed_tasks
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare creating/updating N tasks through N single API calls versus one "
+        "/api/v1/tasks/bulk/ call (real JWT auth and permissions). Rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 500])
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            admin, assignees = seed_tasks(0, 1, prefix='bulkbench')
+            client = APIClient(SERVER_NAME='localhost')
+            client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(admin)}')
+
+            for size in options['sizes']:
+                payload = [
+                    {'title': f'Bench {i}', 'description': 'bulk benchmark', 'assigned_to': str(assignees[0].pk)}
+                    for i in range(size)
+                ]
+
+                single = self.timed(lambda: [
+                    client.post('/api/v1/tasks/', item, format='json') for item in payload
+                ])
+                created, bulk = self.timed(
+                    lambda: client.post('/api/v1/tasks/bulk/', payload, format='json'), result=True
+                )
+                self.report(f'create x{size}', size, single, bulk)
+
+                changes = [{'id': task['id'], 'status': 'COMPLETED'} for task in created.data]
+                single = self.timed(lambda: [
+                    client.patch(f"/api/v1/tasks/{change['id']}/", {'status': 'IN_PROGRESS'}, format='json')
+                    for change in changes
+                ])
+                bulk = self.timed(lambda: client.patch('/api/v1/tasks/bulk/', changes, format='json'))
+                self.report(f'status x{size}', size, single, bulk)
+
+            transaction.set_rollback(True)
+
+    def timed(self, call, result=False):
+        started = time.perf_counter()
+        value = call()
+        elapsed = time.perf_counter() - started
+        return (value, elapsed) if result else elapsed
+
+    def report(self, label, size, single, bulk):
+        self.stdout.write(
+            f'{label:<14} single: {size / single:8.0f} tasks/s   '
+            f'bulk: {size / bulk:8.0f} tasks/s   ({single / bulk:.1f}x)'
+        )
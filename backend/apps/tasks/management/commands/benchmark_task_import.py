@@ -0,0 +1,66 @@
+import csv
+import random
+import resource
+import tempfile
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from apps.tasks.management.seed import sentence, seed_tasks
+from apps.tasks.models import Task
+from apps.tasks.transfer import TaskImporter, export_csv, read_rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Write a --rows row CSV file of tasks for seeded assignees, import it with "
+        "TaskImporter (COPY on PostgreSQL) and export it again, reporting rows/s and "
+        "the process' peak RSS, which should not grow with --rows. Rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1_000_000)
+        parser.add_argument('--users', type=int, default=200)
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        with transaction.atomic(), tempfile.NamedTemporaryFile('w+', suffix='.csv', newline='') as source:
+            admin, assignees = seed_tasks(0, options['users'], prefix='importbench')
+            self.write_file(source, rows, [user.email for user in assignees])
+            self.stdout.write(f'{rows} rows, {source.tell() / 2 ** 20:.0f} MB of CSV')
+
+            with open(source.name, 'rb') as stream:
+                importer = TaskImporter(admin, batch_size=options['batch_size']).run(read_rows(stream, 'csv'))
+            self.stdout.write(
+                f'import: {importer.imported} rows in {importer.elapsed:.1f}s, '
+                f'{importer.rate:.0f} rows/s, peak RSS {self.peak_rss():.0f} MB'
+            )
+
+            started = time.perf_counter()
+            size = sum(len(chunk) for chunk in export_csv(Task.objects.filter(assigned_by=admin)))
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f'export: {size / 2 ** 20:.0f} MB in {elapsed:.1f}s, {rows / elapsed:.0f} rows/s, '
+                f'peak RSS {self.peak_rss():.0f} MB'
+            )
+            transaction.set_rollback(True)
+
+    def write_file(self, output, rows, emails):
+        writer = csv.writer(output)
+        writer.writerow(['title', 'description', 'status', 'priority', 'due_date', 'assignee_email'])
+        today = timezone.localdate()
+        for i in range(rows):
+            writer.writerow([
+                sentence(4), sentence(30), random.choice(Task.Status.values), random.choice(Task.Priority.values),
+                (today + timedelta(days=random.randint(-60, 60))).isoformat() if i % 4 else '',
+                random.choice(emails),
+            ])
+        output.flush()
+
+    def peak_rss(self):
+        # Kilobytes on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
@@ -0,0 +1,77 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from rest_framework import filters
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.tasks.filters import TaskSearchFilter
+from apps.tasks.management.seed import seed_tasks
+from apps.tasks.models import Task
+from apps.tasks.views import TaskViewSet
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the icontains SearchFilter with TaskSearchFilter (full-text + trigram) "
+        "on seeded task tables of increasing size. Seeded rows are rolled back."
+    )
+
+    backends = {
+        'icontains': filters.SearchFilter,
+        'full-text': TaskSearchFilter,
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows', type=int, nargs='+', default=[100_000, 1_000_000],
+            help='Table sizes to benchmark at (default: 100000 1000000).',
+        )
+        parser.add_argument('--users', type=int, default=200)
+        parser.add_argument('--repeat', type=int, default=5, help='Timed runs per search term.')
+        parser.add_argument(
+            '--terms', nargs='+', default=['meet', 'invoice review', 'dashbord', 'quarterly audit report'],
+            help='Search strings to replay (include typos and prefixes).',
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('This benchmark needs PostgreSQL.')
+
+        with transaction.atomic():
+            seeded = 0
+            for size in sorted(options['rows']):
+                # Grow the table to `size` rows; admins search across all of it
+                admin, _ = seed_tasks(size - seeded, options['users'], prefix=f'search{size}')
+                seeded = size
+                with connection.cursor() as cursor:
+                    cursor.execute(f'ANALYZE {Task._meta.db_table}')
+
+                self.stdout.write(self.style.MIGRATE_HEADING(f'{size:,} rows'))
+                for term in options['terms']:
+                    line = [f'  {term!r:<26}']
+                    for name, backend in self.backends.items():
+                        timings, count = self.measure(backend, admin, term, options['repeat'])
+                        line.append(f'{name}: p50 {statistics.median(timings):8.2f} ms ({count} rows)')
+                    self.stdout.write('  '.join(line))
+
+            transaction.set_rollback(True)
+
+    def measure(self, backend, user, term, repeat):
+        """
+        Time the first page of results, exactly as the list endpoint fetches it.
+        """
+        request = Request(APIRequestFactory().get('/api/v1/tasks/', {'search': term}))
+        request.user = user
+        view = TaskViewSet(request=request, action='list', args=(), kwargs={}, format_kwarg=None)
+        view.filter_backends = [backend, filters.OrderingFilter]
+
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            queryset = view.filter_queryset(view.get_queryset())
+            rows = list(view.paginator.get_page_queryset(queryset, request, view))
+            timings.append((time.perf_counter() - started) * 1000)
+        return timings, len(rows)
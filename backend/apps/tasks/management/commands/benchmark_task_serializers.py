@@ -0,0 +1,61 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.tasks.management.seed import seed_tasks
+from apps.tasks.models import Task
+from apps.tasks.serializers import TaskSerializer, TaskValuesSerializer
+
+# What the dashboard's task list shows
+DASHBOARD_FIELDS = ['id', 'title', 'status', 'priority', 'due_date', 'assignee_name']
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare fetching and rendering N tasks with TaskSerializer (model instances) "
+        "against the TaskValuesSerializer fast path (values() dicts), with all fields "
+        "and with the dashboard's sparse fieldset. Seeded rows are rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10_000)
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per variant (median reported).')
+
+    def handle(self, *args, **options):
+        rows, repeat = options['rows'], options['repeat']
+        with transaction.atomic():
+            seed_tasks(rows, 20, prefix='serializerbench')
+            tasks = Task.objects.with_people().order_by('-created_at', '-id')[:rows]
+
+            def instances():
+                return TaskSerializer(list(tasks), many=True).data
+
+            def fast(fields=None):
+                values = TaskValuesSerializer(fields)
+                return lambda: values.render(list(values.select(tasks)))
+
+            variants = [
+                ('TaskSerializer', instances),
+                ('values, all fields', fast()),
+                ('values, dashboard', fast(DASHBOARD_FIELDS)),
+            ]
+            self.stdout.write(f'{rows} rows, median of {repeat} runs (query + render)')
+            baseline = None
+            for label, run in variants:
+                run()  # warm up
+                timings = []
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    data = run()
+                    timings.append(time.perf_counter() - started)
+                assert len(data) == rows
+                median = statistics.median(timings)
+                baseline = baseline or median
+                self.stdout.write(
+                    f'{label:<20} {median * 1000:8.1f} ms   {rows / median:9.0f} rows/s   '
+                    f'({baseline / median:.1f}x)'
+                )
+
+            transaction.set_rollback(True)
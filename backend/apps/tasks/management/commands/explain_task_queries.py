@@ -0,0 +1,130 @@
+import itertools
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.tasks.management.seed import seed_tasks
+from apps.tasks.filters import TaskFilter
+from apps.tasks.models import Task
+from apps.tasks.views import TaskViewSet
+from apps.users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay every TaskViewSet filter/ordering combination through "
+        "EXPLAIN (ANALYZE, FORMAT JSON) and flag sequential scans on the task table."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--seed', type=int, default=0,
+            help='Insert this many synthetic tasks first (rolled back afterwards).',
+        )
+        parser.add_argument(
+            '--users', type=int, default=50,
+            help='Number of synthetic assignees used by --seed.',
+        )
+        parser.add_argument(
+            '--fail-on-seq-scan', action='store_true',
+            help='Exit with an error if any scenario uses a sequential scan.',
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('EXPLAIN ANALYZE plans are only meaningful on PostgreSQL.')
+
+        with transaction.atomic():
+            if options['seed']:
+                admin, assignees = seed_tasks(options['seed'], options['users'], prefix='explain')
+                user = assignees[0]
+            else:
+                admin = User.objects.filter(role=User.Role.ADMIN).first()
+                user = User.objects.filter(assigned_tasks__isnull=False).first()
+                if admin is None or user is None:
+                    raise CommandError('No data to explain against. Pass --seed N.')
+
+            # Fresh planner statistics, otherwise the plans say nothing
+            with connection.cursor() as cursor:
+                cursor.execute(f'ANALYZE {Task._meta.db_table}')
+
+            flagged = []
+            for actor in (admin, user):
+                for params in self.scenarios(user):
+                    label = f"{actor.role:<5} {params or '{}'}"
+                    plan = self.explain(self.build_queryset(actor, params))
+                    flagged += self.report(label, plan)
+
+            for actor in (admin, user):
+                params = {'overdue': 'true', 'ordering': 'due_date'}
+                overdue = self.build_queryset(actor, params)
+                flagged += self.report(f'{actor.role:<5} {params}', self.explain(overdue))
+
+            # Never keep seeded rows around
+            transaction.set_rollback(True)
+
+        if flagged:
+            message = f'{len(flagged)} scenario(s) fell back to a sequential scan.'
+            if options['fail_on_seq_scan']:
+                raise CommandError(message)
+            self.stdout.write(self.style.WARNING(message))
+        else:
+            self.stdout.write(self.style.SUCCESS('Every scenario is served by an index.'))
+
+    def scenarios(self, user):
+        """
+        Yield query-string dicts for every combination the list endpoint accepts:
+        each subset of TaskFilter's exact-match fields crossed with each ordering.
+        """
+        fields = TaskFilter.Meta.fields
+        sample = Task.objects.filter(assigned_to=user).values(*fields).first()
+        if sample is None:
+            raise CommandError(f'{user.email} has no tasks to sample filter values from.')
+        orderings = [None] + [
+            prefix + field for field in TaskViewSet.ordering_fields for prefix in ('', '-')
+        ]
+
+        for size in range(len(fields) + 1):
+            for subset in itertools.combinations(fields, size):
+                for ordering in orderings:
+                    params = {field: sample[field] for field in subset}
+                    if ordering:
+                        params['ordering'] = ordering
+                    yield params
+
+    def build_queryset(self, user, params):
+        """
+        Build the page queryset exactly as TaskViewSet.list would for this request.
+        """
+        request = Request(APIRequestFactory().get('/api/v1/tasks/', params))
+        request.user = user
+        view = TaskViewSet(request=request, action='list', args=(), kwargs={}, format_kwarg=None)
+        queryset = view.filter_queryset(view.get_queryset())
+        return view.paginator.get_page_queryset(queryset, request, view)
+
+    def explain(self, queryset):
+        plan = json.loads(queryset.explain(format='json', analyze=True))
+        return plan[0] if isinstance(plan, list) else plan
+
+    def report(self, label, plan):
+        seq_scans, indexes = [], set()
+        nodes = [plan['Plan']]
+        while nodes:
+            node = nodes.pop()
+            if node.get('Index Name'):
+                indexes.add(node['Index Name'])
+            if node['Node Type'] == 'Seq Scan' and node.get('Relation Name') == Task._meta.db_table:
+                seq_scans.append(node)
+            nodes.extend(node.get('Plans', []))
+
+        timing = f"{plan.get('Execution Time', 0):.2f} ms"
+        if seq_scans:
+            self.stdout.write(self.style.ERROR(f'[SEQ SCAN] {label} ({timing})'))
+            return [label]
+
+        used = ', '.join(sorted(indexes)) or '-'
+        self.stdout.write(f'[ok]       {label} ({timing}) via {used}')
+        return []
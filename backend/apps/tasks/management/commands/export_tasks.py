@@ -0,0 +1,43 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.tasks.models import Task
+from apps.tasks.transfer import FORMATS, export_csv, export_jsonl, guess_format
+
+
+class Command(BaseCommand):
+    help = (
+        "Export tasks as CSV (COPY ... TO STDOUT on PostgreSQL) or JSON lines to a "
+        "file, or stdout with '-'. Streams, so memory does not grow with the table. "
+        "The columns can be imported again with import_tasks."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', nargs='?', default='-')
+        parser.add_argument('--format', choices=FORMATS, help='Default: from the file extension, else csv.')
+        parser.add_argument('--assignee', help='Only tasks assigned to this email.')
+        parser.add_argument('--status', choices=Task.Status.values)
+
+    def handle(self, *args, **options):
+        tasks = Task.objects.all()
+        if options['assignee']:
+            tasks = tasks.filter(assigned_to__email=options['assignee'])
+        if options['status']:
+            tasks = tasks.filter(status=options['status'])
+        export = export_jsonl if (options['format'] or guess_format(options['path'])) == 'jsonl' else export_csv
+
+        started, size = time.perf_counter(), 0
+        if options['path'] == '-':
+            for chunk in export(tasks):
+                sys.stdout.buffer.write(chunk)
+                size += len(chunk)
+            sys.stdout.buffer.flush()
+        else:
+            with open(options['path'], 'wb') as output:
+                for chunk in export(tasks):
+                    output.write(chunk)
+                    size += len(chunk)
+        # Not on stdout, which may be the export itself
+        self.stderr.write(f'Exported {size / 2 ** 20:.1f} MB in {time.perf_counter() - started:.1f}s.')
@@ -0,0 +1,65 @@
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from apps.tasks.models import Task, overdue_filter
+from apps.tasks.signals import tasks_overdue
+
+
+class Command(BaseCommand):
+    help = (
+        "Stamp Task.overdue_since on tasks that became overdue (in TIME_ZONE) and "
+        "clear it on those that no longer are, in batches. Meant to run once a day "
+        "shortly after midnight (cron); consumers then read overdue_since instead "
+        "of rescanning the task table, or listen to the tasks_overdue signal."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--date', help='Day to flag for (YYYY-MM-DD), default today.')
+        parser.add_argument('--dry-run', action='store_true', help='Only count, do not write.')
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+        if options['date']:
+            try:
+                today = datetime.date.fromisoformat(options['date'])
+            except ValueError:
+                raise CommandError(f"Invalid --date {options['date']!r}, expected YYYY-MM-DD.")
+
+        newly_overdue = Task.objects.overdue(today).filter(overdue_since__isnull=True)
+        resolved = Task.objects.filter(overdue_since__isnull=False).exclude(overdue_filter(today))
+        if options['dry_run']:
+            self.stdout.write(
+                f'{newly_overdue.count()} task(s) would be flagged and '
+                f'{resolved.count()} unflagged for {today}.'
+            )
+            return
+
+        flagged = self.update_in_batches(newly_overdue, options['batch_size'], today)
+        unflagged = self.update_in_batches(resolved, options['batch_size'], None)
+        self.stdout.write(self.style.SUCCESS(
+            f'Flagged {flagged} newly overdue task(s), unflagged {unflagged}, for {today}.'
+        ))
+
+    def update_in_batches(self, queryset, batch_size, overdue_since):
+        """
+        Short transactions, one index range per batch: flagged rows drop out
+        of `queryset`, so every pass picks up the next ones.
+        """
+        total = 0
+        while True:
+            with transaction.atomic():
+                ids = list(queryset.order_by().values_list('pk', flat=True)[:batch_size])
+                if not ids:
+                    return total
+                # Plain UPDATE: not a change to the task itself, so no
+                # updated_at bump, counters or change events
+                Task.objects.filter(pk__in=ids).update(overdue_since=overdue_since)
+                if overdue_since is not None:
+                    transaction.on_commit(
+                        lambda ids=ids: tasks_overdue.send(sender=Task, task_ids=ids, date=overdue_since)
+                    )
+            total += len(ids)
@@ -0,0 +1,30 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.tasks.models import TaskTombstone
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete tombstones of deleted/reassigned tasks older than "
+        "TASK_TOMBSTONE_RETENTION_DAYS, in batches. Change feed cursors that old "
+        "are refused with 410, so nothing still needs them. Meant to run daily (cron)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=settings.TASK_TOMBSTONE_RETENTION_DAYS)
+        old = TaskTombstone.objects.filter(created_at__lt=cutoff)
+        pruned = 0
+        while True:
+            # Short transactions: one batch of ids at a time
+            ids = list(old.values_list('pk', flat=True)[:options['batch_size']])
+            if not ids:
+                break
+            pruned += TaskTombstone.objects.filter(pk__in=ids).delete()[0]
+        self.stdout.write(f'Pruned {pruned} tombstone(s) older than {cutoff:%Y-%m-%d %H:%M}.')
@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from apps.tasks.counters import count_tasks, replace_all, stored_counts
+from apps.tasks.models import Task
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the TaskCounter summary table from the task table and report "
+        "any drift between the stored and the real counts."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='Only report drift, do not rewrite the table.',
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                # Block task writes (not reads) so nothing changes mid-rebuild
+                with connection.cursor() as cursor:
+                    cursor.execute(f'LOCK TABLE {Task._meta.db_table} IN SHARE MODE')
+
+            expected, stored = count_tasks(), stored_counts()
+            drifted = sorted(
+                (key for key in expected.keys() | stored.keys()
+                 if expected.get(key, 0) != stored.get(key, 0)),
+                key=str,
+            )
+            for key in drifted:
+                self.stdout.write(
+                    f'  {key}: stored {stored.get(key, 0)}, actual {expected.get(key, 0)}'
+                )
+
+            if not options['dry_run']:
+                replace_all(expected)
+
+        total = sum(expected.values())
+        if drifted:
+            self.stdout.write(self.style.WARNING(
+                f'{len(drifted)} counter(s) drifted across {total} tasks.'
+                + (' Nothing written (dry run).' if options['dry_run'] else ' Rebuilt.')
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'No drift across {total} tasks.'))
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.tasks.benchmark.scenarios import PASSWORD, BenchmarkData
+from apps.users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed (and keep) users and tasks for load testing with external tools: one "
+        "admin and N assignees, tasks skewed towards a few assignees, inserted with "
+        "bulk_create."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=50)
+        parser.add_argument('--tasks', type=int, default=10_000)
+        parser.add_argument('--skew', type=float, default=1.0, help='Tasks per assignee ~ 1/rank**skew.')
+        parser.add_argument('--seed', type=int, default=42, help='Random seed for the generated data.')
+        parser.add_argument('--prefix', default='bench', help='Email prefix of the seeded users.')
+
+    def handle(self, *args, **options):
+        if User.objects.filter(email__startswith=f"{options['prefix']}-").exists():
+            raise CommandError(f"Users with prefix '{options['prefix']}' already exist, pick another --prefix.")
+
+        with transaction.atomic():
+            data = BenchmarkData(
+                options['users'], options['tasks'], options['skew'], options['seed'], prefix=options['prefix']
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {options['tasks']} tasks over {options['users']} assignees. "
+            f"Log in as {data.admin.email} or {data.user.email} with password '{PASSWORD}'."
+        ))
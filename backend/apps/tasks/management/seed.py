@@ -0,0 +1,59 @@
+import random
+from datetime import timedelta
+
+from django.utils import timezone
+
+from apps.tasks.models import Task
+from apps.users.models import User
+
+# Small vocabulary so search benchmarks hit realistic, repeated words
+WORDS = (
+    'review', 'meeting', 'invoice', 'deploy', 'backend', 'frontend', 'client',
+    'report', 'budget', 'design', 'migration', 'release', 'hotfix', 'onboarding',
+    'quarterly', 'audit', 'customer', 'support', 'ticket', 'database', 'schedule',
+    'contract', 'payroll', 'training', 'security', 'dashboard', 'analytics',
+)
+
+
+def sentence(words):
+    return ' '.join(random.choices(WORDS, k=words)).capitalize()
+
+
+def seed_tasks(total, user_count, prefix='seed', batch_size=5000, skew=1.0):
+    """
+    Bulk insert one admin, `user_count` assignees and `total` tasks.
+
+    Tasks are spread over assignees with a long-tail skew (a few people hold
+    most of the work; the n-th assignee gets a share proportional to
+    1 / n**skew, so 0 is uniform), with random status/priority and due dates
+    around today. Returns (admin, assignees).
+    """
+    admin = User(email=f'{prefix}-admin@example.com', role=User.Role.ADMIN)
+    admin.set_unusable_password()
+    assignees = []
+    for i in range(user_count):
+        assignee = User(
+            email=f'{prefix}-user{i}@example.com',
+            first_name=f'User{i}',
+            last_name=prefix.capitalize(),
+        )
+        assignee.set_unusable_password()
+        assignees.append(assignee)
+    User.objects.bulk_create([admin, *assignees])
+
+    weights = [1 / (rank + 1) ** skew for rank in range(user_count)]
+    today = timezone.localdate()
+    for start in range(0, total, batch_size):
+        Task.objects.bulk_create([
+            Task(
+                title=sentence(4),
+                description=sentence(30),
+                status=random.choice(Task.Status.values),
+                priority=random.choice(Task.Priority.values),
+                assigned_to=random.choices(assignees, weights)[0],
+                assigned_by=admin,
+                due_date=today + timedelta(days=random.randint(-60, 60)) if i % 4 else None,
+            )
+            for i in range(start, min(start + batch_size, total))
+        ])
+    return admin, assignees
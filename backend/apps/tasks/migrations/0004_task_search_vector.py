@@ -0,0 +1,70 @@
+# Generated by Django 6.0.2 on 2026-10-18 18:41
+
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+# The trigger and GIN indexes are PostgreSQL-only. On any other database the
+# column simply stays NULL and TaskSearchFilter falls back to icontains.
+CREATE_SEARCH_SQL = [
+    """
+    CREATE FUNCTION tasks_task_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(NEW.description, '')), 'B');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE TRIGGER tasks_task_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, description ON tasks_task
+    FOR EACH ROW EXECUTE FUNCTION tasks_task_search_vector_update();
+    """,
+    # Backfill existing rows
+    """
+    UPDATE tasks_task SET search_vector =
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B');
+    """,
+    "CREATE INDEX task_search_vector_idx ON tasks_task USING gin (search_vector);",
+    "CREATE INDEX task_title_trgm_idx ON tasks_task USING gin (title gin_trgm_ops);",
+]
+
+DROP_SEARCH_SQL = [
+    "DROP INDEX IF EXISTS task_title_trgm_idx;",
+    "DROP INDEX IF EXISTS task_search_vector_idx;",
+    "DROP TRIGGER IF EXISTS tasks_task_search_vector_trigger ON tasks_task;",
+    "DROP FUNCTION IF EXISTS tasks_task_search_vector_update();",
+]
+
+
+def run_on_postgres(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0003_task_indexes'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='task',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(
+            run_on_postgres(CREATE_SEARCH_SQL),
+            run_on_postgres(DROP_SEARCH_SQL),
+        ),
+    ]
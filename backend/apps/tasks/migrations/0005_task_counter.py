@@ -0,0 +1,46 @@
+# Generated by Django 6.0.2 on 2026-10-18 18:48
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_counters(apps, schema_editor):
+    Task = apps.get_model('tasks', 'Task')
+    TaskCounter = apps.get_model('tasks', 'TaskCounter')
+    fields = ('assigned_to_id', 'status', 'priority', 'due_date')
+    rows = Task.objects.order_by().values(*fields).annotate(n=Count('pk'))
+    TaskCounter.objects.bulk_create(
+        [TaskCounter(**{field: row[field] for field in fields}, count=row['n']) for row in rows],
+        batch_size=5000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0004_task_search_vector'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskCounter',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('status', models.CharField(choices=[('ASSIGNED', 'Assigned'), ('ACCEPTED', 'Accepted'), ('IN_PROGRESS', 'In Progress'), ('COMPLETED', 'Completed')], max_length=20)),
+                ('priority', models.CharField(choices=[('LOW', 'Low'), ('MEDIUM', 'Medium'), ('HIGH', 'High')], max_length=10)),
+                ('due_date', models.DateField(blank=True, null=True)),
+                ('count', models.IntegerField(default=0)),
+                ('assigned_to', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(condition=models.Q(('due_date__isnull', False)), fields=('assigned_to', 'status', 'priority', 'due_date'), name='task_counter_unique_dated'), models.UniqueConstraint(condition=models.Q(('due_date__isnull', True)), fields=('assigned_to', 'status', 'priority'), name='task_counter_unique_undated')],
+            },
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 6.0.2 on 2026-10-18 20:05
+
+from django.db import migrations
+
+
+# Ids of task events published through PostgresNotifyBroker, shared by all
+# workers so Last-Event-ID means the same thing on every one of them
+def create_sequence(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('CREATE SEQUENCE IF NOT EXISTS tasks_task_event_seq;')
+
+
+def drop_sequence(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP SEQUENCE IF EXISTS tasks_task_event_seq;')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0005_task_counter'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_sequence, drop_sequence),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 6.0.2 on 2026-10-18 19:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0006_task_event_sequence'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='overdue_since',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('overdue_since__isnull', False)), fields=['overdue_since'], name='task_overdue_since_idx'),
+        ),
+    ]
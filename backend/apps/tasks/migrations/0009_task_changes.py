@@ -0,0 +1,62 @@
+# Generated by Django 6.0.2 on 2026-10-18 19:23
+
+import apps.core.ids
+from django.conf import settings
+from django.db import migrations, models
+
+
+# Change feed positions (Task.change_seq, TaskTombstone.change_seq). Other
+# databases take MAX + 1 instead, see changes.next_change_seq()
+def create_sequence(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('CREATE SEQUENCE IF NOT EXISTS tasks_task_change_seq;')
+
+
+def drop_sequence(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP SEQUENCE IF EXISTS tasks_task_change_seq;')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0008_uuid7_ids'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(create_sequence, drop_sequence),
+        migrations.CreateModel(
+            name='TaskTombstone',
+            fields=[
+                ('id', models.UUIDField(default=apps.core.ids.uuid7, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('task_id', models.UUIDField()),
+                ('assignee', models.UUIDField()),
+                ('deleted', models.BooleanField(default=True)),
+                ('change_seq', models.BigIntegerField()),
+            ],
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='change_seq',
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['change_seq'], name='task_change_seq_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['assigned_to', 'change_seq'], name='task_assignee_change_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tasktombstone',
+            index=models.Index(fields=['change_seq'], name='tombstone_change_seq_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tasktombstone',
+            index=models.Index(fields=['assignee', 'change_seq'], name='tombstone_assignee_change_idx'),
+        ),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 6.0.2 on 2026-10-18 20:01
+
+import apps.core.ids
+import django.contrib.postgres.search
+import django.db.models.deletion
+import django.db.models.functions.datetime
+from django.conf import settings
+from django.db import migrations, models
+
+# Both tables' columns, in one order. A column added to Task later must be
+# added to ArchivedTask and to this view (drop and recreate it) as well.
+COLUMNS = (
+    'id, created_at, updated_at, title, description, status, priority, due_date, '
+    'search_vector, overdue_since, change_seq, assigned_to_id, assigned_by_id'
+)
+
+CREATE_VIEW = f"""
+CREATE VIEW tasks_task_record AS
+SELECT {COLUMNS} FROM tasks_task
+UNION ALL
+SELECT {COLUMNS} FROM tasks_archivedtask
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0009_task_changes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskRecord',
+            fields=[
+                ('id', models.UUIDField(default=apps.core.ids.uuid7, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('title', models.CharField(max_length=255)),
+                ('description', models.TextField()),
+                ('status', models.CharField(choices=[('ASSIGNED', 'Assigned'), ('ACCEPTED', 'Accepted'), ('IN_PROGRESS', 'In Progress'), ('COMPLETED', 'Completed')], default='ASSIGNED', max_length=20)),
+                ('priority', models.CharField(choices=[('LOW', 'Low'), ('MEDIUM', 'Medium'), ('HIGH', 'High')], default='MEDIUM', max_length=10)),
+                ('due_date', models.DateField(blank=True, null=True)),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True)),
+                ('overdue_since', models.DateField(blank=True, editable=False, null=True)),
+                ('change_seq', models.BigIntegerField(default=0, editable=False)),
+            ],
+            options={
+                'db_table': 'tasks_task_record',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedTask',
+            fields=[
+                ('id', models.UUIDField(default=apps.core.ids.uuid7, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('title', models.CharField(max_length=255)),
+                ('description', models.TextField()),
+                ('status', models.CharField(choices=[('ASSIGNED', 'Assigned'), ('ACCEPTED', 'Accepted'), ('IN_PROGRESS', 'In Progress'), ('COMPLETED', 'Completed')], default='ASSIGNED', max_length=20)),
+                ('priority', models.CharField(choices=[('LOW', 'Low'), ('MEDIUM', 'Medium'), ('HIGH', 'High')], default='MEDIUM', max_length=10)),
+                ('due_date', models.DateField(blank=True, null=True)),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True)),
+                ('overdue_since', models.DateField(blank=True, editable=False, null=True)),
+                ('change_seq', models.BigIntegerField(default=0, editable=False)),
+                ('archived_at', models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False)),
+                ('assigned_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('assigned_to', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['-created_at', '-id'], name='archived_task_created_idx'), models.Index(fields=['assigned_to', '-created_at', '-id'], name='archived_task_assignee_idx')],
+            },
+        ),
+        migrations.RunSQL(CREATE_VIEW, 'DROP VIEW tasks_task_record'),
+    ]
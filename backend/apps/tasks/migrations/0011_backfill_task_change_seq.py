@@ -0,0 +1,44 @@
+# Generated by Django 6.0.2 on 2026-10-18 21:12
+
+from django.db import migrations
+from django.db.models import Max
+
+# Tasks that existed before 0009 all have change_seq 0, so a first sync
+# (after=0) could not page through them: every row had the same position.
+# Give each one its own, in id (creation) order.
+BACKFILL_SQL = """
+UPDATE tasks_task SET change_seq = numbered.seq
+FROM (
+    SELECT id, nextval('tasks_task_change_seq') AS seq
+    FROM (SELECT id FROM tasks_task WHERE change_seq = 0 ORDER BY id) AS legacy
+) AS numbered
+WHERE tasks_task.id = numbered.id
+"""
+
+
+def backfill_change_seq(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(BACKFILL_SQL)
+        return
+
+    # Elsewhere positions are MAX + 1 (changes.next_change_seq()): count on
+    # from the highest one in use
+    Task = apps.get_model('tasks', 'Task')
+    TaskTombstone = apps.get_model('tasks', 'TaskTombstone')
+    seq = max(model.objects.aggregate(latest=Max('change_seq'))['latest'] or 0 for model in (Task, TaskTombstone))
+    tasks = list(Task.objects.filter(change_seq=0).order_by('pk').only('pk'))
+    for task in tasks:
+        seq += 1
+        task.change_seq = seq
+    Task.objects.bulk_update(tasks, ['change_seq'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0010_task_archive'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_change_seq, migrations.RunPython.noop),
+    ]
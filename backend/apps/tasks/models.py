@@ -1,10 +1,66 @@
 from django.db import models
+from django.db.models.functions import Now
+from django.contrib.postgres.search import SearchVectorField
 from django.conf import settings
 from django.utils import timezone
 from apps.core.models import BaseModel
 
 
-class Task(BaseModel):
+# The overdue rule: due before today (in TIME_ZONE, not UTC) and not
+# completed. Written twice, once per side of the database, and nowhere else:
+# Task.is_overdue() and the values serializer call is_overdue(), filters call
+# overdue_filter(). OverdueTaskTests checks that the two agree.
+
+def overdue_filter(today=None):
+    """
+    The overdue rule as a filter, for rows that have status/due_date columns.
+    Matches the condition of the partial index `task_open_due_idx`.
+    """
+    today = today or timezone.localdate()
+    return models.Q(due_date__lt=today) & ~models.Q(status='COMPLETED')
+
+
+def is_overdue(due_date, status, today=None):
+    """
+    The overdue rule for one row's values, in Python.
+    """
+    today = today or timezone.localdate()
+    return due_date is not None and due_date < today and status != 'COMPLETED'
+
+
+class TaskQuerySet(models.QuerySet):
+
+    # Only the user columns the task API actually renders
+    PEOPLE_FIELDS = ('id', 'email', 'first_name', 'last_name')
+
+    def with_people(self):
+        """
+        JOIN the assignee and creator in the same query and load only the
+        columns needed to render their names, instead of one extra query
+        per task when the serializer dereferences the foreign keys.
+        """
+        deferred_users = [
+            f'{relation}__{field}'
+            for relation in ('assigned_to', 'assigned_by')
+            for field in self.PEOPLE_FIELDS
+        ]
+        task_fields = [
+            f.name for f in self.model._meta.concrete_fields if f.name != 'search_vector'
+        ]
+        return self.select_related('assigned_to', 'assigned_by').only(
+            *task_fields, *deferred_users
+        )
+
+    def overdue(self, today=None):
+        return self.filter(overdue_filter(today))
+
+
+class AbstractTask(BaseModel):
+    """
+    The columns and behaviour shared by live tasks (Task), archived ones
+    (ArchivedTask) and the view over both (TaskRecord). Each declares its own
+    assignee/creator foreign keys, which need distinct reverse names.
+    """
 
     class Status(models.TextChoices):
         ASSIGNED = "ASSIGNED", "Assigned"
@@ -32,6 +88,34 @@ class Task(BaseModel):
         default=Priority.MEDIUM
     )
 
+    due_date = models.DateField(blank=True, null=True)
+
+    # Weighted tsvector of title (A) + description (B), kept up to date by a
+    # database trigger (see migration 0004) and GIN-indexed for search
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    # Day the task was first seen overdue by `manage.py flag_overdue_tasks`,
+    # cleared once it no longer is (completed or rescheduled)
+    overdue_since = models.DateField(null=True, blank=True, editable=False)
+
+    # Position in the change feed (GET /api/v1/tasks/changes/), taken from a
+    # database sequence on every write, see changes.py
+    change_seq = models.BigIntegerField(default=0, editable=False)
+
+    objects = TaskQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
+
+    def is_overdue(self):
+        return is_overdue(self.due_date, self.status)
+
+    def __str__(self):
+        return self.title
+
+
+class Task(AbstractTask):
+
     assigned_to = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -44,15 +128,139 @@ class Task(BaseModel):
         related_name="created_tasks"
     )
 
+    class Meta:
+        # Match the TaskViewSet query shapes: users always filter on assigned_to
+        # (optionally + status/priority) and lists sort by -created_at or due_date
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='task_created_idx'),
+            models.Index(fields=['assigned_to', '-created_at', '-id'], name='task_assignee_created_idx'),
+            models.Index(fields=['assigned_to', 'status', '-created_at', '-id'], name='task_assignee_status_idx'),
+            models.Index(fields=['assigned_to', 'priority', '-created_at', '-id'], name='task_assignee_priority_idx'),
+            models.Index(fields=['assigned_to', 'due_date', 'id'], name='task_assignee_due_idx'),
+            # Overdue lookups only ever look at tasks that are still open
+            models.Index(
+                fields=['due_date', 'id'],
+                condition=~models.Q(status='COMPLETED'),
+                name='task_open_due_idx',
+            ),
+            # Only flagged tasks are ever looked up by overdue_since
+            models.Index(
+                fields=['overdue_since'],
+                condition=models.Q(overdue_since__isnull=False),
+                name='task_overdue_since_idx',
+            ),
+            # Change feed: everything after a cursor, or a user's part of it
+            models.Index(fields=['change_seq'], name='task_change_seq_idx'),
+            models.Index(fields=['assigned_to', 'change_seq'], name='task_assignee_change_idx'),
+        ]
+
+
+class ArchivedTask(AbstractTask):
+    """
+    Completed tasks moved out of the task table by `manage.py archive_tasks`
+    once untouched for TASK_ARCHIVE_AFTER_DAYS, so the hot table and its
+    indexes only hold the tasks people still work on. Same ids and columns;
+    read-only, listed with ?include_archived=1 (see TaskRecord).
+    """
+    assigned_to = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="+"
+    )
+    assigned_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="+"
+    )
+    archived_at = models.DateTimeField(db_default=Now(), editable=False)
+
+    class Meta:
+        # Only the default list shapes: archived tasks are rarely read
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='archived_task_created_idx'),
+            models.Index(fields=['assigned_to', '-created_at', '-id'], name='archived_task_assignee_idx'),
+        ]
+
+
+class TaskRecord(AbstractTask):
+    """
+    Every task, live or archived: a database view (UNION ALL of both tables,
+    see migration 0010) that TaskViewSet reads instead of Task for
+    ?include_archived=1, so filters, search and pagination work unchanged.
+    Both branches are filtered by their own indexes. Read-only.
+    """
+    assigned_to = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+"
+    )
+    assigned_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+"
+    )
+
+    class Meta:
+        managed = False
+        db_table = 'tasks_task_record'
+
+
+class TaskCounter(BaseModel):
+    """
+    Number of tasks per (assignee, status, priority, due_date).
+
+    Kept up to date on every task write (see counters.py) so dashboard stats
+    are a small GROUP BY over this table instead of COUNT(*) over every task.
+    `manage.py reconcile_task_counters` rebuilds it from scratch.
+    """
+    assigned_to = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="+"
+    )
+    status = models.CharField(max_length=20, choices=Task.Status.choices)
+    priority = models.CharField(max_length=10, choices=Task.Priority.choices)
     due_date = models.DateField(blank=True, null=True)
+    count = models.IntegerField(default=0)
 
-    def is_overdue(self):
-        if self.due_date:
-            return (
-                self.due_date < timezone.now().date()
-                and self.status != self.Status.COMPLETED
-            )
-        return False
+    class Meta:
+        # NULL due dates would never collide in a plain unique index
+        constraints = [
+            models.UniqueConstraint(
+                fields=['assigned_to', 'status', 'priority', 'due_date'],
+                condition=models.Q(due_date__isnull=False),
+                name='task_counter_unique_dated',
+            ),
+            models.UniqueConstraint(
+                fields=['assigned_to', 'status', 'priority'],
+                condition=models.Q(due_date__isnull=True),
+                name='task_counter_unique_undated',
+            ),
+        ]
 
     def __str__(self):
-        return self.title
+        return f"{self.assigned_to_id} {self.status}/{self.priority} {self.due_date}: {self.count}"
+
+
+class TaskTombstone(BaseModel):
+    """
+    A task that left someone's view: deleted (`deleted`), or reassigned away
+    from `assignee`. Replayed by the change feed so synced clients drop their
+    copy; `manage.py prune_task_tombstones` removes old ones.
+    """
+    task_id = models.UUIDField()
+    # Plain ids, no foreign key: the user may be deleted along with the task
+    assignee = models.UUIDField()
+    deleted = models.BooleanField(default=True)
+    change_seq = models.BigIntegerField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['change_seq'], name='tombstone_change_seq_idx'),
+            models.Index(fields=['assignee', 'change_seq'], name='tombstone_assignee_change_idx'),
+        ]
+
+    def __str__(self):
+        return f"{'Deleted' if self.deleted else 'Reassigned'} task {self.task_id}"
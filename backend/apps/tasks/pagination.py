@@ -0,0 +1,182 @@
+import base64
+import binascii
+import json
+
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class TaskCursorPagination(BasePagination):
+    """
+    Keyset (cursor) pagination for the task list.
+
+    Rows are ordered by the view's ordering field (e.g. -created_at) with `id`
+    as a tiebreaker, and each page continues *after* the last (value, id) pair
+    of the previous one. Ordering by `id` itself (time-ordered for rows with
+    UUIDv7 keys) walks the primary key index alone. Unlike offset pagination,
+    rows inserted while a client is paging never shift or duplicate the pages
+    it has not fetched yet.
+    """
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.set_page(list(self.get_page_queryset(queryset, request, view)))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        Async counterpart of paginate_queryset(), for the async views.
+        """
+        page = self.get_page_queryset(queryset, request, view)
+        return self.set_page([row async for row in page.aiterator()])
+
+    def set_page(self, results):
+        self.has_next = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        return self.page
+
+    def get_page_queryset(self, queryset, request, view=None):
+        """
+        Return the (unevaluated) queryset for the requested page, i.e. the
+        exact SQL the list endpoint runs.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.field, self.descending = self.get_ordering(request, queryset, view)
+        # Annotated sort keys (e.g. the search rank) are never NULL
+        self.annotated = self.field in queryset.query.annotations
+        self.nullable = not self.annotated and queryset.model._meta.get_field(self.field).null
+
+        queryset = queryset.order_by(*self.get_order_by())
+
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            queryset = queryset.filter(self.get_after_filter(queryset, cursor))
+
+        # Fetch one extra row so we know whether there is a next page
+        return queryset[:self.page_size + 1]
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def get_ordering(self, request, queryset, view):
+        """
+        Use the first ordering resolved by the view's filter backends
+        (?ordering=due_date, search rank) or fall back to the view's default.
+        """
+        ordering = getattr(view, 'ordering', None) or ['-created_at']
+        for backend in getattr(view, 'filter_backends', []):
+            if hasattr(backend, 'get_ordering'):
+                resolved = backend().get_ordering(request, queryset, view)
+                if resolved:
+                    ordering = resolved
+                    break
+
+        first = ordering[0]
+        return first.lstrip('-'), first.startswith('-')
+
+    def get_order_by(self):
+        # NULLs (due_date is optional) sort as the largest value, which is
+        # PostgreSQL's default and lets the plain B-tree indexes serve the
+        # ORDER BY. `id` breaks ties.
+        if self.field == 'id':
+            return ['-id' if self.descending else 'id']
+        if self.descending:
+            return [F(self.field).desc(nulls_first=self.nullable or None), '-id']
+        return [F(self.field).asc(nulls_last=self.nullable or None), 'id']
+
+    def get_after_filter(self, queryset, cursor):
+        """
+        Build the keyset predicate for "rows strictly after (value, id)".
+        """
+        value, pk = cursor['v'], cursor['id']
+        after = 'lt' if self.descending else 'gt'
+        if self.field == 'id':
+            return Q(**{f'id__{after}': pk})
+        is_null = Q(**{f'{self.field}__isnull': True})
+
+        if value is None:
+            # Inside the block of NULLs: walk it by id, then (descending only)
+            # continue into the non-NULL values that follow it
+            within_nulls = is_null & Q(**{f'id__{after}': pk})
+            return within_nulls | ~is_null if self.descending else within_nulls
+
+        if not self.annotated:
+            value = queryset.model._meta.get_field(self.field).to_python(value)
+        after_value = (
+            Q(**{f'{self.field}__{after}': value})
+            | Q(**{self.field: value, f'id__{after}': pk})
+        )
+        # Ascending, the NULLs are still ahead of us
+        return after_value if self.descending or not self.nullable else after_value | is_null
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            data = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')))
+            # A cursor is only meaningful for the ordering it was issued for
+            if data['f'] != self.field or data['d'] != self.descending:
+                raise ValueError('Cursor belongs to a different ordering')
+            return {'v': data['v'], 'id': data['id']}
+        except (TypeError, ValueError, KeyError, UnicodeEncodeError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, instance):
+        # A model instance, or a dict when the view paginates values()
+        if isinstance(instance, dict):
+            value, pk = instance[self.field], instance['id']
+        else:
+            value, pk = getattr(instance, self.field), instance.pk
+        if self.field == 'id':
+            value = str(pk)
+        cursor = {
+            'f': self.field,
+            'd': self.descending,
+            'v': value.isoformat() if hasattr(value, 'isoformat') else value,
+            'id': str(pk),
+        }
+        encoded = base64.urlsafe_b64encode(json.dumps(cursor).encode('ascii')).decode('ascii')
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, encoded
+        )
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(self.page[-1])
+
+    def get_first_link(self):
+        return remove_query_param(self.request.build_absolute_uri(), self.cursor_query_param)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'first': self.get_first_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'first': {'type': 'string', 'format': 'uri'},
+                'results': schema,
+            },
+        }
@@ -1,19 +1,153 @@
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
 from rest_framework import serializers
-from .models import Task
+from apps.core.instrumentation import TimedListSerializer, TimedSerializerMixin, timed
+from .models import Task, is_overdue
+
+User = get_user_model()
+
+
+class TaskPersonSerializer(serializers.Serializer):
+    """
+    Lightweight, read-only view of a user attached to a task.
+    Reads only the columns loaded by `Task.objects.with_people()`.
+    """
+    id = serializers.UUIDField(read_only=True)
+    email = serializers.EmailField(read_only=True)
+    name = serializers.CharField(source='display_name', read_only=True)
 
-class TaskSerializer(serializers.ModelSerializer):
+
+class TaskSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     assignee_name = serializers.SerializerMethodField()
+    assignee = TaskPersonSerializer(source='assigned_to', read_only=True)
+    creator = TaskPersonSerializer(source='assigned_by', read_only=True)
+    # Task.is_overdue(), in TIME_ZONE; filter with ?overdue=true
+    is_overdue = serializers.BooleanField(read_only=True)
     class Meta :
         model = Task
         fields = (
             'id','title','description','status','assigned_by','assignee_name','assigned_to','due_date','priority'
-            ,'created_at','updated_at'
+            ,'created_at','updated_at','assignee','creator','is_overdue'
         )
         read_only_fields = ('id','assigned_by','created_at','updated_at')
+        list_serializer_class = TimedListSerializer
 
     def get_assignee_name(self, obj):
         if obj.assigned_to:
             # Tries to return "First Last", falls back to Email if names are blank
-            full_name = f"{obj.assigned_to.first_name} {obj.assigned_to.last_name}".strip()
-            return full_name if full_name else obj.assigned_to.email
-        return "Unassigned"
\ No newline at end of file
+            return obj.assigned_to.display_name
+        return "Unassigned"
+
+
+def format_datetime(value):
+    # What DRF's DateTimeField renders: ISO 8601 in the current time zone
+    if value is None:
+        return None
+    value = timezone.localtime(value).isoformat()
+    return value[:-6] + 'Z' if value.endswith('+00:00') else value
+
+
+def display_name(first_name, last_name, email):
+    # Same as User.display_name
+    return f"{first_name or ''} {last_name or ''}".strip() or email
+
+
+def person_columns(relation):
+    return [f'{relation}_id', f'{relation}__email', f'{relation}__first_name', f'{relation}__last_name']
+
+
+def render_person(relation):
+    def render(row, today):
+        return {
+            'id': str(row[f'{relation}_id']),
+            'email': row[f'{relation}__email'],
+            'name': display_name(
+                row[f'{relation}__first_name'], row[f'{relation}__last_name'], row[f'{relation}__email']
+            ),
+        }
+    return render
+
+
+class TaskValuesSerializer:
+    """
+    Fast path for task lists: reads only the columns the requested fields need
+    with QuerySet.values() and builds the same dicts TaskSerializer would,
+    without model instances or per-field DRF serializer calls.
+
+    `fields` is a subset of TaskSerializer's fields (None for all of them).
+    """
+    # field -> (values() columns it needs, render(row, today))
+    FIELDS = {
+        'id': (['id'], lambda row, today: str(row['id'])),
+        'title': (['title'], lambda row, today: row['title']),
+        'description': (['description'], lambda row, today: row['description']),
+        'status': (['status'], lambda row, today: row['status']),
+        'assigned_by': (['assigned_by_id'], lambda row, today: row['assigned_by_id']),
+        'assignee_name': (
+            person_columns('assigned_to')[1:],
+            lambda row, today: display_name(
+                row['assigned_to__first_name'], row['assigned_to__last_name'], row['assigned_to__email']
+            ),
+        ),
+        'assigned_to': (['assigned_to_id'], lambda row, today: row['assigned_to_id']),
+        'due_date': (
+            ['due_date'], lambda row, today: row['due_date'].isoformat() if row['due_date'] else None,
+        ),
+        'priority': (['priority'], lambda row, today: row['priority']),
+        'created_at': (['created_at'], lambda row, today: format_datetime(row['created_at'])),
+        'updated_at': (['updated_at'], lambda row, today: format_datetime(row['updated_at'])),
+        'assignee': (person_columns('assigned_to'), render_person('assigned_to')),
+        'creator': (person_columns('assigned_by'), render_person('assigned_by')),
+        'is_overdue': (
+            ['due_date', 'status'], lambda row, today: is_overdue(row['due_date'], row['status'], today),
+        ),
+    }
+
+    def __init__(self, fields=None):
+        self.fields = list(fields or TaskSerializer.Meta.fields)
+        self.renderers = [(name, self.FIELDS[name][1]) for name in self.fields]
+
+    def columns(self, extra=()):
+        columns = [column for name in self.fields for column in self.FIELDS[name][0]]
+        return list(dict.fromkeys([*columns, *extra]))
+
+    def select(self, queryset, extra=()):
+        """
+        `queryset` as dicts of only the needed columns, plus `extra` ones
+        (e.g. the pagination sort key).
+        """
+        return queryset.values(*self.columns(extra))
+
+    def to_representation(self, row, today=None):
+        today = today or timezone.localdate()
+        return {name: render(row, today) for name, render in self.renderers}
+
+    def render(self, rows):
+        with timed('serialize_time'):
+            today = timezone.localdate()
+            return [self.to_representation(row, today) for row in rows]
+
+
+class PrefetchedUserField(serializers.PrimaryKeyRelatedField):
+    """
+    Resolves users from `context['users']` (a {pk: user} dict fetched with one
+    query for a whole batch) instead of one SELECT per item.
+    """
+
+    def to_internal_value(self, data):
+        users = self.context.get('users')
+        if users is None:
+            return super().to_internal_value(data)
+        try:
+            pk = uuid.UUID(str(data))
+        except ValueError:
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        if pk not in users:
+            self.fail('does_not_exist', pk_value=data)
+        return users[pk]
+
+
+class BulkTaskSerializer(TaskSerializer):
+    assigned_to = PrefetchedUserField(queryset=User.objects.all())
@@ -0,0 +1,76 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
+from django.dispatch import Signal, receiver
+
+from .cache import task_list_cache
+from .changes import next_change_seq, record_removals
+from .counters import COUNTED_FIELDS, counter_key, record_changes
+from .events import get_broker
+from .jobs import enqueue_notifications
+from .models import Task
+
+DISPLAYED_USER_FIELDS = {'email', 'first_name', 'last_name'}
+
+# Sent by `manage.py flag_overdue_tasks` for every batch of tasks that just
+# became overdue, with `task_ids` and `date`, for notification consumers
+tasks_overdue = Signal()
+
+
+def invalidate_lists(invalidate, *args):
+    # Now, and again once committed: a list read between the write and the
+    # commit would cache the old rows under the new generation
+    invalidate(*args)
+    transaction.on_commit(lambda: invalidate(*args))
+
+
+@receiver(post_init, sender=Task)
+def remember_loaded_state(sender, instance, **kwargs):
+    # What the row looked like when loaded: counters need the old key, and a
+    # reassignment must also invalidate the previous assignee's list
+    instance._loaded_key = counter_key(instance)
+
+
+@receiver(pre_save, sender=Task)
+def load_missing_state(sender, instance, **kwargs):
+    # Loaded with some counted columns deferred: read the old key once
+    if not instance._state.adding and None in instance._loaded_key[:3]:
+        old = Task.objects.filter(pk=instance.pk).values(*COUNTED_FIELDS).first()
+        if old:
+            instance._loaded_key = tuple(old[field] for field in COUNTED_FIELDS)
+
+
+@receiver(pre_save, sender=Task)
+def stamp_change(sender, instance, **kwargs):
+    instance.change_seq = next_change_seq()
+
+
+@receiver(post_save, sender=Task)
+def task_saved(sender, instance, created, **kwargs):
+    new_key = counter_key(instance)
+    record_changes(before=[] if created else [instance._loaded_key], after=[new_key])
+    if not created and instance._loaded_key[0] != new_key[0]:
+        # Gone from the previous assignee's synced copy
+        record_removals([(instance, instance._loaded_key[0], False)])
+    invalidate_lists(task_list_cache.invalidate_assignees, new_key[0], instance._loaded_key[0])
+    get_broker().publish_change('created' if created else 'updated', instance, instance._loaded_key[0])
+    enqueue_notifications([instance], None if created else [instance._loaded_key])
+    instance._loaded_key = new_key
+
+
+@receiver(post_delete, sender=Task)
+def task_deleted(sender, instance, **kwargs):
+    record_changes(before=[instance._loaded_key])
+    record_removals([(instance, instance._loaded_key[0], True)], seq=next_change_seq())
+    invalidate_lists(task_list_cache.invalidate_assignees, instance._loaded_key[0])
+    get_broker().publish_change('deleted', instance)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_all_task_lists(sender, instance, update_fields=None, **kwargs):
+    # Assignee/creator names are embedded in every cached list; saves that
+    # only touch other columns (e.g. last_login) can't make them stale
+    if update_fields is not None and not set(update_fields) & DISPLAYED_USER_FIELDS:
+        return
+    invalidate_lists(task_list_cache.invalidate_all)
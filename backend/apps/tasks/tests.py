@@ -1,3 +1,1145 @@
-from django.test import TestCase
+import json
+import tempfile
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from io import StringIO
+from pathlib import Path
+from unittest import mock, skipIf, skipUnless
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import AsyncClient, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.users.models import User
+from . import events
+from .benchmark.runner import find_regressions
+from .filters import TaskSearchFilter
+from .counters import count_tasks, stored_counts
+from .models import ArchivedTask, Task, TaskCounter, TaskTombstone, overdue_filter
+from .serializers import TaskSerializer
+from .signals import tasks_overdue
+from .views import AsyncTaskViewSet, TaskViewSet
+
+
+class TaskReadPathQueryCountTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email='admin@example.com', password='password123', role=User.Role.ADMIN
+        )
+        assignees = [
+            User.objects.create_user(
+                email=f'user{i}@example.com', password='password123',
+                first_name=f'User{i}', last_name='Example',
+            )
+            for i in range(10)
+        ]
+        Task.objects.bulk_create([
+            Task(
+                title=f'Task {i}',
+                description='Description',
+                assigned_to=assignees[i % len(assignees)],
+                assigned_by=cls.admin,
+            )
+            for i in range(1000)
+        ])
+
+    def test_serializing_1000_tasks_is_a_single_query(self):
+        with self.assertNumQueries(1):
+            data = TaskSerializer(Task.objects.with_people(), many=True).data
+
+        self.assertEqual(len(data), 1000)
+        self.assertEqual(data[0]['assignee']['name'], data[0]['assignee_name'])
+        self.assertEqual(data[0]['creator']['email'], 'admin@example.com')
+
+    def test_list_query_count_does_not_grow_with_page_size(self):
+        client = APIClient()
+        client.force_authenticate(self.admin)
+
+        # One query for the ETag validators, one for the page itself
+        with self.assertNumQueries(2):
+            small = client.get('/api/v1/tasks/', {'page_size': 10})
+        with self.assertNumQueries(2):
+            large = client.get('/api/v1/tasks/', {'page_size': 200})
+
+        self.assertEqual(len(small.data['results']), 10)
+        self.assertEqual(len(large.data['results']), 200)
+
+
+class TaskCursorPaginationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email='admin@example.com', password='password123', role=User.Role.ADMIN
+        )
+        cls.alice = User.objects.create_user(email='alice@example.com', password='password123')
+        today = timezone.localdate()
+        # Ties and NULLs on both sides of the page boundaries
+        due_dates = [None, today, None, today + timedelta(days=2), today, None, today - timedelta(days=1)]
+        cls.tasks = [
+            Task.objects.create(
+                title=f'Task {i}', description='d', assigned_to=cls.alice, assigned_by=cls.admin, due_date=due_date,
+            )
+            for i, due_date in enumerate(due_dates)
+        ]
+        Task.objects.create(title="Admin's", description='d', assigned_to=cls.admin, assigned_by=cls.admin)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.alice)
+
+    def page_through(self, params):
+        rows, response = [], self.client.get('/api/v1/tasks/', {'page_size': 2, **params})
+        while True:
+            self.assertEqual(response.status_code, 200)
+            rows += response.data['results']
+            if not response.data['next']:
+                return [row['title'] for row in rows]
+            response = self.client.get(response.data['next'])
+
+    def test_pages_through_nullable_due_dates_in_both_directions(self):
+        def key(task):
+            # NULL due dates sort as the largest value, ids break ties
+            return (task.due_date is None, task.due_date or date.min, task.pk)
+
+        ascending = [task.title for task in sorted(self.tasks, key=key)]
+        self.assertEqual(self.page_through({'ordering': 'due_date'}), ascending)
+        self.assertEqual(self.page_through({'ordering': '-due_date'}), ascending[::-1])
+
+    def test_invalid_cursors_are_not_found(self):
+        first = self.client.get('/api/v1/tasks/', {'page_size': 2, 'ordering': 'due_date'})
+        other_ordering = first.data['next'].replace('ordering=due_date', 'ordering=-due_date')
+        self.assertEqual(self.client.get(other_ordering).status_code, 404)
+
+        for cursor in ['not-a-cursor', 'e30=', 'bm90IGpzb24=', 'Ã©']:
+            with self.subTest(cursor=cursor):
+                self.assertEqual(self.client.get('/api/v1/tasks/', {'cursor': cursor}).status_code, 404)
+
+    def test_stream_exports_every_visible_task_as_ndjson(self):
+        response = self.client.get('/api/v1/tasks/', {'stream': '1', 'page_size': 2})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        self.assertIn('attachment', response['Content-Disposition'])
+        lines = [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+        # Not paginated, and only the user's own tasks
+        self.assertEqual(sorted(line['title'] for line in lines), sorted(task.title for task in self.tasks))
+        listed = self.client.get('/api/v1/tasks/', {'page_size': 50}).json()['results']
+        self.assertEqual(sorted(lines, key=lambda line: line['id']), sorted(listed, key=lambda row: row['id']))
+
+
+class TaskSearchFilterTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email='admin@example.com', password='password123', role=User.Role.ADMIN
+        )
+        make = lambda title, description: Task.objects.create(
+            title=title, description=description, assigned_to=cls.admin, assigned_by=cls.admin,
+        )
+        cls.in_description = make('Monthly sync', 'Go over the budget numbers')
+        cls.in_title = make('Quarterly budget review', 'Numbers for the board')
+        make('Team lunch', 'Pizza')
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def search(self, term, **params):
+        response = self.client.get('/api/v1/tasks/', {'search': term, **params})
+        self.assertEqual(response.status_code, 200)
+        return [task['title'] for task in response.data['results']]
+
+    def test_only_the_last_word_is_a_prefix(self):
+        search = TaskSearchFilter()
+        self.assertEqual(search.build_tsquery(['quarterly', 'bud']), 'quarterly & bud:*')
+        self.assertEqual(search.build_tsquery(['meet']), 'meet:*')
+        # Anything but words is dropped, so nothing reaches the raw tsquery
+        request = Request(APIRequestFactory().get('/api/v1/tasks/', {'search': "budget' & !review:*"}))
+        self.assertEqual(search.get_search_words(request), ['budget', 'review'])
+
+    @skipIf(connection.vendor == 'postgresql', 'The icontains fallback is for other databases')
+    def test_falls_back_to_icontains(self):
+        self.assertEqual(
+            self.search('BUDGET', ordering='created_at'), ['Monthly sync', 'Quarterly budget review']
+        )
+        self.assertEqual(self.search('numbers board'), ['Quarterly budget review'])
+        self.assertEqual(self.search('budget pizza'), [])
+
+    @skipUnless(connection.vendor == 'postgresql', 'Full-text search needs PostgreSQL')
+    def test_full_text_matches_prefixes_and_ranks_titles_first(self):
+        self.assertEqual(self.search('budg'), ['Quarterly budget review', 'Monthly sync'])
+        self.assertEqual(self.search('quarterly budg'), ['Quarterly budget review'])
+        # Stemmed: "reviews" matches "review"
+        self.assertEqual(self.search('reviews'), ['Quarterly budget review'])
+        # Typos in the title still match through trigram similarity
+        self.assertIn('Quarterly budget review', self.search('quartely'))
+
+    @skipUnless(connection.vendor == 'postgresql', 'Full-text search needs PostgreSQL')
+    def test_explicit_ordering_wins_over_rank_and_pages(self):
+        self.assertEqual(self.search('budg', ordering='created_at'), ['Monthly sync', 'Quarterly budget review'])
+        first = self.client.get('/api/v1/tasks/', {'search': 'budg', 'page_size': 1})
+        second = self.client.get(first.data['next'])
+        self.assertEqual(
+            [first.data['results'][0]['title'], second.data['results'][0]['title']],
+            ['Quarterly budget review', 'Monthly sync'],
+        )
+
+
+class TaskSparseFieldsetTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email='admin@example.com', password='password123', role=User.Role.ADMIN
+        )
+        alice = User.objects.create_user(email='alice@example.com', password='password123', first_name='Alice')
+        today = timezone.localdate()
+        for i, due_date in enumerate([None, today - timedelta(days=1), today + timedelta(days=3)]):
+            Task.objects.create(
+                title=f'Task {i}', description='Long description', assigned_to=alice,
+                assigned_by=cls.admin, due_date=due_date, status='COMPLETED' if i == 2 else 'ASSIGNED',
+            )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_fast_path_matches_task_serializer(self):
+        expected = TaskSerializer(Task.objects.with_people().order_by('-created_at', '-id'), many=True).data
+        self.assertEqual(self.client.get('/api/v1/tasks/').json()['results'], json.loads(json.dumps(
+            expected, cls=JSONEncoder
+        )))
+
+    def test_only_requested_columns_are_selected(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/v1/tasks/', {'fields': 'id,title,status', 'page_size': 2})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.data['results'][0]), ['id', 'title', 'status'])
+        page_sql = queries[-1]['sql']
+        self.assertNotIn('description', page_sql)
+        self.assertNotIn('email', page_sql)
+
+        # The cursor still works without the sort key in the output
+        next_page = self.client.get(response.data['next'])
+        self.assertEqual(len(next_page.data['results']), 1)
+
+    def test_unknown_fields_are_rejected(self):
+        response = self.client.get('/api/v1/tasks/', {'fields': 'id,password'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_stream_honours_fields(self):
+        response = self.client.get('/api/v1/tasks/', {'stream': '1', 'fields': 'title,is_overdue'})
+        lines = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual(sorted(line['title'] for line in lines if line['is_overdue']), ['Task 1'])
+        self.assertEqual(set(lines[0]), {'title', 'is_overdue'})
+
+
+class TaskIdOrderingTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        admin = User.objects.create_user(email='admin@example.com', password='password123', role=User.Role.ADMIN)
+        self.created = [
+            Task.objects.create(title=f'Task {i}', assigned_to=admin, assigned_by=admin).pk for i in range(5)
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(admin)
+
+    def test_new_ids_are_time_ordered(self):
+        self.assertTrue(all(pk.version == 7 for pk in self.created))
+        self.assertEqual(sorted(self.created), self.created)
+
+    def page_through(self, params):
+        rows, response = [], self.client.get('/api/v1/tasks/', {'ordering': '-id', 'page_size': 2, **params})
+        while True:
+            rows += response.data['results']
+            if not response.data['next']:
+                return rows
+            response = self.client.get(response.data['next'])
+
+    def test_cursor_pages_by_id(self):
+        self.assertEqual([row['id'] for row in self.page_through({})], [str(pk) for pk in reversed(self.created)])
+        # Values fast path: the cursor is built from the id even when it isn't output
+        self.assertEqual(
+            [row['title'] for row in self.page_through({'fields': 'title'})], [f'Task {i}' for i in range(4, -1, -1)]
+        )
+
+
+@override_settings(TASK_CHANGES_LOOKBACK=0)
+class TaskChangesFeedTests(TestCase):
+
+    def setUp(self):
+        self.admin = User.objects.create_user(email='admin@example.com', password='password123', role=User.Role.ADMIN)
+        self.alice = User.objects.create_user(email='alice@example.com', password='password123')
+        self.bob = User.objects.create_user(email='bob@example.com', password='password123')
+        self.tasks = [
+            Task.objects.create(title=f'Task {i}', assigned_to=self.alice, assigned_by=self.admin) for i in range(4)
+        ]
+        Task.objects.create(title="Bob's", assigned_to=self.bob, assigned_by=self.admin)
+        self.client = APIClient()
+        self.client.force_authenticate(self.alice)
+        self.admin_client = APIClient()
+        self.admin_client.force_authenticate(self.admin)
+
+    def sync(self, client, cursor=None):
+        response = client.get('/api/v1/tasks/changes/', {'since': cursor} if cursor else {})
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_initial_sync_then_only_changes_and_tombstones(self):
+        initial = self.sync(self.client)
+        self.assertEqual([task['title'] for task in initial['tasks']], [f'Task {i}' for i in range(4)])
+        self.assertEqual(initial['deleted'], [])
+
+        changed, deleted, reassigned, _ = self.tasks
+        self.client.patch(f'/api/v1/tasks/{changed.pk}/', {'status': 'IN_PROGRESS'}, format='json')
+        self.admin_client.delete(f'/api/v1/tasks/{deleted.pk}/')
+        self.admin_client.patch(f'/api/v1/tasks/{reassigned.pk}/', {'assigned_to': str(self.bob.pk)}, format='json')
+
+        delta = self.sync(self.client, initial['cursor'])
+        self.assertEqual([(task['id'], task['status']) for task in delta['tasks']], [(str(changed.pk), 'IN_PROGRESS')])
+        self.assertEqual(delta['deleted'], [deleted.pk, reassigned.pk])
+        self.assertFalse(delta['has_more'])
+
+        nothing = self.sync(self.client, delta['cursor'])
+        self.assertEqual((nothing['tasks'], nothing['deleted']), ([], []))
+
+    def test_admins_only_get_deletes_as_tombstones(self):
+        cursor = self.sync(self.admin_client)['cursor']
+        moved, deleted = self.tasks[:2]
+        self.admin_client.patch(f'/api/v1/tasks/{moved.pk}/', {'assigned_to': str(self.bob.pk)}, format='json')
+        self.admin_client.delete('/api/v1/tasks/bulk/', {'ids': [str(deleted.pk)]}, format='json')
+
+        delta = self.sync(self.admin_client, cursor)
+        self.assertEqual([task['id'] for task in delta['tasks']], [str(moved.pk)])
+        self.assertEqual(delta['deleted'], [deleted.pk])
+
+    def test_bulk_writes_are_one_change_and_pages_follow_the_cursor(self):
+        cursor = self.sync(self.client)['cursor']
+        self.admin_client.patch('/api/v1/tasks/bulk/', [
+            {'id': str(task.pk), 'status': 'COMPLETED'} for task in self.tasks[:3]
+        ], format='json')
+        self.client.patch(f'/api/v1/tasks/{self.tasks[3].pk}/', {'status': 'ACCEPTED'}, format='json')
+
+        with mock.patch.object(TaskViewSet, 'changes_page_size', 2):
+            first = self.sync(self.client, cursor)
+            second = self.sync(self.client, first['cursor'])
+        # The bulk write isn't split across pages
+        self.assertEqual(len(first['tasks']), 3)
+        self.assertTrue(first['has_more'])
+        self.assertEqual([task['status'] for task in second['tasks']], ['ACCEPTED'])
+        self.assertFalse(second['has_more'])
+
+    @override_settings(TASK_CHANGES_LOOKBACK=60)
+    def test_recent_changes_are_sent_again(self):
+        # They may sit below a write that hasn't committed yet
+        initial = self.sync(self.client)
+        again = self.sync(self.client, initial['cursor'])
+        self.assertEqual(len(again['tasks']), 4)
+
+    def test_old_and_invalid_cursors_are_refused(self):
+        cursor = self.sync(self.client)['cursor']
+        with override_settings(TASK_TOMBSTONE_RETENTION_DAYS=0, TASK_CHANGES_LOOKBACK=5):
+            self.assertEqual(self.client.get('/api/v1/tasks/changes/', {'since': cursor}).status_code, 410)
+        self.assertEqual(self.client.get('/api/v1/tasks/changes/', {'since': 'nope'}).status_code, 400)
+
+    def test_old_tombstones_are_pruned(self):
+        self.tasks[0].delete()
+        with override_settings(TASK_TOMBSTONE_RETENTION_DAYS=0):
+            call_command('prune_task_tombstones', stdout=StringIO())
+        self.assertFalse(TaskTombstone.objects.exists())
+
+
+class TaskImportExportTests(TestCase):
+
+    def setUp(self):
+        self.admin = User.objects.create_user(email='admin@example.com', password='password123', role=User.Role.ADMIN)
+        self.alice = User.objects.create_user(email='alice@example.com', password='password123')
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def upload(self, name, content, **params):
+        upload = SimpleUploadedFile(name, content.encode())
+        query = f"?{'&'.join(f'{key}={value}' for key, value in params.items())}" if params else ''
+        return self.client.post(f'/api/v1/tasks/import/{query}', {'file': upload}, format='multipart')
+
+    def test_csv_import_resolves_emails_and_updates_counters(self):
+        content = (
+            'title,description,status,priority,due_date,assignee_email\n'
+            'Onboard,"Laptop, badge",ACCEPTED,HIGH,2030-01-02,alice@example.com\n'
+            'Paperwork,Sign forms,,,,alice@example.com\n'
+        )
+        with CaptureQueriesContext(connection) as queries:
+            response = self.upload('tasks.csv', content)
+
+        self.assertEqual(response.status_code, 201)
+        # One batched email lookup and one write for the chunk. On PostgreSQL
+        # that is a COPY, sent through the raw cursor, so not captured
+        self.assertEqual(sum('FROM "users_user"' in query['sql'] for query in queries), 1)
+        inserts = sum(query['sql'].startswith('INSERT INTO "tasks_task"') for query in queries)
+        self.assertEqual(inserts, 0 if connection.vendor == 'postgresql' else 1)
+        self.assertEqual(Task.objects.count(), 2)
+        self.assertEqual(response.data['imported'], 2)
+        onboard, paperwork = Task.objects.order_by('title')
+        self.assertEqual((onboard.assigned_to, onboard.assigned_by, onboard.description), (self.alice, self.admin, 'Laptop, badge'))
+        self.assertEqual((paperwork.status, paperwork.priority, paperwork.due_date), ('ASSIGNED', 'MEDIUM', None))
+        self.assertEqual(self.client.get('/api/v1/tasks/stats/').data['total'], 2)
+
+    def test_invalid_rows_abort_the_import_unless_skipped(self):
+        content = '\n'.join([
+            json.dumps({'title': 'Fine', 'description': 'ok', 'assignee_email': 'alice@example.com'}),
+            json.dumps({'title': 'Bad status', 'description': 'x', 'status': 'NOPE', 'assigned_to': str(self.alice.pk)}),
+            json.dumps({'title': 'Nobody', 'description': 'x', 'assignee_email': 'ghost@example.com'}),
+            '[1, 2]',
+        ])
+        response = self.upload('tasks.jsonl', content)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([error['line'] for error in response.data['errors']], [2, 3, 4])
+        self.assertIn('status', response.data['errors'][0]['errors'])
+        self.assertFalse(Task.objects.exists())
+
+        response = self.upload('tasks.jsonl', content, skip_invalid=1)
+        self.assertEqual((response.status_code, response.data['imported']), (201, 1))
+        self.assertEqual(list(Task.objects.values_list('title', flat=True)), ['Fine'])
+
+    def test_import_and_export_are_admin_only(self):
+        self.client.force_authenticate(self.alice)
+        self.assertEqual(self.upload('tasks.csv', 'title\n').status_code, 403)
+        self.assertEqual(self.client.get('/api/v1/tasks/export/').status_code, 403)
+
+    def test_export_round_trips_through_the_commands(self):
+        Task.objects.create(title='Quarterly report', description='Numbers\nand "quotes"', assigned_to=self.alice,
+                            assigned_by=self.admin, due_date=date(2030, 1, 2))
+        response = self.client.get('/api/v1/tasks/export/')
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertIn(b'alice@example.com', b''.join(response.streaming_content))
+
+        with tempfile.TemporaryDirectory() as directory:
+            for extension in ('csv', 'jsonl'):
+                path = str(Path(directory) / f'tasks.{extension}')
+                call_command('export_tasks', path, stderr=StringIO())
+                call_command('import_tasks', path, created_by='admin@example.com', stdout=StringIO())
+
+        copies = Task.objects.filter(title='Quarterly report').values_list('description', 'due_date', 'assigned_to')
+        self.assertEqual(set(copies), {('Numbers\nand "quotes"', date(2030, 1, 2), self.alice.pk)})
+        self.assertEqual(len(copies), 4)
+
+    def test_exports_format_timestamps_alike(self):
+        task = Task.objects.create(title='Report', description='d', assigned_to=self.alice, assigned_by=self.admin)
+        expected = task.created_at.astimezone(dt_timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+        csv_rows = b''.join(self.client.get('/api/v1/tasks/export/').streaming_content).decode().splitlines()
+        jsonl = b''.join(self.client.get('/api/v1/tasks/export/', {'type': 'jsonl'}).streaming_content)
+
+        self.assertIn(f',{expected},', csv_rows[1])
+        self.assertEqual(json.loads(jsonl)['created_at'], expected)
+
+    def test_import_command_reports_errors(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.csv') as source:
+            source.write('title,description,assignee_email\nNo description,,alice@example.com\n')
+            source.flush()
+            with self.assertRaisesMessage(CommandError, 'Nothing imported: 0 valid, 1 invalid'):
+                call_command('import_tasks', source.name, created_by='admin@example.com', stderr=StringIO())
+
+
+@override_settings(TASK_LIST_CACHE_TIMEOUT=60)
+class TaskArchiveTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_user(email='admin@example.com', password='password123', role=User.Role.ADMIN)
+        self.alice = User.objects.create_user(email='alice@example.com', password='password123')
+        self.bob = User.objects.create_user(email='bob@example.com', password='password123')
+        make = lambda title, assignee, status: Task.objects.create(
+            title=title, description='d', assigned_to=assignee, assigned_by=self.admin, status=status,
+        )
+        self.old_done = make('Old done', self.alice, 'COMPLETED')
+        self.old_open = make('Old open', self.alice, 'IN_PROGRESS')
+        self.recent_done = make('Recent done', self.alice, 'COMPLETED')
+        self.bobs_done = make("Bob's done", self.bob, 'COMPLETED')
+        # update() leaves updated_at alone
+        Task.objects.exclude(pk=self.recent_done.pk).update(updated_at=timezone.now() - timedelta(days=120))
+        self.client = APIClient()
+        self.client.force_authenticate(self.alice)
+
+    def titles(self, params=None):
+        response = self.client.get('/api/v1/tasks/', params or {})
+        self.assertEqual(response.status_code, 200)
+        return {task['title'] for task in response.data['results']}
+
+    def test_archives_only_old_completed_tasks_in_batches(self):
+        out = StringIO()
+        call_command('archive_tasks', '--days', '90', '--batch-size', '1', stdout=out)
+
+        self.assertIn('Archived 2 ', out.getvalue())
+        self.assertEqual(set(ArchivedTask.objects.values_list('pk', flat=True)), {self.old_done.pk, self.bobs_done.pk})
+        self.assertFalse(Task.objects.filter(pk__in=[self.old_done.pk, self.bobs_done.pk]).exists())
+        archived = ArchivedTask.objects.get(pk=self.old_done.pk)
+        self.assertEqual((archived.title, archived.created_at), (self.old_done.title, self.old_done.created_at))
+        self.assertIsNotNone(archived.archived_at)
+
+    def test_archived_tasks_are_listed_and_retrieved_only_on_request(self):
+        self.assertIn('Old done', self.titles())
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('archive_tasks', stdout=StringIO())
+
+        # The list cache was dropped with the move
+        self.assertEqual(self.titles(), {'Old open', 'Recent done'})
+        self.assertEqual(self.titles({'include_archived': '1'}), {'Old done', 'Old open', 'Recent done'})
+        self.assertEqual(self.titles({'include_archived': '1', 'status': 'COMPLETED'}), {'Old done', 'Recent done'})
+
+        url = f'/api/v1/tasks/{self.old_done.pk}/'
+        self.assertEqual(self.client.get(url).status_code, 404)
+        response = self.client.get(url, {'include_archived': '1'})
+        self.assertEqual((response.status_code, response.data['title']), (200, 'Old done'))
+        # Read-only, and still only the assignee's
+        self.assertEqual(self.client.patch(f'{url}?include_archived=1', {'status': 'ASSIGNED'}).status_code, 404)
+        url = f'/api/v1/tasks/{self.bobs_done.pk}/'
+        self.assertEqual(self.client.get(url, {'include_archived': '1'}).status_code, 404)
+
+    def test_stats_keep_counting_archived_tasks(self):
+        before = self.client.get('/api/v1/tasks/stats/').data
+        call_command('archive_tasks', stdout=StringIO())
+
+        self.assertEqual(self.client.get('/api/v1/tasks/stats/').data, before)
+        self.assertEqual(count_tasks(), stored_counts())
+
+
+class TaskListCacheTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email='admin@example.com', password='password123', role=User.Role.ADMIN
+        )
+        cls.alice = User.objects.create_user(email='alice@example.com', password='password123')
+        cls.bob = User.objects.create_user(email='bob@example.com', password='password123')
+        cls.task = Task.objects.create(
+            title='Write report', description='Quarterly', assigned_to=cls.alice, assigned_by=cls.admin
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def get_list(self, user, params=None):
+        self.client.force_authenticate(user)
+        return self.client.get('/api/v1/tasks/', params or {})
+
+    def test_repeated_list_is_served_from_cache(self):
+        self.assertEqual(self.get_list(self.alice, {'status': 'ASSIGNED', 'priority': 'MEDIUM'})['X-Cache'], 'MISS')
+        # Only the ETag validators still hit the database
+        with self.assertNumQueries(1):
+            response = self.get_list(self.alice, {'priority': 'MEDIUM', 'status': 'ASSIGNED'})
+        self.assertEqual(response['X-Cache'], 'HIT')
+        self.assertEqual(len(response.data['results']), 1)
+
+    def test_cache_is_per_user(self):
+        self.get_list(self.alice)
+        response = self.get_list(self.bob)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['results'], [])
+
+    def test_task_changes_invalidate_assignee_and_admin_lists(self):
+        self.get_list(self.alice)
+        self.get_list(self.admin)
+
+        self.task.status = Task.Status.COMPLETED
+        self.task.save()
+
+        for user in (self.alice, self.admin):
+            response = self.get_list(user)
+            self.assertEqual(response['X-Cache'], 'MISS')
+            self.assertEqual(response.data['results'][0]['status'], 'COMPLETED')
+
+    def test_lists_cached_before_the_commit_are_invalidated(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.status = Task.Status.COMPLETED
+            self.task.save()
+            # Read inside the write's transaction window
+            self.assertEqual(self.get_list(self.alice)['X-Cache'], 'MISS')
+            self.assertEqual(self.get_list(self.alice)['X-Cache'], 'HIT')
+
+        self.assertEqual(self.get_list(self.alice)['X-Cache'], 'MISS')
+
+    def test_reassignment_invalidates_previous_assignee(self):
+        self.get_list(self.alice)
+
+        task = Task.objects.get(pk=self.task.pk)
+        task.assigned_to = self.bob
+        task.save()
+
+        self.assertEqual(self.get_list(self.alice).data['results'], [])
+        self.assertEqual(len(self.get_list(self.bob).data['results']), 1)
+
+    def test_stats_report_hit_rate(self):
+        self.get_list(self.alice)
+        self.get_list(self.alice)
+
+        self.get_list(self.admin)
+        response = self.client.get('/api/v1/tasks/cache-stats/')
+        self.assertEqual(response.data['hits'], 1)
+        self.assertEqual(response.data['misses'], 2)
+
+
+class TaskConditionalRequestTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email='admin@example.com', password='password123', role=User.Role.ADMIN
+        )
+        cls.alice = User.objects.create_user(email='alice@example.com', password='password123')
+        cls.task = Task.objects.create(
+            title='Write report', description='Quarterly', assigned_to=cls.alice, assigned_by=cls.admin
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+        self.detail_url = f'/api/v1/tasks/{self.task.pk}/'
+
+    def test_unchanged_list_returns_304(self):
+        etag = self.client.get('/api/v1/tasks/')['ETag']
+
+        response = self.client.get('/api/v1/tasks/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_list_etag_changes_after_a_write(self):
+        etag = self.client.get('/api/v1/tasks/')['ETag']
+        self.client.patch(self.detail_url, {'status': 'ACCEPTED'})
+
+        response = self.client.get('/api/v1/tasks/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_unchanged_detail_returns_304_without_loading_the_row(self):
+        etag = self.client.get(self.detail_url)['ETag']
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_if_match_rejects_stale_updates(self):
+        etag = self.client.get(self.detail_url)['ETag']
+
+        first = self.client.patch(self.detail_url, {'priority': 'HIGH'}, HTTP_IF_MATCH=etag)
+        self.assertEqual(first.status_code, 200)
+        self.assertNotEqual(first['ETag'], etag)
+
+        # A second admin still holding the old ETag must not overwrite it
+        second = self.client.patch(self.detail_url, {'priority': 'LOW'}, HTTP_IF_MATCH=etag)
+        self.assertEqual(second.status_code, 412)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.priority, 'HIGH')
+
+    @override_settings(SHARED_CACHE=False)
+    def test_user_rename_changes_etags_without_a_shared_cache(self):
+        list_etag = self.client.get('/api/v1/tasks/')['ETag']
+        detail_etag = self.client.get(self.detail_url)['ETag']
+
+        # Renamed by another worker: this process's generation never moves
+        with mock.patch('apps.tasks.signals.task_list_cache.invalidate_all'):
+            self.alice.first_name = 'Alicia'
+            self.alice.save()
+
+        response = self.client.get('/api/v1/tasks/', HTTP_IF_NONE_MATCH=list_etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'][0]['assignee_name'], 'Alicia')
+        self.assertEqual(self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=detail_etag).status_code, 200)
+
+
+class TaskBulkEndpointTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email='admin@example.com', password='password123', role=User.Role.ADMIN
+        )
+        cls.alice = User.objects.create_user(email='alice@example.com', password='password123')
+        cls.bob = User.objects.create_user(email='bob@example.com', password='password123')
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def make_tasks(self, count, assignee):
+        return Task.objects.bulk_create([
+            Task(title=f'Task {i}', description='d', assigned_to=assignee, assigned_by=self.admin)
+            for i in range(count)
+        ])
+
+    def test_bulk_create_is_one_insert(self):
+        self.client.force_authenticate(self.admin)
+        payload = [
+            {'title': f'Task {i}', 'description': 'd', 'assigned_to': str(self.alice.pk)}
+            for i in range(50)
+        ]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post('/api/v1/tasks/bulk/', payload, format='json')
+
+        task_inserts = [q for q in queries if q['sql'].startswith('INSERT INTO "tasks_task"')]
+        self.assertEqual(len(task_inserts), 1)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.data), 50)
+        self.assertEqual(Task.objects.filter(assigned_by=self.admin).count(), 50)
+
+    def test_bulk_create_reports_errors_per_item_and_writes_nothing(self):
+        self.client.force_authenticate(self.admin)
+        payload = [
+            {'title': 'Fine', 'description': 'd', 'assigned_to': str(self.alice.pk)},
+            {'title': 'No assignee', 'description': 'd'},
+        ]
+
+        response = self.client.post('/api/v1/tasks/bulk/', payload, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([item['index'] for item in response.data['message']['items']], ['1'])
+        self.assertFalse(Task.objects.exists())
+
+    def test_users_cannot_bulk_create(self):
+        self.client.force_authenticate(self.alice)
+        response = self.client.post('/api/v1/tasks/bulk/', [{'title': 'x'}], format='json')
+        self.assertEqual(response.status_code, 403)
+
+    def test_bulk_status_update_checks_ownership_per_item(self):
+        mine = self.make_tasks(2, self.alice)
+        theirs = self.make_tasks(1, self.bob)
+        self.client.force_authenticate(self.alice)
+
+        payload = [{'id': str(task.pk), 'status': 'COMPLETED'} for task in mine + theirs]
+        response = self.client.patch('/api/v1/tasks/bulk/', payload, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([item['index'] for item in response.data['message']['items']], ['2'])
+
+        response = self.client.patch('/api/v1/tasks/bulk/', payload[:2], format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            Task.objects.filter(assigned_to=self.alice, status='COMPLETED').count(), 2
+        )
+
+    def test_bulk_delete_is_admin_only(self):
+        tasks = self.make_tasks(3, self.alice)
+        ids = [str(task.pk) for task in tasks]
+
+        self.client.force_authenticate(self.alice)
+        response = self.client.delete('/api/v1/tasks/bulk/', {'ids': ids}, format='json')
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(Task.objects.filter(pk__in=ids).count(), 3)
+
+        self.client.force_authenticate(self.admin)
+        response = self.client.delete('/api/v1/tasks/bulk/', {'ids': ids}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['deleted'], 3)
+
+
+class TaskStatsTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email='admin@example.com', password='password123', role=User.Role.ADMIN
+        )
+        cls.alice = User.objects.create_user(email='alice@example.com', password='password123')
+        cls.bob = User.objects.create_user(email='bob@example.com', password='password123')
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+        yesterday = timezone.now().date() - timedelta(days=1)
+        self.overdue = Task.objects.create(
+            title='Late', description='d', assigned_to=self.alice, assigned_by=self.admin,
+            due_date=yesterday, priority='HIGH',
+        )
+        self.done = Task.objects.create(
+            title='Done', description='d', assigned_to=self.alice, assigned_by=self.admin,
+            due_date=yesterday, status='COMPLETED',
+        )
+        Task.objects.create(title='Open', description='d', assigned_to=self.bob, assigned_by=self.admin)
+
+    def get_stats(self):
+        return self.client.get('/api/v1/tasks/stats/').data
+
+    def test_stats_match_the_task_table(self):
+        stats = self.get_stats()
+
+        self.assertEqual(stats['total'], 3)
+        self.assertEqual(stats['by_status']['COMPLETED'], 1)
+        self.assertEqual(stats['by_priority']['HIGH'], 1)
+        self.assertEqual(stats['overdue'], sum(task.is_overdue() for task in Task.objects.all()))
+        per_user = {row['assigned_to']: row for row in stats['by_assignee']}
+        self.assertEqual(per_user[self.alice.pk]['overdue'], 1)
+        self.assertEqual(per_user[self.bob.pk]['total'], 1)
+
+    def test_counters_follow_updates_reassignments_and_deletes(self):
+        self.client.patch(f'/api/v1/tasks/{self.overdue.pk}/', {'status': 'COMPLETED'})
+        self.client.patch(f'/api/v1/tasks/{self.done.pk}/', {'assigned_to': str(self.bob.pk)})
+        self.client.delete('/api/v1/tasks/bulk/', {'ids': [str(self.overdue.pk)]}, format='json')
+
+        stats = self.get_stats()
+        self.assertEqual(stats['total'], 2)
+        self.assertEqual(stats['overdue'], 0)
+        per_user = {row['assigned_to']: row for row in stats['by_assignee'] if row['total']}
+        self.assertEqual(list(per_user), [self.bob.pk])
+
+    def test_users_only_see_their_own_counts(self):
+        self.client.force_authenticate(self.bob)
+        stats = self.get_stats()
+        self.assertEqual(stats['total'], 1)
+        self.assertNotIn('by_assignee', stats)
+
+    def test_reconcile_rebuilds_drifted_counters(self):
+        TaskCounter.objects.update(count=0)
+        out = StringIO()
+
+        call_command('reconcile_task_counters', stdout=out)
+
+        self.assertIn('drifted', out.getvalue())
+        self.assertEqual(self.get_stats()['total'], 3)
+
+
+class OverdueTaskTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email='admin@example.com', password='password123', role=User.Role.ADMIN
+        )
+        cls.alice = User.objects.create_user(email='alice@example.com', password='password123')
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+        today = timezone.localdate()
+        self.late = self.create_task('Late', due_date=today - timedelta(days=1))
+        self.create_task('Done', due_date=today - timedelta(days=1), status='COMPLETED')
+        self.create_task('Today', due_date=today)
+        self.create_task('Undated')
+
+    def create_task(self, title, **fields):
+        return Task.objects.create(
+            title=title, description='d', assigned_to=self.alice, assigned_by=self.admin, **fields
+        )
+
+    def titles(self, **params):
+        response = self.client.get('/api/v1/tasks/', params)
+        return {task['title']: task['is_overdue'] for task in response.data['results']}
+
+    def test_overdue_filter(self):
+        self.assertEqual(self.titles(overdue='true'), {'Late': True})
+        self.assertEqual(
+            self.titles(overdue='false'), {'Done': False, 'Today': False, 'Undated': False}
+        )
+        self.assertEqual(len(self.titles()), 4)
+
+    def test_filter_and_python_rule_agree(self):
+        today = timezone.localdate()
+        for status in Task.Status.values:
+            for due_date in (None, today - timedelta(days=1), today, today + timedelta(days=1)):
+                self.create_task(f'{status} {due_date}', status=status, due_date=due_date)
+
+        tasks = Task.objects.all()
+        self.assertEqual(
+            set(tasks.filter(overdue_filter()).values_list('pk', flat=True)),
+            {task.pk for task in tasks if task.is_overdue()},
+        )
+
+    def test_uses_the_configured_time_zone_date(self):
+        # 20:00 UTC on Jan 1st is already Jan 2nd in Asia/Kolkata
+        now = datetime(2026, 1, 1, 20, 0, tzinfo=dt_timezone.utc)
+        task = self.create_task('Due Jan 1st', due_date=date(2026, 1, 1))
+
+        with mock.patch('django.utils.timezone.now', return_value=now):
+            self.assertTrue(task.is_overdue())
+            self.assertTrue(Task.objects.overdue().filter(pk=task.pk).exists())
+
+    def test_flag_command_stamps_and_clears_overdue_since(self):
+        today = timezone.localdate()
+        received = []
+
+        def receive(sender, task_ids, date, **kwargs):
+            received.append(task_ids)
+
+        tasks_overdue.connect(receive)
+        self.addCleanup(tasks_overdue.disconnect, receive)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('flag_overdue_tasks', batch_size=1, stdout=StringIO())
+        self.assertEqual(list(Task.objects.filter(overdue_since=today)), [self.late])
+        self.assertEqual(received, [[self.late.pk]])
+
+        # Nothing new on a second run
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('flag_overdue_tasks', stdout=StringIO())
+        self.assertEqual(len(received), 1)
+
+        self.client.patch(f'/api/v1/tasks/{self.late.pk}/', {'status': 'COMPLETED'})
+        call_command('flag_overdue_tasks', stdout=StringIO())
+        self.assertFalse(Task.objects.filter(overdue_since__isnull=False).exists())
+
+
+class TaskEventStreamTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email='admin@example.com', password='password123', role=User.Role.ADMIN
+        )
+        cls.alice = User.objects.create_user(email='alice@example.com', password='password123')
+        cls.bob = User.objects.create_user(email='bob@example.com', password='password123')
+
+    def setUp(self):
+        cache.clear()
+        events._broker = events.TaskEventBroker()
+        self.start_id = events._broker.last_id
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def tearDown(self):
+        events._broker = None
+
+    def visible_to(self, user):
+        return [
+            scoped for event in events.get_broker().replay(self.start_id)
+            if (scoped := events.scope_event(event, user))
+        ]
+
+    def test_changes_are_published_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/v1/tasks/', {
+                'title': 'New', 'description': 'd', 'assigned_to': str(self.alice.pk),
+            }, format='json')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(f"/api/v1/tasks/{response.data['id']}/")
+
+        published = events.get_broker().replay(self.start_id)
+        self.assertEqual([event['type'] for event in published], ['created', 'deleted'])
+        self.assertEqual(published[0]['task']['title'], 'New')
+
+    def test_events_follow_visibility_rules(self):
+        task = Task.objects.create(title='T', description='d', assigned_to=self.alice, assigned_by=self.admin)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(f'/api/v1/tasks/{task.pk}/', {'assigned_to': str(self.bob.pk)}, format='json')
+
+        self.assertEqual([e['type'] for e in self.visible_to(self.admin)], ['updated'])
+        self.assertEqual([e['type'] for e in self.visible_to(self.bob)], ['updated'])
+        # Reassigned away from alice: it leaves her list
+        self.assertEqual(self.visible_to(self.alice), [{'type': 'deleted', 'task': {'id': str(task.pk)}}])
+
+    def test_bulk_writes_are_published(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post('/api/v1/tasks/bulk/', [
+                {'title': f'Task {i}', 'description': 'd', 'assigned_to': str(self.bob.pk)}
+                for i in range(3)
+            ], format='json')
+
+        self.assertEqual(len(self.visible_to(self.bob)), 3)
+        self.assertEqual(self.visible_to(self.alice), [])
+
+    def test_bulk_writes_publish_one_batch(self):
+        broker = events.get_broker()
+        with mock.patch.object(broker, 'send', wraps=broker.send) as send:
+            with self.captureOnCommitCallbacks(execute=True):
+                created = self.client.post('/api/v1/tasks/bulk/', [
+                    {'title': f'Task {i}', 'description': 'd', 'assigned_to': str(self.bob.pk)}
+                    for i in range(3)
+                ], format='json')
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.delete('/api/v1/tasks/bulk/', {'ids': [task['id'] for task in created.data]}, format='json')
+
+        self.assertEqual([len(call.args[0]) for call in send.call_args_list], [3, 3])
+        self.assertEqual([e['type'] for e in self.visible_to(self.bob)], ['created'] * 3 + ['deleted'] * 3)
+
+    def test_resume_from_a_buffer_that_moved_on(self):
+        broker = events.get_broker()
+        self.assertEqual(broker.replay(broker.last_id), [])
+        self.assertIsNone(broker.replay(self.start_id - 10))
+
+    async def test_stream_tickets_are_single_use(self):
+        self.client.force_authenticate(self.alice)
+        ticket = (await sync_to_async(self.client.post)('/api/v1/tasks/events/ticket/')).data['ticket']
+        self.assertNotIn(str(AccessToken.for_user(self.alice)), ticket)
+
+        client = AsyncClient()
+        response = await client.get('/api/v1/tasks/events/', {'ticket': ticket})
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        await response.streaming_content.aclose()
+
+        self.assertEqual((await client.get('/api/v1/tasks/events/', {'ticket': ticket})).status_code, 401)
+        self.assertEqual((await client.get('/api/v1/tasks/events/', {'ticket': 'forged'})).status_code, 401)
+        # Access tokens are not accepted in the URL
+        token = str(AccessToken.for_user(self.alice))
+        self.assertEqual((await client.get('/api/v1/tasks/events/', {'token': token})).status_code, 401)
+
+    def test_stream_is_not_served_under_wsgi(self):
+        response = self.client.get('/api/v1/tasks/events/')
+        self.assertEqual(response.status_code, 501)
+        self.assertEqual(response['Content-Type'], 'application/json')
+
+    async def test_stream_replays_missed_events(self):
+        task = await Task.objects.acreate(
+            title='T', description='d', assigned_to=self.alice, assigned_by=self.admin
+        )
+        events.get_broker().publish({
+            **events.describe('updated', task), 'task': {'id': str(task.pk), 'title': 'T'},
+        })
+
+        client = AsyncClient()
+        self.assertEqual((await client.get('/api/v1/tasks/events/')).status_code, 401)
+
+        response = await client.get(
+            '/api/v1/tasks/events/', headers={
+                'Authorization': f'Bearer {AccessToken.for_user(self.alice)}', 'Last-Event-ID': str(self.start_id),
+            },
+        )
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        chunks = []
+        async for chunk in response.streaming_content:
+            chunks.append(chunk.decode())
+            if 'event: updated' in chunk.decode():
+                break
+        await response.streaming_content.aclose()
+
+        self.assertIn(f'id: {self.start_id + 1}\n', chunks[-1])
+        self.assertIn('"title": "T"', chunks[-1])
+
+
+class AsyncTaskViewSetTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email='admin@example.com', password='password123', role=User.Role.ADMIN
+        )
+        cls.alice = User.objects.create_user(email='alice@example.com', password='password123')
+        cls.bob = User.objects.create_user(email='bob@example.com', password='password123')
+        cls.tasks = Task.objects.bulk_create([
+            Task(title=f'Task {i}', description='d', assigned_to=cls.alice if i % 2 else cls.bob,
+                 assigned_by=cls.admin)
+            for i in range(6)
+        ])
+
+    def setUp(self):
+        cache.clear()
+        self.factory = APIRequestFactory()
+
+    async def call(self, actions, user, method='get', path='/api/v1/tasks/', data=None, **kwargs):
+        headers = kwargs.pop('headers', {})
+        request = getattr(self.factory, method)(path, data, format='json' if data else None, headers=headers)
+        force_authenticate(request, user=user)
+        return await AsyncTaskViewSet.as_view(actions)(request, **kwargs)
+
+    async def test_list_matches_the_sync_view(self):
+        request = self.factory.get('/api/v1/tasks/', {'page_size': 2})
+        force_authenticate(request, user=self.alice)
+        sync_response = await sync_to_async(TaskViewSet.as_view({'get': 'list'}))(request)
+
+        response = await self.call({'get': 'list'}, self.alice, data={'page_size': 2})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, sync_response.data)
+        self.assertEqual(response['ETag'], sync_response['ETag'])
+        self.assertIsNotNone(response.data['next'])
+
+    async def test_streams_are_async_iterators(self):
+        response = await self.call({'get': 'list'}, self.alice, data={'stream': '1', 'fields': 'title'})
+        # Sent chunk by chunk under ASGI instead of being read into a list first
+        self.assertTrue(response.is_async)
+        lines = [json.loads(chunk) async for chunk in response.streaming_content]
+        self.assertEqual(sorted(line['title'] for line in lines), ['Task 1', 'Task 3', 'Task 5'])
+
+        response = await self.call({'get': 'export_tasks'}, self.admin, path='/api/v1/tasks/export/')
+        self.assertTrue(response.is_async)
+        content = b''.join([chunk async for chunk in response.streaming_content]).decode()
+        self.assertEqual(len(content.splitlines()), 7)
+
+    async def test_retrieve_is_scoped_and_conditional(self):
+        mine, theirs = self.tasks[1], self.tasks[0]
+        response = await self.call({'get': 'retrieve'}, self.alice, pk=str(mine.pk))
+        self.assertEqual(response.data['title'], mine.title)
+
+        cached = await self.call(
+            {'get': 'retrieve'}, self.alice, pk=str(mine.pk),
+            headers={'If-None-Match': response['ETag']},
+        )
+        self.assertEqual(cached.status_code, 304)
+
+        response = await self.call({'get': 'retrieve'}, self.alice, pk=str(theirs.pk))
+        self.assertEqual(response.status_code, 404)
+
+    async def test_partial_update_saves_and_validates(self):
+        task = self.tasks[1]
+        response = await self.call(
+            {'patch': 'partial_update'}, self.alice, method='patch',
+            path=f'/api/v1/tasks/{task.pk}/', data={'status': 'COMPLETED'}, pk=str(task.pk),
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((await Task.objects.aget(pk=task.pk)).status, 'COMPLETED')
+
+        response = await self.call(
+            {'patch': 'partial_update'}, self.alice, method='patch',
+            path=f'/api/v1/tasks/{task.pk}/', data={'status': 'BOGUS'}, pk=str(task.pk),
+        )
+        self.assertEqual(response.status_code, 400)
+
+        response = await self.call(
+            {'patch': 'partial_update'}, self.admin, method='patch',
+            path=f'/api/v1/tasks/{task.pk}/', data={'status': 'ASSIGNED'}, pk=str(task.pk),
+            headers={'If-Match': '"stale"'},
+        )
+        self.assertEqual(response.status_code, 412)
+
+
+class BenchmarkCommandTests(TestCase):
+
+    def test_results_json_and_regression_mode(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = Path(directory) / 'results.json'
+            call_command(
+                'benchmark_api', tasks=50, users=3, iterations=3, warmup=0,
+                scenarios=['task-detail', 'task-patch-status'], output=str(output), stdout=StringIO(),
+            )
+            results = json.loads(output.read_text())
+
+            self.assertEqual(set(results['scenarios']), {'task-detail', 'task-patch-status'})
+            detail = results['scenarios']['task-detail']
+            self.assertEqual(detail['statuses'], {'200': 3})
+            self.assertGreaterEqual(detail['p99_ms'], detail['p50_ms'])
+
+            # Pretend the baseline needed fewer queries
+            results['scenarios']['task-detail']['queries_max'] = 0
+            output.write_text(json.dumps(results))
+            with self.assertRaisesMessage(CommandError, 'task-detail: queries 0 ->'):
+                call_command(
+                    'benchmark_api', tasks=50, users=3, iterations=3, warmup=0,
+                    scenarios=['task-detail'], baseline=str(output), stdout=StringIO(),
+                )
+        # Everything seeded was rolled back
+        self.assertFalse(Task.objects.exists())
+
+    def test_regressions_ignore_noise_on_fast_scenarios(self):
+        baseline = {'scenarios': {'fast': {'p95_ms': 0.5, 'queries_max': 1}}}
+        results = {'scenarios': {'fast': {'p95_ms': 0.9, 'queries_max': 1}}}
+        self.assertEqual(find_regressions(results, baseline, tolerance=0.2), [])
 
-# Create your tests here.
@@ -0,0 +1,292 @@
+import csv
+import io
+import json
+import time
+import uuid
+from datetime import datetime, timezone as dt_timezone
+from itertools import islice
+
+from django.conf import settings
+from django.db import connection, reset_queries, transaction
+from django.db.models import CharField, F, Func
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.utils.encoders import JSONEncoder
+
+from apps.core.ids import uuid7
+from apps.users.models import User
+from .cache import task_list_cache
+from .changes import next_change_seq
+from .counters import recount_assignees
+from .models import Task
+from .serializers import BulkTaskSerializer
+
+FORMATS = ('csv', 'jsonl')
+
+# What an import reads; other columns (e.g. those of an export) are ignored.
+# The assignee is given by email, or by id as `assigned_to`.
+IMPORT_COLUMNS = ('title', 'description', 'status', 'priority', 'due_date', 'assignee_email', 'assigned_to')
+
+# Export columns: (header, values() lookup)
+EXPORT_COLUMNS = (
+    ('id', 'id'),
+    ('title', 'title'),
+    ('description', 'description'),
+    ('status', 'status'),
+    ('priority', 'priority'),
+    ('assignee_email', 'assigned_to__email'),
+    ('creator_email', 'assigned_by__email'),
+    ('due_date', 'due_date'),
+    ('created_at', 'created_at'),
+    ('updated_at', 'updated_at'),
+)
+
+# Export timestamps, whatever the database: UTC with microseconds, e.g.
+# 2026-10-18T19:59:52.123456Z (strftime and PostgreSQL to_char patterns)
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S.%fZ'
+SQL_TIMESTAMP_FORMAT = 'YYYY-MM-DD"T"HH24:MI:SS.US"Z"'
+TIMESTAMP_COLUMNS = ('created_at', 'updated_at')
+
+# Columns written per imported task, in COPY order
+COPY_FIELDS = (
+    'id', 'created_at', 'updated_at', 'title', 'description', 'status', 'priority',
+    'assigned_to', 'assigned_by', 'due_date', 'change_seq',
+)
+
+
+def guess_format(name, default='csv'):
+    for file_format in FORMATS:
+        if name and name.lower().endswith(('.ndjson', '.jsonl') if file_format == 'jsonl' else '.csv'):
+            return file_format
+    return default
+
+
+def read_rows(stream, file_format):
+    """
+    Yield (line number, row dict) from a binary stream, one line at a time.
+    Empty CSV cells count as missing, so model defaults apply.
+    """
+    text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+    try:
+        if file_format == 'csv':
+            reader = csv.DictReader(text)
+            for row in reader:
+                yield reader.line_num, {key: value for key, value in row.items() if key and value != ''}
+            return
+        for line_number, line in enumerate(text, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                row = None
+            yield line_number, row if isinstance(row, dict) else {'__invalid__': line}
+    finally:
+        # Leave the caller's stream open
+        if not stream.closed:
+            text.detach()
+
+
+class TaskImporter:
+    """
+    Imports tasks from an iterable of rows in chunks of `batch_size`.
+
+    Each chunk resolves its assignee emails with one query, is validated with
+    the same rules as the API (BulkTaskSerializer), then written in one
+    statement: COPY ... FROM STDIN on PostgreSQL, bulk_create elsewhere. Only
+    one chunk is held in memory at a time.
+
+    Everything runs in one transaction. Unless `skip_invalid`, any invalid
+    row rolls the whole import back; the first `max_errors` errors are
+    reported with their line numbers. The stats counters of the assignees are
+    recounted and list caches invalidated; notification emails and live
+    events are not sent for imports (the change feed does see the tasks).
+    """
+    max_errors = 100
+
+    def __init__(self, created_by, batch_size=5000, skip_invalid=False, dry_run=False):
+        self.created_by = created_by
+        self.batch_size = batch_size
+        self.skip_invalid = skip_invalid
+        self.dry_run = dry_run
+        self.valid = self.invalid = self.imported = 0
+        self.errors = []
+        self.elapsed = 0.0
+
+    @property
+    def failed(self):
+        return bool(self.invalid) and not self.skip_invalid
+
+    @property
+    def rate(self):
+        # Rows read per second
+        return (self.valid + self.invalid) / self.elapsed if self.elapsed else 0.0
+
+    def result(self):
+        return {'imported': self.imported, 'valid': self.valid, 'invalid': self.invalid, 'errors': self.errors}
+
+    def run(self, rows):
+        started = time.perf_counter()
+        # Their stats counters are rebuilt at the end
+        assignees = set()
+        rows = iter(rows)
+        with transaction.atomic():
+            while chunk := list(islice(rows, self.batch_size)):
+                tasks = self.validate(chunk)
+                self.valid += len(tasks)
+                # Once failed, keep validating only, to report every error
+                if not self.dry_run and not self.failed:
+                    self.write(tasks)
+                    self.imported += len(tasks)
+                    assignees.update(task['assigned_to'] for task in tasks)
+                # With DEBUG, the logged INSERTs would otherwise pile up
+                if settings.DEBUG:
+                    reset_queries()
+
+            if self.failed or self.dry_run:
+                transaction.set_rollback(True)
+                self.imported = 0
+            elif self.imported:
+                recount_assignees(assignees)
+                transaction.on_commit(task_list_cache.invalidate_all)
+        self.elapsed = time.perf_counter() - started
+        return self
+
+    def validate(self, chunk):
+        """
+        The chunk's valid rows as dicts of COPY_FIELDS values (minus the
+        position fields added by write()); errors are recorded.
+        """
+        emails = {row['assignee_email'].strip() for _, row in chunk if isinstance(row.get('assignee_email'), str)}
+        users_by_email = {user.email: user for user in User.objects.filter(email__in=emails).only('id', 'email')}
+        ids = {str(row['assigned_to']) for _, row in chunk if 'assigned_to' in row}
+        serializer = BulkTaskSerializer(context={
+            'users': {**{user.pk: user for user in users_by_email.values()}, **self.users_by_id(ids)},
+        })
+
+        tasks = []
+        for line, row in chunk:
+            try:
+                tasks.append(self.validate_row(serializer, row, users_by_email))
+            except ValidationError as error:
+                self.invalid += 1
+                if len(self.errors) < self.max_errors:
+                    self.errors.append({'line': line, 'errors': error.detail})
+        return tasks
+
+    def users_by_id(self, ids):
+        pks = []
+        for pk in ids:
+            try:
+                pks.append(uuid.UUID(pk))
+            except ValueError:
+                # Reported by the serializer
+                pass
+        return User.objects.in_bulk(pks) if pks else {}
+
+    def validate_row(self, serializer, row, users_by_email):
+        if '__invalid__' in row:
+            raise ValidationError({'non_field_errors': ['Not a JSON object.']})
+        data = {column: row[column] for column in IMPORT_COLUMNS if column in row}
+        email = data.pop('assignee_email', None)
+        if email is not None and 'assigned_to' not in data:
+            user = users_by_email.get(str(email).strip())
+            if user is None:
+                raise ValidationError({'assignee_email': [f'No user with email {email!r}.']})
+            data['assigned_to'] = user.pk
+        values = serializer.run_validation(data)
+        return {
+            'title': values['title'],
+            'description': values['description'],
+            'status': values.get('status', Task.Status.ASSIGNED),
+            'priority': values.get('priority', Task.Priority.MEDIUM),
+            'assigned_to': values['assigned_to'].pk,
+            'due_date': values.get('due_date'),
+        }
+
+    def write(self, tasks):
+        now, seq = timezone.now(), next_change_seq()
+        for task in tasks:
+            task.update(id=uuid7(), created_at=now, updated_at=now, assigned_by=self.created_by.pk, change_seq=seq)
+        if connection.vendor == 'postgresql':
+            self.copy(tasks)
+        else:
+            Task.objects.bulk_create([
+                Task(**{Task._meta.get_field(name).attname: task[name] for name in COPY_FIELDS}) for task in tasks
+            ], batch_size=1000)
+
+    def copy(self, tasks):
+        fields = [Task._meta.get_field(name) for name in COPY_FIELDS]
+        columns = ', '.join(connection.ops.quote_name(field.column) for field in fields)
+        table = connection.ops.quote_name(Task._meta.db_table)
+        with connection.cursor() as cursor:
+            # The psycopg cursor under Django's wrapper
+            with cursor.cursor.copy(f'COPY {table} ({columns}) FROM STDIN') as copy:
+                for task in tasks:
+                    copy.write_row([task[name] for name in COPY_FIELDS])
+
+
+class UTCTimestamp(Func):
+    """
+    A timestamptz as TIMESTAMP_FORMAT text, for COPY ... TO STDOUT, which
+    would otherwise print it in the session's DateStyle.
+    """
+    template = f"to_char(%(expressions)s AT TIME ZONE 'UTC', '{SQL_TIMESTAMP_FORMAT}')"
+    output_field = CharField()
+
+
+def export_value(value):
+    if isinstance(value, datetime):
+        return value.astimezone(dt_timezone.utc).strftime(TIMESTAMP_FORMAT)
+    return value
+
+
+def export_queryset(queryset, format_in_sql=False):
+    columns = [
+        UTCTimestamp(F(lookup)) if format_in_sql and name in TIMESTAMP_COLUMNS else lookup
+        for name, lookup in EXPORT_COLUMNS
+    ]
+    return queryset.order_by().values_list(*columns)
+
+
+def export_csv(queryset, chunk_size=2000):
+    """
+    Stream tasks as CSV (EXPORT_COLUMNS) in byte chunks: COPY ... TO STDOUT
+    on PostgreSQL, a server-side cursor and the csv module elsewhere.
+    """
+    if connection.vendor == 'postgresql':
+        sql, params = export_queryset(queryset, format_in_sql=True).query.sql_with_params()
+        header = ','.join(name for name, _ in EXPORT_COLUMNS)
+        yield (header + '\n').encode()
+        with connection.cursor() as cursor:
+            with cursor.cursor.copy(f'COPY ({sql}) TO STDOUT WITH (FORMAT csv)', params) as copy:
+                for data in copy:
+                    yield bytes(data)
+        return
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow([name for name, _ in EXPORT_COLUMNS])
+    for index, row in enumerate(export_queryset(queryset).iterator(chunk_size=chunk_size), 1):
+        writer.writerow(map(export_value, row))
+        if index % chunk_size == 0:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+def export_jsonl(queryset, chunk_size=2000):
+    """
+    Stream tasks as JSON lines with the EXPORT_COLUMNS keys, in byte chunks.
+    Timestamps are formatted like export_csv()'s.
+    """
+    names = [name for name, _ in EXPORT_COLUMNS]
+    lines = []
+    for row in export_queryset(queryset).iterator(chunk_size=chunk_size):
+        lines.append(json.dumps(dict(zip(names, map(export_value, row))), cls=JSONEncoder))
+        if len(lines) == chunk_size:
+            yield ('\n'.join(lines) + '\n').encode()
+            lines = []
+    if lines:
+        yield ('\n'.join(lines) + '\n').encode()
@@ -1,12 +1,16 @@
+from django.conf import settings
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import TaskViewSet
+from .views import AsyncTaskViewSet, TaskEventTicketView, TaskViewSet, task_event_stream
 
 app_name = 'tasks'
 
 router = DefaultRouter()
-router.register(r'', TaskViewSet, basename='task')
+router.register(r'', AsyncTaskViewSet if settings.ASYNC_API_VIEWS else TaskViewSet, basename='task')
 
 urlpatterns = [
+    # Before the router, whose detail route would otherwise match 'events/'
+    path('events/', task_event_stream, name='task-events'),
+    path('events/ticket/', TaskEventTicketView.as_view(), name='task-events-ticket'),
     path('', include(router.urls)),
 ]
\ No newline at end of file
@@ -1,30 +1,87 @@
+import json
+import uuid
+
 from rest_framework import viewsets, filters
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import generics, status
 from rest_framework.response import Response
+from rest_framework.decorators import action
+from rest_framework.utils.encoders import JSONEncoder
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.db.models import Count, Max
+from django.contrib.auth import get_user_model
+from django.utils import timezone
 
 #Task Creation
 from .models import Task
-from .serializers import TaskSerializer
-from rest_framework.exceptions import PermissionDenied
+from .serializers import TaskSerializer, BulkTaskSerializer, TaskValuesSerializer
+from .pagination import TaskCursorPagination
+from .filters import TaskFilter, TaskRecordFilter, TaskSearchFilter
+from .cache import task_list_cache
+from .changes import decode_cursor, encode_cursor, next_change_seq, read_changes, record_removals, visible_tombstones
+from .counters import counter_key, record_changes, summarize
+from .events import HEARTBEAT, RESET, get_broker, scope_event
+from .jobs import enqueue_notifications
+from .transfer import FORMATS, TaskImporter, export_csv, export_jsonl, guess_format, read_rows
+from .models import TaskCounter, TaskRecord
+from rest_framework.exceptions import (
+    APIException, AuthenticationFailed, NotAuthenticated, PermissionDenied, ValidationError,
+)
+from rest_framework.views import APIView
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from apps.users.permissions import TaskRolePermission, IsAdminUser #permissions
+from apps.users.authentication import CachedJWTAuthentication
+from apps.core.async_views import AsyncAPIViewMixin, aiterate
+from apps.core.conditional import etag_matches, make_etag, not_modified, set_validators
+from apps.core.db import ReplicaReadsMixin
+from apps.core.exceptions import ASGIRequired, PreconditionFailed
 
-from apps.users.permissions import TaskRolePermission #permissions
+User = get_user_model()
+
+# Signs the event stream tickets of TaskEventTicketView
+EVENT_TICKET_SALT = 'apps.tasks.events.ticket'
 
 
 # Create your views here.
-class TaskViewSet(viewsets.ModelViewSet):
+class TaskViewSet(ReplicaReadsMixin, viewsets.ModelViewSet):
     serializer_class = TaskSerializer
     permission_classes = [TaskRolePermission]
+    # Keyset pagination (?cursor=...), stable while new tasks are being created
+    pagination_class = TaskCursorPagination
+    # Rows fetched per round-trip when streaming an export (?stream=1)
+    stream_chunk_size = 500
+    # Upper bound on items per /bulk/ request
+    bulk_max_items = 1000
+    # Changes per /changes/ page (a bulk write is never split, so may exceed it)
+    changes_page_size = 500
+    # Aggregates the list ETag is computed from
+    list_state = {'last': Max('updated_at'), 'count': Count('pk')}
+    # Sparse fieldsets for lists, e.g. ?fields=id,title,status
+    fields_query_param = 'fields'
+    # Reads of these (GET) actions go to the read replica, see apps.core.db
+    replica_actions = ('list', 'retrieve')
+    # ?include_archived=1 lists/retrieves archived tasks too (read-only)
+    include_archived_param = 'include_archived'
+    archive_actions = ('list', 'retrieve')
 
     #1. Turn on the Filter, Search, and Ordering engines 
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    # Exact Match Filters (e.g., ?status=DONE)
-    filterset_fields = ['status', 'priority']
-    # Partial Match Search (e.g., ?search=meeting)
+    filter_backends = [DjangoFilterBackend, TaskSearchFilter, filters.OrderingFilter]
+    # Exact Match Filters (e.g., ?status=DONE) and ?overdue=true, see TaskFilter
+    # and filterset_class below
+    # Ranked full-text Search (e.g., ?search=meeting), see TaskSearchFilter
     search_fields = ['title', 'description']
-    #Sorting (e.g., ?ordering=-due_date)
-    ordering_fields = ['due_date', 'created_at']
-    ordering = ['-created_at']
+    #Sorting (e.g., ?ordering=-due_date). New ids are UUIDv7, so ?ordering=-id
+    #is creation order served by the primary key (older uuid4 rows sort randomly)
+    ordering_fields = ['due_date', 'created_at', 'id']
+    ordering = ['-created_at', '-id']
 
     # We don't need to explicitly define permission_classes = [IsAuthenticated] 
     # because we set it as the global default in base.py!
@@ -35,12 +92,421 @@ class TaskViewSet(viewsets.ModelViewSet):
         Admins can see all tasks.
         """
         user = self.request.user
+        # Assignee/creator names are JOINed in, not fetched once per task
+        tasks = (TaskRecord if self.include_archived() else Task).objects.with_people()
+        if getattr(self, 'lock_object', False):
+            tasks = tasks.select_for_update(of=('self',))
         if user.role=="ADMIN":
-            return Task.objects.all()
+            return tasks
         
         #standard users can view only task they are assigned to
-        return Task.objects.filter(assigned_to=user)
+        return tasks.filter(assigned_to=user)
     
+    def include_archived(self):
+        """
+        Read the view over live and archived tasks (TaskRecord) instead of
+        the task table; only for reads, archived tasks can't be changed.
+        """
+        return (
+            self.action in self.archive_actions
+            and self.request.query_params.get(self.include_archived_param) == '1'
+        )
+
+    @property
+    def filterset_class(self):
+        # django-filter insists on the queryset's own model
+        return TaskRecordFilter if self.include_archived() else TaskFilter
+
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get('stream') == '1':
+            return self.stream_list(request)
+
+        # Conditional GET: answer 304 before anything is serialized
+        etag = self.get_list_etag(request)
+        if etag_matches(request.headers.get('If-None-Match'), etag):
+            return not_modified(etag)
+
+        return set_validators(self.cached_list(request, etag), etag)
+
+    def get_list_etag(self, request):
+        """
+        Validator for the visible, filtered list: any insert, update or delete
+        changes either the newest updated_at or the row count.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        return self.make_list_etag(request, queryset.order_by().aggregate(**self.list_state))
+
+    def make_list_etag(self, request, state):
+        params = sorted((name, sorted(values)) for name, values in request.query_params.lists())
+        return make_etag(
+            request.user.pk, state['last'], state['count'], params,
+            # Tasks become overdue at midnight without being written to
+            timezone.localdate().isoformat(),
+            task_list_cache.users_version(), weak=True,
+        )
+
+    def get_object_etag(self, updated_at, pk):
+        return make_etag(
+            pk, updated_at.isoformat(), timezone.localdate().isoformat(),
+            task_list_cache.users_version(),
+        )
+
+    def cached_list(self, request, etag):
+        if not task_list_cache.enabled:
+            return self.list_page(request)
+
+        # The key is built before querying: if a task changes meanwhile, this
+        # response is stored under generations nobody will ask for again
+        cache_key = task_list_cache.key_for(request, etag)
+        data = task_list_cache.get(cache_key)
+        if data is not None:
+            response = Response(data)
+            response['X-Cache'] = 'HIT'
+            return response
+
+        response = self.list_page(request)
+        if response.status_code == status.HTTP_200_OK:
+            task_list_cache.set(cache_key, response.data)
+        response['X-Cache'] = 'MISS'
+        return response
+
+    def list_page(self, request):
+        """
+        One page of the list, read with values() and rendered by the
+        TaskValuesSerializer fast path (same output as TaskSerializer).
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        values = self.get_values_serializer()
+        page = self.paginate_queryset(self.select_page_values(values, queryset))
+        return self.get_paginated_response(values.render(page))
+
+    def get_values_serializer(self):
+        """
+        Renderer for the fields listed in ?fields= (all by default); columns
+        no requested field needs are never SELECTed.
+        """
+        raw = self.request.query_params.get(self.fields_query_param)
+        if raw is None:
+            return TaskValuesSerializer()
+        fields = [name.strip() for name in raw.split(',') if name.strip()]
+        unknown = [name for name in fields if name not in TaskSerializer.Meta.fields]
+        if not fields or unknown:
+            raise ValidationError({self.fields_query_param: [
+                f"Unknown field(s): {', '.join(unknown)}." if unknown else 'Select at least one field.'
+            ]})
+        return TaskValuesSerializer(fields)
+
+    def select_page_values(self, values, queryset):
+        # The next cursor is built from the last row's sort key and id
+        field, _ = self.paginator.get_ordering(self.request, queryset, self)
+        return values.select(queryset, extra=[field, 'id'])
+
+    def stream_list(self, request):
+        """
+        Export every visible task as NDJSON (one JSON object per line).
+        Rows are pulled with a server-side cursor in chunks, so the full
+        result set is never held in memory.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        values = self.get_values_serializer()
+        response = StreamingHttpResponse(self.stream_rows(values, queryset), content_type='application/x-ndjson')
+        response['Content-Disposition'] = 'attachment; filename="tasks.ndjson"'
+        return response
+
+    def stream_rows(self, values, queryset):
+        today = timezone.localdate()
+        for row in values.select(queryset).iterator(chunk_size=self.stream_chunk_size):
+            yield json.dumps(values.to_representation(row, today), cls=JSONEncoder) + '\n'
+
+    def stream_content(self, chunks):
+        """
+        The body of a StreamingHttpResponse built by a sync action.
+        """
+        return chunks
+
+    def retrieve(self, request, *args, **kwargs):
+        if request.headers.get('If-None-Match'):
+            # Only fetch updated_at to decide; the row is not loaded or serialized
+            lookup = {self.lookup_field: kwargs[self.lookup_url_kwarg or self.lookup_field]}
+            try:
+                current = self.get_queryset().filter(**lookup).values_list('updated_at', 'pk').first()
+            except (ValueError, DjangoValidationError):
+                current = None
+            if current is not None:
+                etag = self.get_object_etag(*current)
+                if etag_matches(request.headers['If-None-Match'], etag):
+                    return not_modified(etag)
+
+        instance = self.get_object()
+        response = Response(self.get_serializer(instance).data)
+        return set_validators(response, self.get_object_etag(instance.updated_at, instance.pk))
+
+    def update(self, request, *args, **kwargs):
+        """
+        PUT/PATCH. With an If-Match header the write only happens if the task
+        is unchanged since the client read it (optimistic concurrency), so two
+        admins editing the same task can't silently overwrite each other.
+        """
+        if_match = request.headers.get('If-Match')
+        if not if_match:
+            response = super().update(request, *args, **kwargs)
+        else:
+            with transaction.atomic():
+                # Lock the row so no write can land between our check and save
+                self.lock_object = True
+                instance = self.get_object()
+                if not etag_matches(if_match, self.get_object_etag(instance.updated_at, instance.pk), weak=False):
+                    raise PreconditionFailed()
+                response = super().update(request, *args, **kwargs)
+
+        instance = self.updated_instance
+        return set_validators(response, self.get_object_etag(instance.updated_at, instance.pk))
+
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        self.updated_instance = serializer.instance
+
+    @action(detail=False, methods=['post', 'patch', 'delete'], url_path='bulk')
+    def bulk(self, request):
+        """
+        Batch endpoints, one transaction and one write statement per call:
+        - POST   [{...task}, ...]              -> bulk_create
+        - PATCH  [{"id": ..., ...changes}, ...] -> UPDATE / bulk_update
+        - DELETE {"ids": [...]}                -> DELETE ... WHERE id IN (...)
+        Nothing is written unless every item is valid; errors are reported
+        per item index.
+        """
+        items = request.data
+        if request.method == 'DELETE':
+            items = items.get('ids') if isinstance(items, dict) else None
+        if not isinstance(items, list) or not items:
+            raise ValidationError({'detail': 'Expected a non-empty list.'})
+        if len(items) > self.bulk_max_items:
+            raise ValidationError({'detail': f'At most {self.bulk_max_items} items per request.'})
+
+        handler = {
+            'POST': self.bulk_create,
+            'PATCH': self.bulk_update,
+            'DELETE': self.bulk_destroy,
+        }[request.method]
+        with transaction.atomic():
+            return handler(request, items)
+
+    def get_bulk_serializer(self, items, instances=None):
+        """
+        Validate every item, resolving all referenced assignees in one query.
+        Returns the serializers, or raises with per-item errors.
+        """
+        user_ids = set()
+        for item in items:
+            try:
+                user_ids.add(uuid.UUID(str(item['assigned_to'])))
+            except (TypeError, KeyError, ValueError):
+                pass
+        context = self.get_serializer_context()
+        context['users'] = User.objects.in_bulk(user_ids)
+
+        serializers, errors = [], []
+        for index, item in enumerate(items):
+            instance = instances[index] if instances else None
+            serializer = BulkTaskSerializer(
+                instance, data=item, partial=instance is not None, context=context
+            )
+            if not serializer.is_valid():
+                errors.append({'index': index, 'errors': serializer.errors})
+            serializers.append(serializer)
+        if errors:
+            raise ValidationError({'items': errors})
+        return serializers
+
+    def get_bulk_instances(self, request, ids):
+        """
+        Load the targeted tasks with one query and run TaskRolePermission's
+        object checks on all of them before anything is written. Like the
+        single-task endpoints, a denied task fails the request with 403;
+        unknown ids are reported per item.
+        """
+        try:
+            pks = [uuid.UUID(str(pk)) for pk in ids]
+        except ValueError:
+            raise ValidationError({'detail': 'Every id must be a valid UUID.'})
+        if len(set(pks)) != len(pks):
+            raise ValidationError({'detail': 'Duplicate ids.'})
+
+        tasks = self.get_queryset().in_bulk(pks)
+        for task in tasks.values():
+            self.check_object_permissions(request, task)
+        errors = [
+            {'index': index, 'errors': {'id': ['Not found.']}}
+            for index, pk in enumerate(pks)
+            if pk not in tasks
+        ]
+        if errors:
+            raise ValidationError({'items': errors})
+        return [tasks[pk] for pk in pks]
+
+    def bulk_create(self, request, items):
+        if request.user.role != 'ADMIN':
+            raise PermissionDenied("Authorization restricted")
+
+        serializers = self.get_bulk_serializer(items)
+        # One change feed position for the whole write
+        seq = next_change_seq()
+        tasks = Task.objects.bulk_create([
+            Task(**serializer.validated_data, assigned_by=request.user, change_seq=seq)
+            for serializer in serializers
+        ])
+        self.after_bulk_write(tasks)
+        data = BulkTaskSerializer(tasks, many=True, context=self.get_serializer_context()).data
+        return Response(data, status=status.HTTP_201_CREATED)
+
+    def bulk_update(self, request, items):
+        if not all(isinstance(item, dict) for item in items):
+            raise ValidationError({'detail': 'Every item must be an object.'})
+        tasks = self.get_bulk_instances(request, [item.get('id') for item in items])
+        previous_keys = [counter_key(task) for task in tasks]
+        serializers = self.get_bulk_serializer(items, instances=tasks)
+
+        now, seq = timezone.now(), next_change_seq()
+        changes = [serializer.validated_data for serializer in serializers]
+        if all(change == changes[0] for change in changes):
+            # Same change everywhere (e.g. a status): UPDATE ... WHERE id IN (...)
+            Task.objects.filter(pk__in=[task.pk for task in tasks]).update(
+                **changes[0], updated_at=now, change_seq=seq
+            )
+            for task in tasks:
+                for field, value in changes[0].items():
+                    setattr(task, field, value)
+                task.updated_at, task.change_seq = now, seq
+        else:
+            fields = {'updated_at', 'change_seq'}
+            for task, change in zip(tasks, changes):
+                for field, value in change.items():
+                    setattr(task, field, value)
+                    fields.add(field)
+                task.updated_at, task.change_seq = now, seq
+            Task.objects.bulk_update(tasks, sorted(fields))
+
+        self.after_bulk_write(tasks, previous_keys)
+        return Response(BulkTaskSerializer(tasks, many=True, context=self.get_serializer_context()).data)
+
+    def bulk_destroy(self, request, ids):
+        tasks = self.get_bulk_instances(request, ids)
+        # QuerySet.delete() still sends post_delete per task, so the counters
+        # and caches are kept up to date by the signal handlers; their events
+        # go out together
+        with get_broker().batch():
+            deleted, _ = Task.objects.filter(pk__in=[task.pk for task in tasks]).delete()
+        return Response({'deleted': deleted})
+
+    def after_bulk_write(self, tasks, previous_keys=()):
+        """
+        bulk_create/bulk_update/update() skip model signals, so do their work
+        here: move the stats counters, invalidate the list caches, push the
+        changes to event stream subscribers, queue the notifications and
+        leave tombstones for the previous assignees of reassigned tasks.
+        """
+        new_keys = [counter_key(task) for task in tasks]
+        record_changes(before=previous_keys, after=new_keys)
+        record_removals([
+            (task, before[0], False) for task, before, after in zip(tasks, previous_keys, new_keys)
+            if before[0] != after[0]
+        ])
+        for task, key in zip(tasks, new_keys):
+            task._loaded_key = key
+
+        if previous_keys:
+            get_broker().publish_changes([('updated', task, key[0]) for task, key in zip(tasks, previous_keys)])
+        else:
+            get_broker().publish_changes([('created', task, None) for task in tasks])
+
+        enqueue_notifications(tasks, previous_keys)
+
+        assignees = {key[0] for key in new_keys} | {key[0] for key in previous_keys}
+        transaction.on_commit(lambda: task_list_cache.invalidate_assignees(*assignees))
+
+    @action(detail=False, methods=['get'])
+    def changes(self, request):
+        """
+        Delta sync: the tasks created or updated since `?since=<cursor>`, and
+        the ids of those deleted or reassigned away from the user. Without a
+        cursor, every visible task. Keep calling with the returned cursor
+        while `has_more`; store the last one for next time.
+        """
+        since = request.query_params.get('since')
+        values = self.get_values_serializer()
+        tasks, deleted, seq, has_more = read_changes(
+            values.select(self.get_queryset(), extra=['id']),
+            visible_tombstones(request.user),
+            decode_cursor(since) if since else None,
+            self.changes_page_size,
+        )
+        return Response({
+            'tasks': values.render(tasks),
+            'deleted': deleted,
+            'cursor': encode_cursor(seq),
+            'has_more': has_more,
+        })
+
+    @action(detail=False, methods=['post'], url_path='import', permission_classes=[IsAdminUser])
+    def import_tasks(self, request):
+        """
+        Admin import of a CSV or JSON lines `file` (multipart), see
+        transfer.TaskImporter. The format comes from the file name or
+        ?type=csv|jsonl. Nothing is imported if any row is invalid, unless
+        ?skip_invalid=1.
+        """
+        upload = request.FILES.get('file')
+        if upload is None:
+            raise ValidationError({'file': ['No file was submitted.']})
+        file_format = request.query_params.get('type') or guess_format(upload.name)
+        if file_format not in FORMATS:
+            raise ValidationError({'type': [f"Expected one of: {', '.join(FORMATS)}."]})
+
+        importer = TaskImporter(request.user, skip_invalid=request.query_params.get('skip_invalid') == '1')
+        importer.run(read_rows(upload.file, file_format))
+        return Response(
+            importer.result(),
+            status=status.HTTP_400_BAD_REQUEST if importer.failed else status.HTTP_201_CREATED,
+        )
+
+    @action(detail=False, methods=['get'], url_path='export', permission_classes=[IsAdminUser])
+    def export_tasks(self, request):
+        """
+        Admin export of the (filtered) task list as CSV, or JSON lines with
+        ?type=jsonl, streamed without holding it in memory.
+        """
+        file_format = request.query_params.get('type', 'csv')
+        if file_format not in FORMATS:
+            raise ValidationError({'type': [f"Expected one of: {', '.join(FORMATS)}."]})
+        queryset = self.filter_queryset(self.get_queryset())
+        if file_format == 'csv':
+            response = StreamingHttpResponse(self.stream_content(export_csv(queryset)), content_type='text/csv')
+        else:
+            response = StreamingHttpResponse(
+                self.stream_content(export_jsonl(queryset)), content_type='application/x-ndjson'
+            )
+        response['Content-Disposition'] = f'attachment; filename="tasks.{file_format}"'
+        return response
+
+    @action(detail=False, methods=['get'])
+    def stats(self, request):
+        """
+        Task counts by status, priority and overdue, served from the
+        incrementally maintained TaskCounter table. Admins get global totals
+        plus a per-assignee breakdown; users get their own.
+        """
+        if request.user.role == 'ADMIN':
+            return Response(summarize(TaskCounter.objects.all(), by_assignee=True))
+        return Response(summarize(TaskCounter.objects.filter(assigned_to=request.user)))
+
+    @action(detail=False, methods=['get'], url_path='cache-stats', permission_classes=[IsAdminUser])
+    def cache_stats(self, request):
+        """
+        Hit/miss counters of the task list cache, for admins.
+        """
+        return Response(task_list_cache.stats())
+
     def perform_create(self, serializer):
         if self.request.user.role != 'ADMIN':
         # Raising an exception correctly stops the process and returns an error to the client
@@ -48,4 +514,196 @@ class TaskViewSet(viewsets.ModelViewSet):
 
         serializer.save(assigned_by=self.request.user)
 
-    
\ No newline at end of file
+    
+
+
+class AsyncTaskViewSet(AsyncAPIViewMixin, TaskViewSet):
+    """
+    TaskViewSet with list, retrieve and partial_update on the async ORM, so
+    under config/asgi.py a worker keeps serving other requests while waiting
+    on the database. Everything else is inherited and runs in a thread.
+
+    Streaming bodies are async iterators: under ASGI, Django would otherwise
+    read a sync one into a list before sending the first byte.
+    """
+
+    async def stream_rows(self, values, queryset):
+        today = timezone.localdate()
+        async for row in values.select(queryset).aiterator(chunk_size=self.stream_chunk_size):
+            yield json.dumps(values.to_representation(row, today), cls=JSONEncoder) + '\n'
+
+    def stream_content(self, chunks):
+        # E.g. COPY ... TO STDOUT, which has no async API: chunk by chunk in a thread
+        return aiterate(chunks)
+
+    async def list(self, request, *args, **kwargs):
+        if request.query_params.get('stream') == '1':
+            return self.stream_list(request)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        state = await queryset.order_by().aaggregate(**self.list_state)
+        etag = await sync_to_async(self.make_list_etag)(request, state)
+        if etag_matches(request.headers.get('If-None-Match'), etag):
+            return not_modified(etag)
+
+        cache_key = None
+        if task_list_cache.enabled:
+            cache_key = await sync_to_async(task_list_cache.key_for)(request, etag)
+            data = await sync_to_async(task_list_cache.get)(cache_key)
+            if data is not None:
+                response = Response(data)
+                response['X-Cache'] = 'HIT'
+                return set_validators(response, etag)
+
+        values = self.get_values_serializer()
+        page = await self.paginator.apaginate_queryset(
+            self.select_page_values(values, queryset), request, view=self
+        )
+        response = self.paginator.get_paginated_response(values.render(page))
+        if cache_key is not None:
+            await sync_to_async(task_list_cache.set)(cache_key, response.data)
+            response['X-Cache'] = 'MISS'
+        return set_validators(response, etag)
+
+    async def retrieve(self, request, *args, **kwargs):
+        if request.headers.get('If-None-Match'):
+            lookup = {self.lookup_field: kwargs[self.lookup_url_kwarg or self.lookup_field]}
+            try:
+                current = await self.get_queryset().filter(**lookup).values_list('updated_at', 'pk').afirst()
+            except (ValueError, DjangoValidationError):
+                current = None
+            if current is not None:
+                etag = await sync_to_async(self.get_object_etag)(*current)
+                if etag_matches(request.headers['If-None-Match'], etag):
+                    return not_modified(etag)
+
+        instance = await self.aget_object()
+        return await self.object_response(instance)
+
+    async def partial_update(self, request, *args, **kwargs):
+        if request.headers.get('If-Match'):
+            # Check-then-write needs a transaction holding the row lock, which
+            # the async ORM can't span: use the sync path
+            return await sync_to_async(super().partial_update)(request, *args, **kwargs)
+
+        instance = await self.aget_object()
+        serializer = self.get_serializer(instance, data=request.data, partial=True)
+        # Validators may query (e.g. does the new assignee exist)
+        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        for field, value in serializer.validated_data.items():
+            setattr(instance, field, value)
+        await instance.asave()
+        return await self.object_response(instance)
+
+    async def aget_object(self):
+        """
+        Async get_object(): same lookup, 404 and object permission checks.
+        """
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset())
+        try:
+            instance = await queryset.aget(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        except (queryset.model.DoesNotExist, ValueError, DjangoValidationError):
+            raise Http404
+        self.check_object_permissions(self.request, instance)
+        return instance
+
+    async def object_response(self, instance):
+        response = Response(self.get_serializer(instance).data)
+        etag = await sync_to_async(self.get_object_etag)(instance.updated_at, instance.pk)
+        return set_validators(response, etag)
+
+
+class TaskEventTicketView(APIView):
+    """
+    POST: a ticket to open the event stream with (?ticket=). Browsers'
+    EventSource can't send the Authorization header, and an access token in
+    the URL would be written to every access log it passes.
+
+    The ticket is in the URL too, which is the tradeoff: it names the user,
+    is signed, expires after TASK_EVENTS_TICKET_SECONDS and is single-use
+    (across workers only with a shared cache; otherwise the expiry alone
+    limits a logged ticket).
+    """
+
+    def post(self, request):
+        ticket = signing.dumps({'user': str(request.user.pk), 'nonce': uuid.uuid4().hex}, salt=EVENT_TICKET_SALT)
+        return Response({'ticket': ticket, 'expires_in': settings.TASK_EVENTS_TICKET_SECONDS})
+
+
+def redeem_event_ticket(ticket):
+    """
+    The user id of a TaskEventTicketView ticket, which can't be used again.
+    """
+    max_age = settings.TASK_EVENTS_TICKET_SECONDS
+    try:
+        data = signing.loads(ticket, salt=EVENT_TICKET_SALT, max_age=max_age)
+    except signing.BadSignature:
+        raise AuthenticationFailed('Invalid or expired stream ticket.', code='invalid_ticket')
+    if not cache.add(f"tasks:events:ticket:{data['nonce']}", True, max_age):
+        raise AuthenticationFailed('Stream ticket already used.', code='invalid_ticket')
+    return data['user']
+
+
+def authenticate_event_stream(request):
+    """
+    Same JWT check as the API, or a ?ticket= from TaskEventTicketView for
+    EventSource clients.
+    """
+    authenticator = CachedJWTAuthentication()
+    header = authenticator.get_header(request)
+    if header:
+        raw_token = authenticator.get_raw_token(header)
+        if not raw_token:
+            raise NotAuthenticated()
+        return authenticator.get_user(authenticator.get_validated_token(raw_token))
+    ticket = request.GET.get('ticket')
+    if not ticket:
+        raise NotAuthenticated()
+    return authenticator.get_user({jwt_settings.USER_ID_CLAIM: redeem_event_ticket(ticket)})
+
+
+async def task_event_stream(request):
+    """
+    Server-Sent Events feed of task create/update/delete deltas, limited to
+    the tasks the user can see in TaskViewSet. Reconnecting clients send
+    `Last-Event-ID` and get what they missed; an `event: reset` means they
+    were away too long and should refetch the list once.
+
+    Async so an open stream holds no worker thread: serve it via config/asgi.py.
+    Under WSGI the never-ending stream would be collected into a list and pin
+    a worker for good, so it answers 501 there instead.
+    """
+    try:
+        if not isinstance(request, ASGIRequest):
+            raise ASGIRequired()
+        user = await sync_to_async(authenticate_event_stream)(request)
+    except APIException as exc:
+        return JsonResponse({
+            "success": False,
+            "error_type": exc.__class__.__name__,
+            "status_code": exc.status_code,
+            "message": {"detail": exc.detail},
+            "path": request.path,
+        }, status=exc.status_code)
+
+    last_id = request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+    last_id = int(last_id) if last_id and last_id.isdigit() else None
+
+    async def stream():
+        # Reconnect delay for the browser, in milliseconds
+        yield 'retry: 3000\n\n'
+        async for event in get_broker().subscribe(last_id):
+            if event is HEARTBEAT:
+                yield ': keep-alive\n\n'
+            elif event is RESET:
+                yield 'event: reset\ndata: {}\n\n'
+            elif (visible := scope_event(event, user)) is not None:
+                data = json.dumps(visible['task'], cls=JSONEncoder)
+                yield f"id: {event['id']}\nevent: {visible['type']}\ndata: {data}\n\n"
+
+    response = StreamingHttpResponse(stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Stop nginx from buffering the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
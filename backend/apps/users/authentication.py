@@ -0,0 +1,72 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+User = get_user_model()
+
+# The only user columns the API needs on every request
+STATE_FIELDS = ('role', 'is_active')
+
+
+def user_state_key(user_id):
+    return f'auth:user:{user_id}'
+
+
+def get_user_state(user_id):
+    """
+    Current role/is_active of a user, from a short-TTL cache. Only a cache
+    miss reads the users table; saves that touch these fields clear the entry
+    (see signals.py). Returns None for unknown users.
+
+    With AUTH_USER_STATE_CACHE_TIMEOUT = 0 (production without a shared
+    cache, where a save could only clear its own process's entry) every call
+    reads the table.
+    """
+    timeout = getattr(settings, 'AUTH_USER_STATE_CACHE_TIMEOUT', 60)
+    if timeout <= 0:
+        return User.objects.filter(pk=user_id).values(*STATE_FIELDS).first()
+
+    key = user_state_key(user_id)
+    state = cache.get(key)
+    if state is None:
+        state = User.objects.filter(pk=user_id).values(*STATE_FIELDS).first() or {}
+        cache.set(key, state, timeout)
+    return state or None
+
+
+def forget_user_state(user_id):
+    cache.delete(user_state_key(user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication without the per-request `SELECT ... FROM users_user`.
+
+    Only the token's `user_id` claim is trusted; the role and active flag come
+    from the cached user state (get_user_state), which saves clear, so
+    deactivations and role changes apply on the next request instead of at
+    token expiry.
+
+    `request.user` is a real `User` instance with only id/role/is_active
+    loaded; any other field is fetched lazily on first access.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken('Token contained no recognizable user identification') from e
+
+        state = get_user_state(user_id)
+        if state is None:
+            raise AuthenticationFailed('User not found', code='user_not_found')
+        if api_settings.CHECK_USER_IS_ACTIVE and not state['is_active']:
+            raise AuthenticationFailed('User is inactive', code='user_inactive')
+
+        loaded = {'id': User._meta.pk.to_python(user_id), **state}
+        field_names = [f.attname for f in User._meta.concrete_fields if f.attname in loaded]
+        return User.from_db(DEFAULT_DB_ALIAS, field_names, [loaded[name] for name in field_names])
@@ -0,0 +1,44 @@
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+class UserDirectoryCache:
+    """
+    The serialized user directory (GET /api/v1/users/), stored under a
+    version token that every User save/delete replaces (see signals.py).
+    Old versions are never deleted, just never asked for again; the version
+    doubles as the directory's ETag. Tokens are random rather than a counter,
+    so a flushed or evicted cache can't hand out a version again.
+    """
+    prefix = 'users:directory'
+
+    @property
+    def timeout(self):
+        return getattr(settings, 'USER_DIRECTORY_CACHE_TIMEOUT', 300)
+
+    @property
+    def enabled(self):
+        return bool(self.timeout)
+
+    def version(self):
+        key = f'{self.prefix}:version'
+        version = cache.get(key)
+        if version is None:
+            # Another request may create it first; use whichever won
+            cache.add(key, uuid.uuid4().hex, None)
+            version = cache.get(key)
+        return version
+
+    def get(self, version):
+        return cache.get(f'{self.prefix}:{version}')
+
+    def set(self, version, data):
+        cache.set(f'{self.prefix}:{version}', data, self.timeout)
+
+    def invalidate(self):
+        cache.set(f'{self.prefix}:version', uuid.uuid4().hex, None)
+
+
+user_directory_cache = UserDirectoryCache()
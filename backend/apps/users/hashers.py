@@ -0,0 +1,77 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher, make_password, verify_password
+from rest_framework.exceptions import Throttled
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id with the cost set in settings (PASSWORD_ARGON2_*). Hashes made
+    with other parameters are upgraded on the user's next login.
+    """
+
+    @property
+    def time_cost(self):
+        return settings.PASSWORD_ARGON2_TIME_COST
+
+    @property
+    def memory_cost(self):
+        return settings.PASSWORD_ARGON2_MEMORY_COST
+
+    @property
+    def parallelism(self):
+        return settings.PASSWORD_ARGON2_PARALLELISM
+
+
+class PasswordHashingBusy(Throttled):
+    default_detail = 'Too many logins in progress, please retry shortly.'
+
+
+class HashingPool:
+    """
+    Runs password hashing on a small, process-wide thread pool instead of
+    the request thread. The hashers release the GIL, so at most
+    PASSWORD_HASH_WORKERS cores hash at once and the rest stay free for the
+    task API. Callers beyond PASSWORD_HASH_QUEUE wait at most
+    PASSWORD_HASH_WAIT seconds for a slot, then get a 429 instead of piling
+    up behind a login storm.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.executor = None
+
+    def start(self):
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    settings.PASSWORD_HASH_WORKERS, thread_name_prefix='password-hash'
+                )
+                self.slots = threading.BoundedSemaphore(
+                    settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_QUEUE
+                )
+
+    def run(self, func, *args):
+        self.start()
+        if not self.slots.acquire(timeout=settings.PASSWORD_HASH_WAIT):
+            raise PasswordHashingBusy(wait=settings.PASSWORD_HASH_WAIT)
+        try:
+            return self.executor.submit(func, *args).result()
+        finally:
+            self.slots.release()
+
+
+hashing_pool = HashingPool()
+
+
+def hash_password(raw_password):
+    return hashing_pool.run(make_password, raw_password)
+
+
+def check_password_hash(raw_password, encoded):
+    """
+    Returns (is_correct, must_update), see django.contrib.auth.hashers.
+    """
+    return hashing_pool.run(verify_password, raw_password, encoded)
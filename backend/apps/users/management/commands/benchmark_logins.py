@@ -0,0 +1,62 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test.utils import override_settings
+from rest_framework.test import APIClient
+
+from apps.users.models import User
+
+HASHERS = {
+    # Django's default before Argon2 was made the preferred hasher
+    'pbkdf2': 'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'argon2-django': 'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'argon2-tuned': 'apps.users.hashers.TunedArgon2PasswordHasher',
+}
+PASSWORD = 'benchmark-password'
+
+
+class Command(BaseCommand):
+    help = (
+        "Log in through POST /api/v1/users/login/ with users whose passwords are "
+        "hashed by each hasher (PBKDF2 before, Argon2 after) and report logins/s and "
+        "logins/s per core (CPU time of the whole process, hashing threads included). "
+        "Users are rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--logins', type=int, default=50, help='Timed logins per hasher.')
+        parser.add_argument('--users', type=int, default=5)
+        parser.add_argument(
+            '--hashers', nargs='+', choices=sorted(HASHERS), default=list(HASHERS),
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{'hasher':<15} {'logins/s':>9} {'per core':>9} {'cpu ms':>8}")
+        for name in options['hashers']:
+            with override_settings(PASSWORD_HASHERS=[HASHERS[name]], ALLOWED_HOSTS=['testserver']):
+                with transaction.atomic():
+                    self.report(name, *self.run(name, options['users'], options['logins']))
+                    transaction.set_rollback(True)
+
+    def run(self, name, users, logins):
+        emails = [f'loginbench-{name}-{index}@example.com' for index in range(users)]
+        for email in emails:
+            User.objects.create_user(email=email, password=PASSWORD)
+
+        client = APIClient()
+        # Warm up (connection, URLconf, hasher imports)
+        client.post('/api/v1/users/login/', {'email': emails[0], 'password': PASSWORD})
+
+        wall, cpu = time.perf_counter(), time.process_time()
+        for index in range(logins):
+            response = client.post(
+                '/api/v1/users/login/', {'email': emails[index % users], 'password': PASSWORD}
+            )
+            assert response.status_code == 200, response.content
+        return logins, time.perf_counter() - wall, time.process_time() - cpu
+
+    def report(self, name, logins, wall, cpu):
+        self.stdout.write(
+            f'{name:<15} {logins / wall:9.1f} {logins / cpu:9.1f} {cpu / logins * 1000:8.1f}'
+        )
@@ -0,0 +1,36 @@
+# Generated by Django 6.0.2 on 2026-10-18 20:05
+
+from django.db import migrations
+
+# Prefix lookups (istartswith -> UPPER(col) LIKE 'ALI%') can only use a
+# B-tree index with text_pattern_ops under a non-C collation. PostgreSQL
+# only; other databases scan, which is fine for their sizes.
+SEARCH_FIELDS = ('email', 'first_name', 'last_name')
+
+
+def create_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for field in SEARCH_FIELDS:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS user_{field}_prefix_idx '
+            f'ON users_user (UPPER({field}::text) text_pattern_ops);'
+        )
+
+
+def drop_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for field in SEARCH_FIELDS:
+        schema_editor.execute(f'DROP INDEX IF EXISTS user_{field}_prefix_idx;')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
@@ -5,6 +5,7 @@ from django.contrib.auth.models import (
     PermissionsMixin
 )
 from apps.core.models import BaseModel
+from .hashers import check_password_hash, hash_password
 
 
 class UserManager(BaseUserManager):
@@ -67,5 +68,33 @@ class User(BaseModel, AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ['role']
 
+    class Meta:
+        indexes = [
+            # MAX(updated_at): the task ETags' user version without a shared
+            # cache, see TaskListCache.users_version()
+            models.Index(fields=['updated_at'], name='user_updated_at_idx'),
+        ]
+
+    @property
+    def display_name(self):
+        # "First Last", falling back to the email when both names are blank
+        full_name = f"{self.first_name or ''} {self.last_name or ''}".strip()
+        return full_name or self.email
+
+    def set_password(self, raw_password):
+        # Hashed on the bounded hashing pool, see hashers.HashingPool
+        self.password = hash_password(raw_password)
+        self._password = raw_password
+
+    def check_password(self, raw_password):
+        is_correct, must_update = check_password_hash(raw_password, self.password)
+        if is_correct and must_update:
+            # Older hasher or cost: upgrade to the preferred one transparently.
+            # Not a password change, so don't keep the raw password around
+            self.set_password(raw_password)
+            self._password = None
+            self.save(update_fields=['password'])
+        return is_correct
+
     def __str__(self):
         return self.email
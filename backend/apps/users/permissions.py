@@ -28,6 +28,7 @@ class TaskRolePermission(permissions.BasePermission):
         if request.method == "DELETE":
             return False
         
-        return obj.assigned_to == request.user
+        # Compare ids: never loads the assignee (safe in async views too)
+        return obj.assigned_to_id == request.user.pk
     
     
\ No newline at end of file
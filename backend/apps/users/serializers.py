@@ -3,6 +3,8 @@ from django.contrib.auth import get_user_model
 
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer #for JWT authentication and Login Serializer creation
 
+from apps.core.instrumentation import TimedListSerializer, TimedSerializerMixin
+
 User = get_user_model()
 
 class ResgistrationSerializer(serializers.ModelSerializer):
@@ -44,7 +46,8 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
 
         return data
     
-class UserListSerializer(serializers.ModelSerializer):
+class UserListSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = User
-        fields = ('id','first_name','last_name','email','role')
\ No newline at end of file
+        fields = ('id','first_name','last_name','email','role')
+        list_serializer_class = TimedListSerializer
\ No newline at end of file
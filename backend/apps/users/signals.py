@@ -0,0 +1,28 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import STATE_FIELDS, forget_user_state
+from .cache import user_directory_cache
+from .models import User
+from .serializers import UserListSerializer
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_state(sender, instance, update_fields=None, **kwargs):
+    # Authentication trusts the cached role/is_active, so drop it as soon as
+    # either changes (or might have: a full save() reports no update_fields)
+    if update_fields is None or set(update_fields) & set(STATE_FIELDS):
+        forget_user_state(instance.pk)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_directory(sender, instance, update_fields=None, **kwargs):
+    # Logins (last_login) and password rehashes don't change the directory
+    if update_fields is None or set(update_fields) & set(UserListSerializer.Meta.fields):
+        user_directory_cache.invalidate()
+        # Again once committed: a request between the save and the commit
+        # may have cached the old rows under the new version
+        transaction.on_commit(user_directory_cache.invalidate)
@@ -1,3 +1,221 @@
-from django.test import TestCase
+import threading
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .hashers import hashing_pool
+from .models import User
+from .views import AsyncUserListAPIView
+
+
+class CachedJWTAuthenticationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email='admin@example.com', password='password123', role=User.Role.ADMIN
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        response = self.client.post(
+            '/api/v1/users/login/', {'email': 'admin@example.com', 'password': 'password123'}
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+
+    def test_token_carries_no_user_state(self):
+        response = self.client.post(
+            '/api/v1/users/login/', {'email': 'admin@example.com', 'password': 'password123'}
+        )
+        token = AccessToken(response.data['access'])
+        self.assertEqual(token['user_id'], str(self.admin.pk))
+        self.assertNotIn('role', token)
+        self.assertNotIn('is_active', token)
+
+    def test_warm_requests_make_no_auth_queries(self):
+        self.client.get('/api/v1/tasks/cache-stats/')
+
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/v1/tasks/cache-stats/')
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(AUTH_USER_STATE_CACHE_TIMEOUT=0)
+    def test_user_state_is_read_every_request_without_a_cache_timeout(self):
+        self.client.get('/api/v1/tasks/cache-stats/')
+
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/v1/tasks/cache-stats/')
+        self.assertEqual(response.status_code, 200)
+
+        # Saved elsewhere, no cache entry cleared
+        User.objects.filter(pk=self.admin.pk).update(is_active=False)
+        self.assertEqual(self.client.get('/api/v1/tasks/cache-stats/').status_code, 401)
+
+    def test_deactivation_applies_immediately(self):
+        self.client.get('/api/v1/tasks/cache-stats/')
+
+        self.admin.is_active = False
+        self.admin.save(update_fields=['is_active'])
+
+        self.assertEqual(self.client.get('/api/v1/tasks/cache-stats/').status_code, 401)
+
+    def test_role_change_applies_immediately(self):
+        self.client.get('/api/v1/tasks/cache-stats/')
+
+        self.admin.role = User.Role.USER
+        self.admin.save()
+
+        self.assertEqual(self.client.get('/api/v1/tasks/cache-stats/').status_code, 403)
+
+
+class AsyncUserListTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email='admin@example.com', password='password123', role=User.Role.ADMIN
+        )
+        User.objects.create_user(email='alice@example.com', password='password123')
+
+    async def test_lists_users(self):
+        request = APIRequestFactory().get('/api/v1/users/')
+        force_authenticate(request, user=self.admin)
+
+        response = await AsyncUserListAPIView.as_view()(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            sorted(user['email'] for user in response.data), ['admin@example.com', 'alice@example.com']
+        )
+
+    async def test_requires_authentication(self):
+        response = await AsyncUserListAPIView.as_view()(APIRequestFactory().get('/api/v1/users/'))
+        self.assertEqual(response.status_code, 401)
+
+
+class PasswordHashingTests(TestCase):
+    hashers = [
+        'apps.users.hashers.TunedArgon2PasswordHasher',
+        'django.contrib.auth.hashers.MD5PasswordHasher',
+    ]
+
+    def login(self, password='password123'):
+        return APIClient().post(
+            '/api/v1/users/login/', {'email': 'user@example.com', 'password': password}
+        )
+
+    def test_new_passwords_use_tuned_argon2(self):
+        with override_settings(PASSWORD_HASHERS=self.hashers, PASSWORD_ARGON2_TIME_COST=1,
+                               PASSWORD_ARGON2_MEMORY_COST=1024):
+            user = User.objects.create_user(email='user@example.com', password='password123')
+        self.assertTrue(user.password.startswith('argon2$argon2id$v=19$m=1024,t=1,p=1$'))
+
+    def test_login_rehashes_older_hashes(self):
+        # Created under an older hasher
+        with override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher']):
+            user = User.objects.create_user(email='user@example.com', password='password123')
+        self.assertTrue(user.password.startswith('md5$'))
+
+        with override_settings(PASSWORD_HASHERS=self.hashers, PASSWORD_ARGON2_TIME_COST=1,
+                               PASSWORD_ARGON2_MEMORY_COST=1024):
+            self.assertEqual(self.login('wrong-password').status_code, 401)
+            user.refresh_from_db()
+            self.assertTrue(user.password.startswith('md5$'))
+
+            self.assertEqual(self.login().status_code, 200)
+            user.refresh_from_db()
+            self.assertTrue(user.password.startswith('argon2$'))
+            self.assertEqual(self.login().status_code, 200)
+
+    def test_saturated_hashing_pool_returns_429(self):
+        User.objects.create_user(email='user@example.com', password='password123')
+        hashing_pool.start()
+        busy = threading.BoundedSemaphore(1)
+        busy.acquire()
+
+        with mock.patch.object(hashing_pool, 'slots', busy), override_settings(PASSWORD_HASH_WAIT=0.01):
+            response = self.login()
+
+        self.assertEqual(response.status_code, 429)
+        self.assertIn('Retry-After', response)
+        self.assertEqual(self.login().status_code, 200)
+
+
+class UserDirectoryTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email='admin@example.com', password='password123', role=User.Role.ADMIN
+        )
+        User.objects.create_user(email='alice@example.com', password='password123', first_name='Alice', last_name='Smith')
+        User.objects.create_user(email='bob@example.com', password='password123', first_name='Bob', last_name='Alison')
+        User.objects.create_user(email='carol@example.com', password='password123', first_name='Carol', last_name='Jones')
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def emails(self, response):
+        return sorted(user['email'] for user in response.data)
+
+    def test_typeahead_prefix_search(self):
+        self.assertEqual(
+            self.emails(self.client.get('/api/v1/users/', {'search': 'ali'})),
+            ['alice@example.com', 'bob@example.com'],
+        )
+        self.assertEqual(
+            self.emails(self.client.get('/api/v1/users/', {'search': 'ali smi'})), ['alice@example.com']
+        )
+        # Prefixes only
+        self.assertEqual(self.client.get('/api/v1/users/', {'search': 'lice'}).data, [])
+        self.assertEqual(len(self.client.get('/api/v1/users/', {'search': 'a', 'limit': 1}).data), 1)
+
+    def test_directory_is_cached_with_an_etag(self):
+        first = self.client.get('/api/v1/users/')
+        self.assertEqual(len(first.data), 4)
+
+        with self.assertNumQueries(0):
+            again = self.client.get('/api/v1/users/', HTTP_IF_NONE_MATCH=first['ETag'])
+            cached = self.client.get('/api/v1/users/')
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(cached.data, first.data)
+
+    def test_user_changes_invalidate_the_directory(self):
+        first = self.client.get('/api/v1/users/')
+
+        # Logins don't
+        self.client.post('/api/v1/users/login/', {'email': 'alice@example.com', 'password': 'password123'})
+        self.assertEqual(self.client.get('/api/v1/users/', HTTP_IF_NONE_MATCH=first['ETag']).status_code, 304)
+
+        carol = User.objects.get(email='carol@example.com')
+        carol.first_name = 'Caroline'
+        carol.save()
+
+        response = self.client.get('/api/v1/users/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Caroline', [user['first_name'] for user in response.data])
+
+    def test_a_flushed_cache_never_reuses_an_etag(self):
+        first = self.client.get('/api/v1/users/')
+        cache.clear()
+        User.objects.create_user(email='dave@example.com', password='password123')
+        cache.clear()
+
+        response = self.client.get('/api/v1/users/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 5)
+
+    @override_settings(USER_DIRECTORY_CACHE_TIMEOUT=0)
+    def test_directory_is_not_cached_when_disabled(self):
+        self.client.get('/api/v1/users/')
+        User.objects.filter(email='carol@example.com').update(first_name='Caroline')
+
+        response = self.client.get('/api/v1/users/')
+        self.assertFalse(response.has_header('ETag'))
+        self.assertIn('Caroline', [user['first_name'] for user in response.data])
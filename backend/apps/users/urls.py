@@ -1,5 +1,6 @@
+from django.conf import settings
 from django.urls import path
-from .views import RegisterView,LoginView,UserListAPIView
+from .views import RegisterView,LoginView,UserListAPIView,AsyncUserListAPIView
 from rest_framework_simplejwt.views import TokenRefreshView #for JWT refresh token
 
 app_name = 'users'
@@ -10,5 +11,5 @@ urlpatterns = [
     #for Login
     path('login/', LoginView.as_view(), name='login'),
     path('login/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
-    path('', UserListAPIView.as_view(), name='user-list'),
+    path('', (AsyncUserListAPIView if settings.ASYNC_API_VIEWS else UserListAPIView).as_view(), name='user-list'),
 ]
\ No newline at end of file
@@ -4,6 +4,14 @@ from rest_framework.permissions import AllowAny
 from django.contrib.auth import get_user_model
 from rest_framework.permissions import IsAuthenticated
 
+from asgiref.sync import sync_to_async
+from django.db.models import Q
+
+from apps.core.async_views import AsyncAPIViewMixin
+from apps.core.conditional import etag_matches, make_etag, not_modified, set_validators
+from apps.core.db import ReplicaReadsMixin, primary_reads
+from .cache import user_directory_cache
+
 #for registration
 from .serializers import ResgistrationSerializer
 
@@ -46,11 +54,83 @@ class LoginView(TokenObtainPairView):
     """
     serializer_class = CustomTokenObtainPairSerializer
 
-class UserListAPIView(generics.ListAPIView):
+class UserListAPIView(ReplicaReadsMixin, generics.ListAPIView):
     """
     API endpoint that allows admins to view all users 
     so they can populate the 'Assign To' dropdown.
+
+    - Without parameters: the whole directory, served from a versioned cache
+      with an ETag (a dropdown re-opened with If-None-Match gets a 304).
+    - ?search=ali: typeahead, the first ?limit= (default 20, at most 50)
+      users whose email, first or last name start with every word typed.
+
+    Typeahead reads the read replica; the cached directory is rebuilt from
+    the primary.
     """
     queryset = User.objects.all()
     serializer_class = UserListSerializer
-    permission_classes = [IsAuthenticated] # Ensure only logged-in users can see this list
\ No newline at end of file
+    permission_classes = [IsAuthenticated] # Ensure only logged-in users can see this list
+    search_query_param = 'search'
+    search_fields = ('email', 'first_name', 'last_name')
+    search_limit = 20
+    max_search_limit = 50
+
+    def list(self, request, *args, **kwargs):
+        if self.get_search_words(request):
+            return Response(self.get_serializer(self.search_queryset(request), many=True).data)
+        return self.directory_response(request)
+
+    def get_search_words(self, request):
+        return request.query_params.get(self.search_query_param, '').split()
+
+    def get_search_limit(self, request):
+        try:
+            limit = int(request.query_params['limit'])
+        except (KeyError, ValueError):
+            return self.search_limit
+        return min(max(limit, 1), self.max_search_limit)
+
+    def search_queryset(self, request):
+        """
+        Prefix matches only (UPPER(col) LIKE 'ALI%'), so the text_pattern_ops
+        indexes of migration 0002 serve them.
+        """
+        queryset = self.get_queryset()
+        for word in self.get_search_words(request):
+            matches = Q()
+            for field in self.search_fields:
+                matches |= Q(**{f'{field}__istartswith': word})
+            queryset = queryset.filter(matches)
+        return queryset.order_by('first_name', 'last_name', 'email')[:self.get_search_limit(request)]
+
+    def directory_response(self, request):
+        if not user_directory_cache.enabled:
+            return Response(self.get_serializer(self.get_queryset().order_by('email'), many=True).data)
+
+        # Read the version before the users: a save landing in between bumps
+        # it, so whatever we store is never served as the newer version
+        version = user_directory_cache.version()
+        etag = make_etag('users', version, weak=True)
+        if etag_matches(request.headers.get('If-None-Match'), etag):
+            return not_modified(etag)
+
+        data = user_directory_cache.get(version)
+        if data is None:
+            # From the primary: a lagging replica would be cached as this version
+            with primary_reads():
+                data = self.get_serializer(self.get_queryset().order_by('email'), many=True).data
+            user_directory_cache.set(version, data)
+        return set_validators(Response(data), etag)
+
+
+class AsyncUserListAPIView(AsyncAPIViewMixin, UserListAPIView):
+    """
+    UserListAPIView on the async ORM, served under config/asgi.py.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        if not self.get_search_words(request):
+            # Cache lookups (and a rare rebuild) in a thread
+            return await sync_to_async(self.directory_response)(request)
+        users = [user async for user in self.search_queryset(request).aiterator()]
+        return Response(self.get_serializer(users, many=True).data)
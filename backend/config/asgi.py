@@ -5,6 +5,10 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
+
+The task event stream (/api/v1/tasks/events/) and the async API views need
+this entry point, e.g.
+    uvicorn config.asgi:application --workers 4
 """
 
 import os
@@ -12,5 +16,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+# Serve the hot read/patch endpoints from their async views (see base.py)
+os.environ.setdefault('ASYNC_API_VIEWS', 'True')
 
 application = get_asgi_application()
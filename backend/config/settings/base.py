@@ -32,6 +32,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     # Libraries 
     'rest_framework',
     'drf_spectacular',
@@ -44,12 +45,18 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # First, so its timings cover every other middleware
+    'apps.core.instrumentation.RequestMetricsMiddleware',
+    # Right after it: the metrics count bytes on the wire
+    'apps.core.compression.CompressionMiddleware',
     "corsheaders.middleware.CorsMiddleware", # CORS middleware must be high up
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    # Keeps users who just wrote on the primary database, see apps.core.db
+    'apps.core.db.ReplicaStickinessMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -84,11 +91,23 @@ AUTH_PASSWORD_VALIDATORS = [
 # Django REST Framework Configuration
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.users.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    # orjson first (the default), MessagePack on request (Accept/?format=msgpack)
+    'DEFAULT_RENDERER_CLASSES': (
+        'apps.core.renderers.ORJSONRenderer',
+        'apps.core.renderers.MessagePackRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'apps.core.renderers.ORJSONParser',
+        'apps.core.renderers.MessagePackParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'EXCEPTION_HANDLER': 'apps.core.exceptions.custom_api_exception_handler',
 }
@@ -99,6 +118,162 @@ SIMPLE_JWT = {
        'REFRESH_TOKEN_LIFETIME': timedelta(days=1)
 }
 
+# Response compression (apps.core.compression): smallest body worth
+# compressing, and the levels used (brotli 4 / gzip 6 are fast enough for
+# per-request compression)
+COMPRESSION_MIN_BYTES = int(os.getenv('COMPRESSION_MIN_BYTES', '1024'))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv('COMPRESSION_BROTLI_QUALITY', '4'))
+COMPRESSION_GZIP_LEVEL = int(os.getenv('COMPRESSION_GZIP_LEVEL', '6'))
+
+# DATABASE_URL query parameters that size psycopg's connection pool instead
+# of being passed to libpq, e.g. ?sslmode=require&pool_max_size=10&pool_timeout=5
+DATABASE_POOL_PARAMS = {
+    'pool_min_size': ('min_size', int),
+    'pool_max_size': ('max_size', int),
+    # Seconds a request waits for a free connection before failing
+    'pool_timeout': ('timeout', float),
+    # Seconds before idle connections above min_size are closed
+    'pool_max_idle': ('max_idle', float),
+    # Seconds before a connection is replaced, however busy
+    'pool_max_lifetime': ('max_lifetime', float),
+}
+
+
+def database_pool(options):
+    """
+    Pop the pool_* parameters out of a DATABASE_URL's query `options` and
+    return the settings for OPTIONS["pool"], or False for ?pool=off.
+    Requires psycopg 3 with psycopg_pool.
+    """
+    enabled = options.pop('pool', 'on') != 'off'
+    pool = {'min_size': 2, 'max_size': 10, 'timeout': 10}
+    for param, (name, cast) in DATABASE_POOL_PARAMS.items():
+        if param in options:
+            pool[name] = cast(options.pop(param))
+    return pool if enabled else False
+
+
+# Alias of a read replica that safe reads of the busiest endpoints (task
+# list/retrieve, user list) go to, see apps.core.db. None reads everything
+# from `default`; prod.py sets it when REPLICA_DATABASE_URL is given
+DATABASE_ROUTERS = ['apps.core.db.ReplicaRouter']
+READ_REPLICA = None
+# Seconds a user keeps reading from the primary after their own write, so
+# replication lag never hides it from them
+REPLICA_STICKY_SECONDS = int(os.getenv('REPLICA_STICKY_SECONDS', '5'))
+
+
+# Per-process cache by default (and in tests). Production swaps in a shared
+# backend, see prod.py
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+# Whether every process serving requests sees the same default cache (one
+# process in development and tests). prod.py turns it off without REDIS_URL;
+# state that must agree across workers (ETag versions, read-your-writes
+# pins, revocations) then isn't kept there
+SHARED_CACHE = True
+
+# Argon2 first: new passwords use it, and older (PBKDF2) hashes are
+# rehashed on the user's next successful login
+PASSWORD_HASHERS = [
+    'apps.users.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+# Argon2id cost: 19 MiB, 2 passes, 1 lane (OWASP's minimum recommendation),
+# a few ms of one core per login
+PASSWORD_ARGON2_TIME_COST = int(os.getenv('PASSWORD_ARGON2_TIME_COST', '2'))
+PASSWORD_ARGON2_MEMORY_COST = int(os.getenv('PASSWORD_ARGON2_MEMORY_COST', '19456'))  # KiB
+PASSWORD_ARGON2_PARALLELISM = int(os.getenv('PASSWORD_ARGON2_PARALLELISM', '1'))
+
+# Password hashing pool per process: threads hashing at once, extra logins
+# allowed to queue, and seconds a login waits for a slot before a 429
+PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', '2'))
+PASSWORD_HASH_QUEUE = int(os.getenv('PASSWORD_HASH_QUEUE', '16'))
+PASSWORD_HASH_WAIT = float(os.getenv('PASSWORD_HASH_WAIT', '2'))
+
+# Background jobs (apps.core.jobs, `manage.py runworker`): attempts before a
+# job is dead-lettered, backoff between retries (doubling from
+# JOB_RETRY_DELAY up to JOB_RETRY_MAX_DELAY seconds), and how long a RUNNING
+# job may stay locked before it is assumed lost and claimed again
+JOB_MAX_ATTEMPTS = int(os.getenv('JOB_MAX_ATTEMPTS', '5'))
+JOB_RETRY_DELAY = float(os.getenv('JOB_RETRY_DELAY', '10'))
+JOB_RETRY_MAX_DELAY = float(os.getenv('JOB_RETRY_MAX_DELAY', '3600'))
+JOB_LOCK_TIMEOUT = int(os.getenv('JOB_LOCK_TIMEOUT', '600'))
+
+# Task notifications are sent by background jobs; printed to the console
+# unless an SMTP backend is configured
+EMAIL_BACKEND = os.getenv('EMAIL_BACKEND', 'django.core.mail.backends.console.EmailBackend')
+DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL', 'tasks@localhost')
+
+# Seconds an authenticated user's role/is_active may be served from cache
+AUTH_USER_STATE_CACHE_TIMEOUT = int(os.getenv('AUTH_USER_STATE_CACHE_TIMEOUT', '60'))
+
+# Seconds a version of the user directory (GET /api/v1/users/) stays cached;
+# any user change switches to a new version immediately (0 disables the cache)
+USER_DIRECTORY_CACHE_TIMEOUT = int(os.getenv('USER_DIRECTORY_CACHE_TIMEOUT', '300'))
+
+# Seconds a cached task list response stays valid (0 disables the cache)
+TASK_LIST_CACHE_TIMEOUT = int(os.getenv('TASK_LIST_CACHE_TIMEOUT', '60'))
+
+# Delta sync (/api/v1/tasks/changes/): seconds a write may take to commit,
+# changes this recent are sent again on the next sync; and days tombstones
+# of deleted tasks are kept (older cursors must resync from scratch)
+TASK_CHANGES_LOOKBACK = int(os.getenv('TASK_CHANGES_LOOKBACK', '60'))
+TASK_TOMBSTONE_RETENTION_DAYS = int(os.getenv('TASK_TOMBSTONE_RETENTION_DAYS', '30'))
+
+# Completed tasks untouched for this many days are moved to the archive
+# table by `manage.py archive_tasks` (listed with ?include_archived=1)
+TASK_ARCHIVE_AFTER_DAYS = int(os.getenv('TASK_ARCHIVE_AFTER_DAYS', '90'))
+
+# Route task list/retrieve/partial_update and the user list to their async
+# views. Only pays off under an ASGI server, so config/asgi.py turns it on
+ASYNC_API_VIEWS = os.getenv('ASYNC_API_VIEWS', 'False') == 'True'
+
+# Pub/sub behind /api/v1/tasks/events/. The default only reaches clients
+# connected to the same process, see apps/tasks/events.py
+TASK_EVENTS_BROKER = 'apps.tasks.events.TaskEventBroker'
+
+# Seconds a ticket from /api/v1/tasks/events/ticket/ can open the stream
+TASK_EVENTS_TICKET_SECONDS = int(os.getenv('TASK_EVENTS_TICKET_SECONDS', '30'))
+
+# Queries slower than this (milliseconds) are logged with their fingerprint
+SLOW_QUERY_MS = int(os.getenv('SLOW_QUERY_MS', '200'))
+
+# Bearer token required by /metrics. When unset the endpoint is open, unless
+# METRICS_REQUIRE_TOKEN (on in production) turns it off instead
+METRICS_TOKEN = os.getenv('METRICS_TOKEN')
+METRICS_REQUIRE_TOKEN = False
+
+# One JSON line per request on apps.core.requests (INFO, shown when
+# REQUEST_LOG_LEVEL=INFO) and per slow query on apps.core.slow_queries
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'apps.core.requests': {
+            'handlers': ['console'],
+            'level': os.getenv('REQUEST_LOG_LEVEL', 'WARNING'),
+            'propagate': False,
+        },
+        'apps.core.slow_queries': {
+            'handlers': ['console'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
+    },
+}
+
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'Asia/Kolkata'
 USE_I18N = True
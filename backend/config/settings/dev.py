@@ -15,5 +15,14 @@ DATABASES = {
         'PASSWORD': os.getenv("DATABASE_PASSWORD"),
         'HOST': os.getenv("DATABASE_HOST"),
         'PORT': os.getenv("DATABASE_PORT", "5432"),
+        # Reuse connections across requests, checking them before reuse
+        'CONN_MAX_AGE': int(os.getenv('CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': True,
     }
-}
\ No newline at end of file
+}
+
+# Optional second local database standing in for a read replica. Nothing
+# replicates into it, so READ_REPLICA stays off; the routing tests in
+# apps/core/tests.py use it to tell which database a read went to.
+if os.getenv('DATABASE_REPLICA_NAME'):
+    DATABASES['replica'] = {**DATABASES['default'], 'NAME': os.getenv('DATABASE_REPLICA_NAME')}
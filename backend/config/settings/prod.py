@@ -17,20 +17,80 @@ cors_env = os.getenv('CORS_ALLOWED_ORIGINS', '')
 CORS_ALLOWED_ORIGINS = [origin.strip() for origin in cors_env.split(',') if origin.strip()]
 
 # Neon PostgreSQL Database Connection
-tmpPostgres = urlparse(os.getenv("DATABASE_URL"))
-
-DATABASES = {
-    'default': {
+def database_settings(url):
+    """
+    DATABASES entry for a postgres:// URL, its query string passed to libpq.
+    """
+    parsed = urlparse(url)
+    options = dict(parse_qsl(parsed.query))
+    # Pooled by default: each worker keeps a few warm TLS connections instead of
+    # opening one per request (see database_pool() in base.py)
+    pool = database_pool(options)
+    if pool:
+        options['pool'] = pool
+    return {
         'ENGINE': 'django.db.backends.postgresql',
-        'NAME': tmpPostgres.path.replace('/', ''),
-        'USER': tmpPostgres.username,
-        'PASSWORD': tmpPostgres.password,
-        'HOST': tmpPostgres.hostname,
+        'NAME': parsed.path.replace('/', ''),
+        'USER': parsed.username,
+        'PASSWORD': parsed.password,
+        'HOST': parsed.hostname,
         'PORT': 5432,
-        'OPTIONS': dict(parse_qsl(tmpPostgres.query)),
+        'OPTIONS': options,
+        # The pool manages connection lifetime itself; with ?pool=off keep
+        # connections open across requests instead
+        'CONN_MAX_AGE': 0 if pool else int(os.getenv('CONN_MAX_AGE', '60')),
+        # Ping reused connections first (with a pool: on checkout), since the
+        # server drops idle ones, e.g. when Neon suspends the compute
+        'CONN_HEALTH_CHECKS': True,
     }
+
+
+DATABASES = {
+    'default': database_settings(os.getenv("DATABASE_URL")),
 }
 
+# Optional read replica (e.g. a Neon read replica endpoint): safe reads of
+# the task and user lists go there, see apps.core.db. In tests it is the
+# default database under another name. Used only with a shared cache (below),
+# which holds the pins that send a user who just wrote back to the primary.
+REPLICA_DATABASE_URL = os.getenv('REPLICA_DATABASE_URL')
+if REPLICA_DATABASE_URL:
+    DATABASES['replica'] = {**database_settings(REPLICA_DATABASE_URL), 'TEST': {'MIRROR': 'default'}}
+
+# Shared cache so every gunicorn worker sees the same task list generations.
+# Without one, each worker would keep its own (stale) copy, so the task list
+# cache is switched off instead.
+REDIS_URL = os.getenv('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    SHARED_CACHE = False
+    TASK_LIST_CACHE_TIMEOUT = 0
+    USER_DIRECTORY_CACHE_TIMEOUT = 0
+    # A save could only clear the cached role/is_active of its own worker
+    AUTH_USER_STATE_CACHE_TIMEOUT = 0
+
+if REPLICA_DATABASE_URL and SHARED_CACHE:
+    READ_REPLICA = 'replica'
+
+# Route names and traffic are not public: /metrics answers 404 unless
+# METRICS_TOKEN is set. Its counters are per process: set METRICS_TOKEN only
+# where one worker process serves the app (e.g. gunicorn --workers 1
+# --threads N), otherwise scrapes of different workers look like resets
+METRICS_REQUIRE_TOKEN = True
+
+# Log every request in production
+LOGGING['loggers']['apps.core.requests']['level'] = os.getenv('REQUEST_LOG_LEVEL', 'INFO')
+
+# Task events must reach streams held open by any worker: fan out through
+# PostgreSQL LISTEN/NOTIFY
+TASK_EVENTS_BROKER = 'apps.tasks.events.PostgresNotifyBroker'
+
 # ==========================================
 # SECURITY SETTINGS (Essential for Production)
 # ==========================================
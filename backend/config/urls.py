@@ -18,12 +18,18 @@ from django.contrib import admin
 from django.urls import path, include
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
+from apps.core.views import metrics
+
 urlpatterns = [
     path('admin/', admin.site.urls),
 
     # API Version 1
     path('api/v1/users/', include('apps.users.urls')),
     path('api/v1/tasks/', include('apps.tasks.urls')),
+    # Operational endpoints (admins only)
+    path('api/v1/internal/', include('apps.core.urls')),
+    # Prometheus scrape target
+    path('metrics', metrics, name='metrics'),
 
     # API Schema & Documentation
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
@@ -20,7 +20,9 @@ const TaskForm = ({task, onClose, onSuccess }) => {
     useEffect(() => {
         const fetchUsers = async () => {
             try {
-                const response = await api.get("/api/v1/users");
+                // Trailing slash: no redirect, and the browser revalidates
+                // its cached copy with the directory's ETag (usually a 304)
+                const response = await api.get("/api/v1/users/");
                 setUsers(response.data.results || response.data);
             } catch (err) {
                 console.error("Failed to fetch users for the dropdown:", err);